@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compares the construction time of the widget tree built by
+qwelcomewindow.ui with the code generated from widget.ui by the bindings ui
+compiler (compiled on the fly, for the current bindings).
+"""
+import io
+import os
+import subprocess
+from common import get_app, measure, report
+from qwelcomewindow.qt import package
+
+#: number of widget trees built per measurement
+COUNT = 50
+
+UI_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))), "qwelcomewindow", "widget.ui")
+
+
+def compile_ui():
+    """
+    Compiles widget.ui with the ui compiler of the current bindings and
+    returns the generated Ui_Form class.
+    """
+    api = os.environ["QT_API"]
+    if api in ("pyside2", "pyside6"):
+        # the ui compiler is a separate executable
+        try:
+            code = subprocess.check_output(["%s-uic" % api, UI_FILE],
+                                           universal_newlines=True)
+        except OSError as e:
+            raise ImportError(str(e))
+    else:
+        if api == "pyside":
+            import pysideuic as uic
+        else:
+            uic = __import__(package() + ".uic", fromlist=["uic"])
+        source = io.StringIO() if str is not bytes else io.BytesIO()
+        with open(UI_FILE) as f:
+            uic.compileUi(f, source)
+        code = source.getvalue()
+    namespace = {}
+    exec(code, namespace)
+    return namespace["Ui_Form"]
+
+
+def main():
+    app = get_app()
+    from qwelcomewindow.qt import QtGui
+    from qwelcomewindow.ui import Ui_Form
+
+    def build(ui_class):
+        def func():
+            for i in range(COUNT):
+                widget = QtGui.QWidget()
+                ui_class().setupUi(widget)
+        return func
+
+    results = {"count": COUNT, "builder": measure(build(Ui_Form))}
+    try:
+        generated = compile_ui()
+    except ImportError as e:
+        results["generated"] = "ui compiler not available: %s" % e
+    else:
+        results["generated"] = measure(build(generated))
+    report("construction", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Compares per-item insertion (add_action) with batched insertion
+(add_actions, replace_recent_actions) of recent actions.
+"""
+from common import SIZES, get_app, measure, report
+
+
+def main():
+    app = get_app()
+    from qwelcomewindow import QWelcomeWidget
+    from qwelcomewindow.qt import QtGui
+    recent = QWelcomeWidget.ActionType.Recent
+    icon = app.style().standardIcon(QtGui.QStyle.SP_FileIcon)
+
+    def actions(count):
+        return [("File%06d.xyz" % i, icon, "/path/to/File%06d.xyz" % i)
+                for i in range(count)]
+
+    def per_item(args):
+        widget, entries = args
+        for text, action_icon, data in entries:
+            widget.add_action(recent, text, action_icon, data)
+
+    def batched(args):
+        widget, entries = args
+        widget.add_actions(recent, entries)
+
+    def replaced(args):
+        widget, entries = args
+        widget.replace_recent_actions(entries)
+
+    results = {}
+    for count in SIZES:
+        entries = actions(count)
+
+        def setup():
+            widget = QWelcomeWidget(app_name="Benchmark")
+            widget.show()
+            app.processEvents()
+            return widget, entries
+
+        results[count] = {
+            "add_action": measure(per_item, setup=setup),
+            "add_actions": measure(batched, setup=setup),
+            "replace_recent_actions": measure(replaced, setup=setup)}
+    report("insertion", results)
+
+
+if __name__ == "__main__":
+    main()
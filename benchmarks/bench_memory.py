@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Measures the memory used per recent action: the growth of the process
+resident set size (Python and Qt allocations) when adding the actions,
+divided by the number of actions.
+
+The compact storage of the RecentActionsModel (recent files with interned
+directories) is compared with the former storage: one QListWidgetItem per
+action, holding its text, icon, user data and tooltip.
+"""
+import gc
+import os
+from common import get_app, report
+
+#: number of recent actions
+COUNT = 100000
+
+
+def rss():
+    """
+    Returns the resident set size of the process, in bytes (None if it
+    cannot be measured on this platform).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def measure(app, fill):
+    """
+    Returns the bytes used per action by ``fill`` (None if the resident set
+    size cannot be measured). The objects created by ``fill`` are kept
+    alive by the caller.
+    """
+    app.processEvents()
+    gc.collect()
+    before = rss()
+    result = fill()
+    app.processEvents()
+    gc.collect()
+    after = rss()
+    if before is None:
+        return result, None
+    return result, float(after - before) / COUNT
+
+
+def main():
+    app = get_app()
+    from qwelcomewindow import QWelcomeWidget
+    from qwelcomewindow.model import recent_file_action
+    from qwelcomewindow.qt import QtCore, QtGui
+    # the entries are built first so that only the storage is measured
+    paths = ["/path/to/dir%03d/File%06d.xyz" % (i % 100, i)
+             for i in range(COUNT)]
+    entries = [(os.path.basename(path), ".xyz", path) for path in paths]
+    files = [recent_file_action(path, icon=".xyz", timestamp=1e9 + i,
+                                size=i) for i, path in enumerate(paths)]
+
+    def legacy():
+        widget = QtGui.QListWidget()
+        icon = QtGui.QIcon()
+        for text, _, path in entries:
+            item = QtGui.QListWidgetItem(text)
+            item.setIcon(icon)
+            item.setData(QtCore.Qt.UserRole, path)
+            item.setToolTip(path)
+            widget.addItem(item)
+        return widget
+
+    def compact(actions):
+        def fill():
+            widget = QWelcomeWidget(app_name="Benchmark")
+            widget.show()
+            widget.add_actions(QWelcomeWidget.ActionType.Recent, actions)
+            return widget
+        return fill
+
+    # every fill is measured while the previous results are still alive, so
+    # that the memory they release is not reused
+    alive = []
+    results = {"count": COUNT}
+    for name, fill in (("legacy", legacy), ("actions", compact(entries)),
+                       ("recent_files", compact(files))):
+        widget, per_item = measure(app, fill)
+        alive.append(widget)
+        results["%s_bytes_per_item" % name] = per_item
+    # the default measurement (actions added to the welcome widget)
+    results["bytes_per_item"] = results["actions_bytes_per_item"]
+    report("memory", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Measures the painting of large recents lists: a full grab of the widget and
+the rendering of the recents list while scrolling through it.
+"""
+from common import SIZES, get_app, measure, report
+
+#: number of scroll steps per measurement
+SCROLL_STEPS = 50
+
+
+def grab(widget):
+    """
+    Renders ``widget`` to a pixmap.
+    """
+    return widget.grab()
+
+
+def main():
+    app = get_app()
+    from qwelcomewindow import QWelcomeWidget
+    results = {}
+    for count in SIZES:
+        widget = QWelcomeWidget(app_name="Benchmark")
+        widget.resize(842, 513)
+        widget.add_actions(QWelcomeWidget.ActionType.Recent,
+                           (("File%06d.xyz" % i, ".xyz",
+                             "/path/File%06d.xyz" % i)
+                            for i in range(count)))
+        widget.show()
+        app.processEvents()
+        view = widget.ui.lwRecents
+        scroll_bar = view.verticalScrollBar()
+
+        def scroll():
+            step = max(1, scroll_bar.maximum() // SCROLL_STEPS)
+            for i in range(SCROLL_STEPS):
+                scroll_bar.setValue(i * step)
+                grab(view.viewport())
+
+        results[count] = {"grab": measure(lambda: grab(widget)),
+                          "scroll_frame": measure(scroll) / SCROLL_STEPS}
+    report("paint", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Measures the recent actions search: index construction and the latency of
+each keystroke while typing a few queries, on 100k entries.
+
+Exits with an error if a keystroke takes more than the per keystroke budget
+(a frame).
+"""
+import random
+import sys
+from common import measure, report
+
+#: number of indexed entries
+COUNT = 100000
+#: typed queries (single term, multiple terms, fuzzy and no match), each
+#: prefix is searched
+QUERIES = ("widget", "core 123", "home", "mnpy", "zzz", "util test 42",
+           "zz qq")
+WORDS = ("alpha", "beta", "gamma", "delta", "project", "main", "util",
+         "test", "core", "widget")
+#: per keystroke latency budget, in seconds
+BUDGET = 0.016
+
+
+def main():
+    from qwelcomewindow.search import SearchIndex
+    rng = random.Random(0)
+    entries = []
+    for i in range(COUNT):
+        name = "%s_%s%d.py" % (rng.choice(WORDS), rng.choice(WORDS), i)
+        entries.append((name, "/home/user/%s/%s/%s" % (
+            rng.choice(WORDS), rng.choice(WORDS), name)))
+
+    def build():
+        index = SearchIndex()
+        for text, data in entries:
+            index.add(text, data)
+        return index
+
+    results = {"build": measure(build)}
+    index = build()
+    index.search("warm up")
+    for query in QUERIES:
+        results[query] = dict(
+            (query[:i], measure(lambda: index.search(query[:i])))
+            for i in range(1, len(query) + 1))
+    report("search", results)
+    latency, prefix = max((latency, prefix)
+                          for query in QUERIES
+                          for prefix, latency in results[query].items())
+    if latency > BUDGET:
+        sys.exit("search: %r took %.1fms, the budget is %.1fms" % (
+            prefix, latency * 1000, BUDGET * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Measures the startup costs:
+    - import time of the package, of the widget module and of the qt
+      bindings, measured in fresh interpreters with ``python -X importtime``
+    - construction time of QWelcomeWidget, eager and lazy, and time to the
+      first show.
+"""
+import os
+import subprocess
+import sys
+from common import get_app, measure, report
+from qwelcomewindow.qt import BINDINGS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#: statements whose import time is measured
+IMPORTS = {
+    "package": "import qwelcomewindow",
+    "widget": "from qwelcomewindow import QWelcomeWidget",
+}
+
+
+def import_times(statement):
+    """
+    Runs ``statement`` in a fresh interpreter with -X importtime and returns
+    the cumulative import time of each top level module, in seconds.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [ROOT] + [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p])
+    args = [sys.executable, "-X", "importtime", "-c", statement]
+    # propagate the bindings selection
+    args += [arg for arg in sys.argv[1:]
+             if arg in [flag for api, name, flag in BINDINGS]]
+    output = subprocess.Popen(args, env=env, stderr=subprocess.PIPE,
+                              universal_newlines=True).communicate()[1]
+    times = {}
+    for line in output.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        # nested imports are indented
+        name = fields[2][1:].rstrip()
+        if name.startswith(" ") and name.strip() not in (
+                "qwelcomewindow.qt.QtCore", "qwelcomewindow.qt.QtGui",
+                "qwelcomewindow.widget"):
+            # nested import, already accounted for by its parent
+            continue
+        times[name.strip()] = int(fields[1]) / 1e6
+    return times
+
+
+def main():
+    results = {"imports": dict((name, import_times(statement))
+                               for name, statement in IMPORTS.items())}
+    app = get_app()
+    from qwelcomewindow import QWelcomeWidget
+
+    def construct_and_show(lazy):
+        widget = QWelcomeWidget(app_name="Benchmark", lazy=lazy)
+        widget.show()
+        app.processEvents()
+
+    results["construct"] = measure(lambda: QWelcomeWidget(
+        app_name="Benchmark"))
+    results["construct_lazy"] = measure(lambda: QWelcomeWidget(
+        app_name="Benchmark", lazy=True))
+    results["construct_and_show"] = measure(
+        lambda: construct_and_show(False))
+    results["construct_and_show_lazy"] = measure(
+        lambda: construct_and_show(True))
+    report("startup", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Measures the latency of switching between the light and the dark color
+schemes with 10k recent actions, in both theming modes.
+"""
+from common import get_app, measure, report
+
+#: number of recent actions
+COUNT = 10000
+
+
+def main():
+    app = get_app()
+    from qwelcomewindow import ColorScheme, DarkColorScheme, QWelcomeWidget
+    widget = QWelcomeWidget(app_name="Benchmark")
+    widget.add_actions(QWelcomeWidget.ActionType.Recent,
+                       (("File%06d.xyz" % i, ".xyz", "/path/File%06d.xyz" % i)
+                        for i in range(COUNT)))
+    widget.show()
+    app.processEvents()
+    schemes = [ColorScheme(), DarkColorScheme()]
+
+    def switch():
+        schemes.reverse()
+        widget.set_color_scheme(schemes[0])
+        # include the re-polish and the repaint
+        app.processEvents()
+
+    def same():
+        widget.set_color_scheme(schemes[0])
+        app.processEvents()
+
+    results = {}
+    for name, mode in (("stylesheet", QWelcomeWidget.ThemingMode.StyleSheet),
+                       ("palette", QWelcomeWidget.ThemingMode.Palette)):
+        widget.set_theming_mode(mode)
+        app.processEvents()
+        results[name] = {"switch": measure(switch, repeat=10),
+                         "unchanged": measure(same, repeat=10)}
+    report("theme_switch", results)
+
+
+if __name__ == "__main__":
+    main()
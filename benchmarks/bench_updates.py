@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Measures set_action_text throughput on lists of increasing size, including
+the repaint of the visible rows.
+"""
+from common import SIZES, get_app, measure, report
+
+#: number of set_action_text calls per measurement
+UPDATES = 1000
+
+
+def main():
+    app = get_app()
+    from qwelcomewindow import QWelcomeWidget
+    recent = QWelcomeWidget.ActionType.Recent
+    results = {}
+    for count in SIZES:
+        widget = QWelcomeWidget(app_name="Benchmark")
+        widget.add_actions(recent, (("File%06d.xyz" % i, ".xyz",
+                                     "/path/File%06d.xyz" % i)
+                                    for i in range(count)))
+        widget.show()
+        app.processEvents()
+
+        def update():
+            for i in range(UPDATES):
+                widget.set_action_text(recent, (i * 7919) % count,
+                                       "Renamed%06d.xyz" % i)
+            app.processEvents()
+
+        results[count] = {"set_action_text": measure(update) / UPDATES}
+    report("updates", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Helpers shared by the benchmark scripts.
+
+The benchmarks run headless, using the offscreen Qt platform unless
+QT_QPA_PLATFORM is already set. The qt bindings can be forced the usual way,
+by appending "--pyqt", "--pyside", "--pyqt5", "--pyside2", "--pyqt6" or
+"--pyside6" to the command line.
+"""
+from __future__ import print_function
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# make the benchmarks runnable from a source checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+#: number of entries used by the list benchmarks
+SIZES = (1000, 10000, 100000)
+
+
+def get_app():
+    """
+    Returns the QApplication instance, creating it if needed.
+    """
+    from qwelcomewindow.qt import QtGui
+    app = QtGui.QApplication.instance()
+    if app is None:
+        app = QtGui.QApplication(sys.argv)
+    return app
+
+
+def measure(func, repeat=3, setup=None):
+    """
+    Runs ``func`` ``repeat`` times and returns the best wall clock time, in
+    seconds.
+
+    :param setup: Optional callable run before each measurement, its return
+                  value is passed to ``func``.
+    """
+    best = None
+    for i in range(repeat):
+        arg = setup() if setup else None
+        start = time.time()
+        if setup:
+            func(arg)
+        else:
+            func()
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def report(name, results):
+    """
+    Prints the results of a benchmark as a JSON document.
+
+    :param name: Benchmark name
+    :param results: JSON serializable results
+    """
+    print(json.dumps({"benchmark": name, "qt_api": os.environ.get("QT_API"),
+                      "results": results}, indent=2, sort_keys=True))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Runs the benchmark suite headless (offscreen Qt platform) for each qt
+bindings and writes the results as a single JSON document.
+
+Usage::
+
+    python benchmarks/run.py [--pyqt] [--pyside] [--pyqt5] [--pyside2]
+                             [--pyqt6] [--pyside6] [-o results.json]
+                             [bench_name ...]
+
+Without bindings option, the suite runs for every installed bindings. Each benchmark
+runs in its own interpreter so that import and memory measurements are not
+skewed by the previous ones.
+"""
+from __future__ import print_function
+import argparse
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+try:
+    from importlib.util import find_spec
+except ImportError:  # python 2
+    from pkgutil import find_loader as find_spec
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# importing the qt package does not import any bindings
+sys.path.insert(0, os.path.dirname(HERE))
+from qwelcomewindow import qt
+
+#: bindings -> command line flag understood by qwelcomewindow.qt
+BINDINGS = dict((api, flag) for api, name, flag in qt.BINDINGS)
+
+
+def benchmarks():
+    """
+    Returns the names of the available benchmarks.
+    """
+    return sorted(os.path.basename(path)[len("bench_"):-len(".py")]
+                  for path in glob.glob(os.path.join(HERE, "bench_*.py")))
+
+
+def installed():
+    """
+    Returns the installed bindings.
+    """
+    return sorted(api for api, name, flag in qt.BINDINGS
+                  if find_spec(name) is not None)
+
+
+def run(name, bindings):
+    """
+    Runs a benchmark in a fresh interpreter and returns its parsed results.
+    """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env.pop("QT_API", None)
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(HERE, "bench_%s.py" % name),
+         BINDINGS[bindings]], cwd=HERE, env=env, stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE, universal_newlines=True)
+    output, errors = process.communicate()
+    if process.returncode != 0:
+        lines = errors.strip().splitlines() or [
+            "exit code %d" % process.returncode]
+        return {"error": lines[-1]}
+    return json.loads(output)["results"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("names", nargs="*", help="benchmarks to run "
+                        "(default: all): %s" % ", ".join(benchmarks()))
+    for bindings in sorted(BINDINGS):
+        parser.add_argument(BINDINGS[bindings], action="store_true")
+    parser.add_argument("-o", "--output", help="output file (default: "
+                        "stdout)")
+    args = parser.parse_args()
+    selected = [name for name in BINDINGS if getattr(args, name)]
+    document = {"timestamp": time.time(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": {}}
+    for bindings in selected or installed():
+        document["results"][bindings] = dict(
+            (name, run(name, bindings)) for name in args.names or benchmarks())
+    text = json.dumps(document, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
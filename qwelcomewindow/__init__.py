@@ -17,6 +17,45 @@ Classes:
     - qwelcomewindow.QWelcomeWidget
     - qwelcomewindow.ColorScheme
     - qwelcomewindow.DarkColorScheme
+    - qwelcomewindow.RecentFilesStore
+    - qwelcomewindow.SharedRecentFiles
+    - qwelcomewindow.QuickStartRegistry
+    - qwelcomewindow.SnapshotCache
+    - qwelcomewindow.SnapshotPlaceholder
 """
-from qwelcomewindow.widget import ColorScheme, DarkColorScheme, QWelcomeWidget
-__all__ = ['ColorScheme', 'DarkColorScheme', 'QWelcomeWidget']
+import importlib
+import sys
+
+#: public names, by module
+_modules = {
+    'ColorScheme': 'qwelcomewindow.widget',
+    'DarkColorScheme': 'qwelcomewindow.widget',
+    'QWelcomeWidget': 'qwelcomewindow.widget',
+    'RecentFilesStore': 'qwelcomewindow.store',
+    'SharedRecentFiles': 'qwelcomewindow.shared',
+    'QuickStartRegistry': 'qwelcomewindow.registry',
+    'SnapshotCache': 'qwelcomewindow.snapshot',
+    'SnapshotPlaceholder': 'qwelcomewindow.snapshot',
+}
+__all__ = ['ColorScheme', 'DarkColorScheme', 'QWelcomeWidget',
+           'RecentFilesStore', 'SharedRecentFiles', 'QuickStartRegistry',
+           'SnapshotCache', 'SnapshotPlaceholder']
+
+
+def __getattr__(name):
+    # the public classes (and thus the qt bindings) are imported on first
+    # access
+    try:
+        module = _modules[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r" % (
+            __name__, name))
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):
+    # no module level __getattr__ (PEP 562), import eagerly
+    for _name in __all__:
+        __getattr__(_name)
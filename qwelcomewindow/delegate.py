@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Item delegate used to paint the welcome widget actions.
+"""
+import time
+from qwelcomewindow.model import RecentActionsModel
+from qwelcomewindow.sections import SectionedRecentsModel
+from qwelcomewindow.qt import QtCore, QtGui
+
+
+def format_size(size):
+    """
+    Formats a file size for display (e.g. "12.3 KB").
+    """
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            break
+        size /= 1024.0
+    else:
+        unit = "TB"
+    if unit == "B":
+        return "%d %s" % (size, unit)
+    return "%.1f %s" % (size, unit)
+
+
+class ActionDelegate(QtGui.QAbstractItemDelegate):
+    """
+    Paints an action row (icon + text) directly with the colors of the
+    active ColorScheme, bypassing the (slow) stylesheet item rendering.
+
+    Rows that have a directory (RecentActionsModel.DirectoryRole) are painted
+    on two lines: the text and its timestamp/size on the first line, the
+    elided directory on the second one.
+
+    Font metrics are computed once per font and all rows have the same,
+    fixed, size hint: the two lines size hint as soon as the model has rows
+    with a directory (the views use uniform item sizes). Elided texts are
+    cached per (text, width bucket): texts are elided to a multiple of
+    WIDTH_BUCKET pixels, so resizing the view only recomputes the elision
+    when a bucket boundary is crossed. Timestamps and sizes are only
+    formatted when a row is painted.
+    """
+    #: padding around the row content, in pixels
+    PADDING = 5
+    #: icon size, in pixels
+    ICON_SIZE = 16
+    #: maximum number of cached elided texts
+    ELIDED_CACHE_SIZE = 4096
+    #: granularity of the elision widths, in pixels
+    WIDTH_BUCKET = 16
+    #: maximum number of cached formatted timestamps/sizes
+    METADATA_CACHE_SIZE = 1024
+    #: strftime format of the timestamps
+    TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+
+    def __init__(self, parent=None, elide_mode=QtCore.Qt.ElideRight):
+        """
+        :param elide_mode: How the texts that do not fit are elided
+                           (QtCore.Qt.TextElideMode).
+        """
+        super(ActionDelegate, self).__init__(parent)
+        self.elide_mode = elide_mode
+        self._font = None
+        self._header_font = None
+        self._metrics = None
+        self._size_hint = None
+        self._two_lines_size_hint = None
+        self._elided = {}
+        self._metadata = {}
+        self._text = None
+        self._disabled_text = None
+        self._border = None
+        self._selection_background = None
+        self._selection_text = None
+        self._hover = None
+
+    def set_color_scheme(self, color_scheme):
+        """
+        Sets the colors used to paint the rows.
+
+        :type color_scheme: qwelcomewindow.ColorScheme
+        """
+        color = QtGui.QColor
+        self._text = color(color_scheme.text_color)
+        self._disabled_text = color(color_scheme.border_color)
+        self._border = color(color_scheme.border_color)
+        self._selection_background = color(color_scheme.selection_bck_color)
+        self._selection_text = color(color_scheme.selection_color)
+        self._hover = color(color_scheme.hover_color)
+
+    def _update_font(self, font):
+        """
+        Recomputes the font metrics (and invalidates the caches) when the
+        font changed.
+        """
+        if self._font is not None and font == self._font:
+            return
+        self._font = QtGui.QFont(font)
+        self._header_font = QtGui.QFont(font)
+        self._header_font.setBold(True)
+        self._metrics = QtGui.QFontMetrics(font)
+        self._elided = {}
+        self._metadata = {}
+        width = (self._metrics.averageCharWidth() * 20 + 3 * self.PADDING +
+                 self.ICON_SIZE)
+        height = max(self._metrics.height(), self.ICON_SIZE)
+        self._size_hint = QtCore.QSize(width, height + 2 * self.PADDING)
+        height = max(2 * self._metrics.height(), self.ICON_SIZE)
+        self._two_lines_size_hint = QtCore.QSize(
+            width, height + 2 * self.PADDING)
+
+    def sizeHint(self, option, index):
+        self._update_font(option.font)
+        # all the rows (section headers included) have the same size
+        model = index.model()
+        if not isinstance(model, RecentActionsModel):
+            # sections or search results
+            model = model.source_model()
+        if model.has_directories():
+            return self._two_lines_size_hint
+        return self._size_hint
+
+    def elided_text(self, text, width):
+        """
+        Returns ``text`` elided to fit in ``width`` pixels (cached per width
+        bucket).
+        """
+        width -= width % self.WIDTH_BUCKET
+        key = (text, width)
+        try:
+            return self._elided[key]
+        except KeyError:
+            if len(self._elided) >= self.ELIDED_CACHE_SIZE:
+                self._elided.clear()
+            elided = self._metrics.elidedText(text, self.elide_mode, width)
+            self._elided[key] = elided
+            return elided
+
+    def metadata(self, timestamp, size):
+        """
+        Returns the formatted timestamp and size of a recent file and its
+        width in pixels (cached).
+
+        :param timestamp: Last opening time (seconds since epoch) or None
+        :param size: File size (bytes) or None
+        :return: (text, width)
+        """
+        key = (timestamp, size)
+        try:
+            return self._metadata[key]
+        except KeyError:
+            if len(self._metadata) >= self.METADATA_CACHE_SIZE:
+                self._metadata.clear()
+            fields = []
+            if timestamp:
+                fields.append(time.strftime(self.TIMESTAMP_FORMAT,
+                                            time.localtime(timestamp)))
+            if size is not None:
+                fields.append(format_size(size))
+            text = "  ".join(fields)
+            value = (text, self._metrics.horizontalAdvance(text)
+                     if text else 0)
+            self._metadata[key] = value
+            return value
+
+    def _row_colors(self, state):
+        """
+        Returns the (background, text, border) colors of a row state,
+        background and border are None when they must not be painted.
+        """
+        if not state & QtGui.QStyle.State_Enabled:
+            return None, self._disabled_text, None
+        if state & QtGui.QStyle.State_Selected:
+            return self._selection_background, self._selection_text, \
+                self._border
+        if state & QtGui.QStyle.State_MouseOver:
+            return self._hover, self._text, None
+        return None, self._text, None
+
+    def paint(self, painter, option, index):
+        self._update_font(option.font)
+        if self._text is None:
+            # no color scheme: use the palette
+            palette = option.palette
+            self._text = palette.color(QtGui.QPalette.Text)
+            self._disabled_text = palette.color(QtGui.QPalette.Disabled,
+                                                QtGui.QPalette.Text)
+            self._selection_background = palette.color(
+                QtGui.QPalette.Highlight)
+            self._selection_text = palette.color(
+                QtGui.QPalette.HighlightedText)
+            self._hover = self._selection_background.lighter(150)
+            self._border = palette.color(QtGui.QPalette.Mid)
+        rect = option.rect
+        background, text_color, border = self._row_colors(option.state)
+        painter.save()
+        if background is not None:
+            painter.fillRect(rect, background)
+        if border is not None:
+            painter.setPen(border)
+            painter.drawRect(rect.adjusted(0, 0, -1, -1))
+        x = rect.x() + self.PADDING
+        icon = index.data(QtCore.Qt.DecorationRole)
+        if icon is not None:
+            icon.paint(painter, QtCore.QRect(
+                x, rect.y() + (rect.height() - self.ICON_SIZE) // 2,
+                self.ICON_SIZE, self.ICON_SIZE))
+            x += self.ICON_SIZE + self.PADDING
+        text = index.data(QtCore.Qt.DisplayRole)
+        directory = index.data(RecentActionsModel.DirectoryRole)
+        painter.setFont(self._font)
+        painter.setPen(text_color)
+        if index.data(SectionedRecentsModel.HeaderRole):
+            self._paint_header(painter, index, rect, text)
+        elif directory:
+            self._paint_two_lines(painter, index, rect, x, text, directory,
+                                  text_color)
+        elif text:
+            width = rect.right() - self.PADDING - x
+            painter.drawText(QtCore.QRect(x, rect.y(), width, rect.height()),
+                             QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                             self.elided_text(text, width))
+        painter.restore()
+
+    def _paint_header(self, painter, index, rect, text):
+        """
+        Paints a section header: an expansion arrow and the section title.
+        """
+        painter.setFont(self._header_font)
+        arrow = u"\u25be " if index.data(
+            SectionedRecentsModel.ExpandedRole) else u"\u25b8 "
+        painter.drawText(
+            rect.adjusted(self.PADDING, 0, -self.PADDING, 0),
+            QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, arrow + text)
+
+    def _paint_two_lines(self, painter, index, rect, x, text, directory,
+                         text_color):
+        """
+        Paints the text, the metadata and the directory of a recent file.
+        """
+        line_height = self._metrics.height()
+        y = rect.y() + (rect.height() - 2 * line_height) // 2
+        right = rect.right() - self.PADDING
+        metadata, metadata_width = self.metadata(
+            index.data(RecentActionsModel.TimestampRole),
+            index.data(RecentActionsModel.SizeRole))
+        secondary = QtGui.QColor(text_color)
+        secondary.setAlpha(160)
+        if metadata:
+            painter.setPen(secondary)
+            painter.drawText(
+                QtCore.QRect(right - metadata_width, y, metadata_width,
+                             line_height),
+                QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, metadata)
+            painter.setPen(text_color)
+            metadata_width += self.PADDING
+        if text:
+            width = right - metadata_width - x
+            painter.drawText(QtCore.QRect(x, y, width, line_height),
+                             QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                             self.elided_text(text, width))
+        width = right - x
+        painter.setPen(secondary)
+        painter.drawText(QtCore.QRect(x, y + line_height, width, line_height),
+                         QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                         self.elided_text(directory, width))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Lazy resolution of action icons from icon keys.
+
+An icon key is either:
+    - a file extension: ".py"
+    - a MIME type: "text/x-python"
+    - a file path: "/home/user/project/main.py", "/home/user/project/"
+      (trailing separator for directories). The file system is never
+      accessed, only the extension is used.
+"""
+import collections
+import mimetypes
+import os
+from qwelcomewindow.qt import QtCore, QtGui
+
+
+#: MIME top level types, used to tell a MIME type from a relative path
+MIME_TOP_LEVEL_TYPES = frozenset([
+    "application", "audio", "font", "image", "inode", "message", "model",
+    "multipart", "text", "video"])
+
+#: normalized key of the directories
+FOLDER_KEY = "inode/directory"
+#: normalized key of the files without extension
+FILE_KEY = "application/octet-stream"
+
+
+def normalize_icon_key(key):
+    """
+    Normalizes an icon key: all the keys that resolve to the same icon
+    are normalized to the same value (a lower case extension or a MIME type).
+
+    :param key: Icon key (extension, MIME type or path)
+    :return: normalized key
+    """
+    if key.startswith(".") and os.sep not in key and "/" not in key:
+        return key.lower()
+    head, sep, tail = key.partition("/")
+    if sep and tail and "/" not in tail and (
+            head in MIME_TOP_LEVEL_TYPES or head.startswith("x-")):
+        return key.lower()
+    if key.endswith(os.sep) or key.endswith("/"):
+        return FOLDER_KEY
+    ext = os.path.splitext(key)[1]
+    if ext:
+        return ext.lower()
+    return FILE_KEY
+
+
+class IconProvider(QtCore.QObject):
+    """
+    Resolves icon keys to QIcon, lazily.
+
+    icon() never blocks: an unknown key is queued and resolved in one batch
+    when the event loop is idle, icons_resolved is then emitted so that the
+    views can repaint. Since views only query their visible rows, only the
+    icons actually displayed are ever resolved.
+
+    Resolved icons are kept in an LRU cache indexed by normalized key, so all
+    the entries of the same type share the same QIcon.
+    """
+    #: Signal emitted when queued icon keys have been resolved
+    icons_resolved = QtCore.Signal()
+
+    def __init__(self, parent=None, capacity=256):
+        """
+        :param capacity: Maximum number of icons kept in the cache
+        """
+        super(IconProvider, self).__init__(parent)
+        self.capacity = capacity
+        self._icons = collections.OrderedDict()
+        self._pending = set()
+        self._file_icon_provider = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._resolve_pending)
+
+    def icon(self, key):
+        """
+        Returns the icon of a normalized icon key, or None if the icon is not
+        resolved yet.
+
+        :param key: Normalized icon key (see normalize_icon_key)
+        """
+        try:
+            icon = self._icons.pop(key)
+        except KeyError:
+            self._pending.add(key)
+            self._timer.start()
+            return None
+        # move to the most recently used end
+        self._icons[key] = icon
+        return icon
+
+    def _resolve_pending(self):
+        pending = self._pending
+        self._pending = set()
+        for key in pending:
+            self._icons[key] = self.resolve(key)
+        while len(self._icons) > self.capacity:
+            self._icons.popitem(last=False)
+        if pending:
+            self.icons_resolved.emit()
+
+    def resolve(self, key):
+        """
+        Resolves a normalized icon key to a QIcon. The icon theme is looked
+        up first (freedesktop MIME icon names) then QFileIconProvider is used.
+
+        Reimplement this method to provide your own icons.
+
+        :param key: Normalized icon key
+        :rtype: QIcon
+        """
+        if self._file_icon_provider is None:
+            self._file_icon_provider = QtGui.QFileIconProvider()
+        provider = self._file_icon_provider
+        if key == FOLDER_KEY:
+            return provider.icon(QtGui.QFileIconProvider.Folder)
+        if key.startswith("."):
+            mime = mimetypes.guess_type("file" + key)[0]
+            file_info = QtCore.QFileInfo("file" + key)
+        else:
+            mime = key
+            ext = mimetypes.guess_extension(key)
+            file_info = QtCore.QFileInfo("file" + ext) if ext else None
+        if mime:
+            icon = QtGui.QIcon.fromTheme(mime.replace("/", "-"))
+            if icon.isNull():
+                icon = QtGui.QIcon.fromTheme(
+                    mime.partition("/")[0] + "-x-generic")
+            if not icon.isNull():
+                return icon
+        if file_info is not None:
+            return provider.icon(file_info)
+        return provider.icon(QtGui.QFileIconProvider.File)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Lightweight timing instrumentation of the welcome widget hot paths.
+"""
+import collections
+import json
+import os
+import threading
+import time
+
+
+class _NullContext(object):
+    """
+    A do-nothing context manager, used when instrumentation is disabled.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+#: shared do-nothing context manager
+NULL_CONTEXT = _NullContext()
+
+
+class _Measure(object):
+    """
+    Context manager that records the duration of its block.
+    """
+    __slots__ = ("_instrumentation", "_name", "_start")
+
+    def __init__(self, instrumentation, name):
+        self._instrumentation = instrumentation
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.time()
+        return self
+
+    def __exit__(self, *args):
+        self._instrumentation.record(self._name, self._start,
+                                     time.time() - self._start)
+        return False
+
+
+class Instrumentation(object):
+    """
+    Records timed events in a ring buffer and keeps per event name
+    statistics.
+
+    Usage::
+
+        instrumentation = Instrumentation()
+        with instrumentation.measure("population"):
+            ...
+        print(instrumentation.stats())
+        instrumentation.dump_chrome_trace("trace.json")
+    """
+
+    def __init__(self, capacity=1024, callback=None):
+        """
+        :param capacity: Number of events kept in the ring buffer
+        :param callback: Optional callable called with (name, duration) each
+                         time an event is recorded.
+        """
+        #: recorded events: (name, start, duration), times in seconds
+        self.events = collections.deque(maxlen=capacity)
+        self.callback = callback
+        #: name -> [count, total, min, max, last]
+        self._stats = {}
+
+    def measure(self, name):
+        """
+        Returns a context manager that records the duration of its block as
+        an event called ``name``.
+        """
+        return _Measure(self, name)
+
+    def record(self, name, start, duration):
+        """
+        Records an event.
+
+        :param name: Event name
+        :param start: Event start time (seconds since epoch)
+        :param duration: Event duration in seconds
+        """
+        self.events.append((name, start, duration))
+        try:
+            stats = self._stats[name]
+        except KeyError:
+            self._stats[name] = [1, duration, duration, duration, duration]
+        else:
+            stats[0] += 1
+            stats[1] += duration
+            if duration < stats[2]:
+                stats[2] = duration
+            if duration > stats[3]:
+                stats[3] = duration
+            stats[4] = duration
+        if self.callback is not None:
+            self.callback(name, duration)
+
+    def stats(self):
+        """
+        Returns the statistics of each event name (since the creation or
+        the last clear), durations in seconds::
+
+            {name: {"count": int, "total": float, "min": float,
+                    "max": float, "mean": float, "last": float}}
+        """
+        return dict((name, {"count": count, "total": total, "min": minimum,
+                            "max": maximum, "mean": total / count,
+                            "last": last})
+                    for name, (count, total, minimum, maximum, last)
+                    in self._stats.items())
+
+    def clear(self):
+        """
+        Forgets all the recorded events and statistics.
+        """
+        self.events.clear()
+        self._stats.clear()
+
+    def dump_chrome_trace(self, path):
+        """
+        Writes the events of the ring buffer to ``path`` in the Chrome trace
+        event format (load it in chrome://tracing or Perfetto).
+        """
+        pid = os.getpid()
+        tid = threading.current_thread().ident or 0
+        trace = {"traceEvents": [
+            {"name": name, "cat": "qwelcomewindow", "ph": "X",
+             "ts": start * 1e6, "dur": duration * 1e6, "pid": pid,
+             "tid": tid}
+            for name, start, duration in self.events],
+            "displayTimeUnit": "ms"}
+        with open(path, "w") as f:
+            json.dump(trace, f)
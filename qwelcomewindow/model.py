@@ -0,0 +1,684 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Item model used by the welcome widget's action lists.
+
+Actions are stored in flat parallel arrays instead of one QListWidgetItem per
+entry, the view only queries the rows that are actually visible.
+
+Recent files are stored compactly: the directories are interned (recent
+files often share a few directories) and the path of a recent file is not
+stored when it can be rebuilt from its directory and its name.
+"""
+import bisect
+import os
+from array import array
+from qwelcomewindow.icons import normalize_icon_key
+from qwelcomewindow.qt import QtCore, QtGui
+
+#: marks the user data of a recent file that is the join of its directory and
+#: its text (the path is rebuilt on demand)
+_JOINED = object()
+
+
+def recent_file_action(path, icon=None, timestamp=None, size=None):
+    """
+    Returns the action tuple of a recent file: the file name is the action
+    text, the path is the action data and the directory is displayed on a
+    second line.
+
+    :param path: File path
+    :param icon: QIcon or icon key, defaults to the path (the icon associated
+                 with the file extension).
+    :param timestamp: Last opening time, in seconds since epoch, optional
+    :param size: File size, in bytes, optional
+    """
+    directory, name = os.path.split(path)
+    return (name or path, icon or path, path, directory, timestamp, size)
+
+
+class RecentActionsModel(QtCore.QAbstractListModel):
+    """
+    A flat list model of welcome widget actions (used for both the recents
+    and the quick start lists).
+
+    Each row is made of a text, an optional user data and an optional icon.
+    Icons are shared: the model stores a small table of distinct icons (or
+    normalized icon keys) and each row only keeps an index into this table.
+    Directories are shared the same way. Tooltips are derived from the user
+    data on demand.
+
+    Icon keys (see qwelcomewindow.icons) are resolved by the model's icon
+    provider, only when a row is displayed.
+
+    Recent files rows may also carry a directory, a last opening timestamp
+    and a file size, available through the DirectoryRole, TimestampRole and
+    SizeRole roles. The model counts the rows that have a directory (see
+    has_directories): the views use uniform row sizes, the size of the rows
+    depends on the model rather than on a sampled row.
+
+    Every row has a key: its user data, or its text when it has no user
+    data. Each row also has a sequence number, increasing with the rows:
+    rows are looked up by key through a dict of sequence numbers and a
+    binary search in the sequence numbers. Shifting rows (insertion,
+    removal, move) does not change the sequence numbers of the other rows,
+    so the index is updated in place for the changed rows only. It is
+    rebuilt lazily after a reordering, or when sequence numbers run out
+    between two rows, or when a duplicated key is changed.
+    """
+    #: item data role of the directory of a recent file (str)
+    DirectoryRole = QtCore.Qt.UserRole + 1
+    #: item data role of the last opening time of a recent file (seconds
+    #: since epoch, float)
+    TimestampRole = QtCore.Qt.UserRole + 2
+    #: item data role of the size of a recent file (bytes, int)
+    SizeRole = QtCore.Qt.UserRole + 3
+
+    #: Signal emitted when the text of a row has changed (row)
+    text_changed = QtCore.Signal(int)
+
+    def __init__(self, parent=None, icon_provider=None):
+        super(RecentActionsModel, self).__init__(parent)
+        self._icon_provider = None
+        self.set_icon_provider(icon_provider)
+        self._texts, self._data, self._icon_ids, self._directories, \
+            self._timestamps, self._sizes = self._new_columns()
+        #: distinct icons (QIcon or normalized icon keys)
+        self._icons = []
+        #: maps an icon cache key (or an icon key) to its index in self._icons
+        self._icon_keys = {}
+        #: distinct directories
+        self._directory_table = []
+        #: maps a directory to its index in self._directory_table
+        self._directory_keys = {}
+        #: user data of the unavailable (disabled) actions
+        self._unavailable = set()
+        #: tooltips that replace the user data, by action key
+        self._tooltips = {}
+        #: maps a key to the sequence number of its row, None when it must
+        #: be rebuilt
+        self._keys = None
+        #: sequence numbers of the rows (increasing), when self._keys is set
+        self._sequences = array("d")
+        #: False if several rows have the same key
+        self._unique_keys = True
+        #: number of rows that have a directory
+        self._directory_count = 0
+
+    @staticmethod
+    def _new_columns():
+        """
+        Returns new empty columns, in the order of the action tuples (see
+        extend).
+        """
+        return (
+            # displayed texts
+            [],
+            # user data
+            [],
+            # index in self._icons, -1 means no icon
+            array("i"),
+            # index in self._directory_table, -1 if unknown
+            array("i"),
+            # last opening timestamps, 0 if unknown
+            array("d"),
+            # file sizes, -1 if unknown
+            array("q"))
+
+    def _columns(self):
+        return (self._texts, self._data, self._icon_ids, self._directories,
+                self._timestamps, self._sizes)
+
+    def key(self, row):
+        """
+        Returns the key of the row: its user data, or its text when it has
+        no user data.
+        """
+        data = self.action_data(row)
+        return self._texts[row] if data is None else data
+
+    def row(self, key):
+        """
+        Returns the row of ``key`` (the first one if several rows have the
+        same key), or -1 if there is no such row.
+        """
+        if self._keys is None:
+            count = len(self._texts)
+            keys = [self.key(row) for row in range(count)]
+            # reversed so that the first row of a duplicated key wins
+            self._keys = dict(zip(reversed(keys),
+                                  map(float, range(count - 1, -1, -1))))
+            self._sequences = array("d", range(count))
+            self._unique_keys = len(self._keys) == count
+        sequence = self._keys.get(key)
+        if sequence is None:
+            return -1
+        return bisect.bisect_left(self._sequences, sequence)
+
+    def _invalidate_keys(self):
+        self._keys = None
+        self._sequences = array("d")
+
+    def _new_sequences(self, row, count):
+        """
+        Returns ``count`` increasing sequence numbers for rows inserted
+        before ``row``, None if there is no room between the neighbour rows.
+        """
+        sequences = self._sequences
+        if not sequences:
+            return [float(i) for i in range(count)]
+        if row >= len(sequences):
+            last = sequences[-1]
+            return [last + 1 + i for i in range(count)]
+        if row == 0:
+            first = sequences[0]
+            return [first - count + i for i in range(count)]
+        low, high = sequences[row - 1], sequences[row]
+        step = (high - low) / (count + 1)
+        values = [low + step * (i + 1) for i in range(count)]
+        bounds = [low] + values + [high]
+        if all(a < b for a, b in zip(bounds, bounds[1:])):
+            return values
+        return None
+
+    def _index_inserted(self, row, count):
+        """
+        Indexes the keys of ``count`` rows inserted at ``row`` (the columns
+        are already updated, the sequence numbers are not).
+        """
+        if self._keys is None:
+            return
+        sequences = self._new_sequences(row, count)
+        if sequences is None:
+            self._invalidate_keys()
+            return
+        self._sequences[row:row] = array("d", sequences)
+        keys = self._keys
+        for offset, sequence in enumerate(sequences):
+            key = self.key(row + offset)
+            if keys.setdefault(key, sequence) != sequence:
+                # the first row of a duplicated key wins
+                self._unique_keys = False
+                if keys[key] > sequence:
+                    keys[key] = sequence
+
+    def _unindex_removed(self, first, last):
+        """
+        Removes the keys of the rows ``first`` to ``last``, before they are
+        removed from the columns.
+        """
+        if self._keys is None:
+            return
+        if not self._unique_keys:
+            # another row of a removed key may become the first one
+            self._invalidate_keys()
+            return
+        keys = self._keys
+        for row in range(first, last + 1):
+            keys.pop(self.key(row), None)
+        del self._sequences[first:last + 1]
+
+    def has_directories(self):
+        """
+        Returns True if some rows have a directory (recent files rows,
+        painted on two lines).
+        """
+        return self._directory_count > 0
+
+    @staticmethod
+    def _count_directories(directories):
+        return len(directories) - directories.count(-1)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._texts)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == QtCore.Qt.DisplayRole:
+            return self._texts[row]
+        if role == QtCore.Qt.DecorationRole:
+            icon_id = self._icon_ids[row]
+            if icon_id != -1:
+                icon = self._icons[icon_id]
+                if isinstance(icon, QtGui.QIcon):
+                    return icon
+                if self._icon_provider is not None:
+                    return self._icon_provider.icon(icon)
+        elif role == QtCore.Qt.UserRole:
+            return self.action_data(row)
+        elif role == QtCore.Qt.ToolTipRole:
+            if self._tooltips:
+                tooltip = self._tooltips.get(self.key(row))
+                if tooltip is not None:
+                    return tooltip or None
+            # tooltips are derived from the user data on demand
+            return self.action_data(row) or None
+        elif role == self.DirectoryRole:
+            return self.directory(row)
+        elif role == self.TimestampRole:
+            return self._timestamps[row] or None
+        elif role == self.SizeRole:
+            size = self._sizes[row]
+            if size != -1:
+                return size
+        return None
+
+    def match(self, start, role, value, hits=1,
+              flags=QtCore.Qt.MatchStartsWith | QtCore.Qt.MatchWrap):
+        # fast path of the view type-ahead (QAbstractItemView.keyboardSearch)
+        if (role != QtCore.Qt.DisplayRole or hits != 1 or
+                flags != QtCore.Qt.MatchStartsWith | QtCore.Qt.MatchWrap or
+                not hasattr(value, "lower")):
+            return super(RecentActionsModel, self).match(
+                start, role, value, hits, flags)
+        prefix = value.lower()
+        texts = self._texts
+        first = max(start.row(), 0)
+        for rows in (range(first, len(texts)), range(first)):
+            for row in rows:
+                if texts[row].lower().startswith(prefix):
+                    return [self.index(row)]
+        return []
+
+    def flags(self, index):
+        if (self._unavailable and index.isValid() and
+                self.action_data(index.row()) in self._unavailable):
+            return QtCore.Qt.NoItemFlags
+        return super(RecentActionsModel, self).flags(index)
+
+    def set_unavailable(self, values, unavailable=True):
+        """
+        Disables (or re-enables) the actions whose user data is in
+        ``values``.
+
+        :param values: iterable of action user data
+        :param unavailable: True to disable the actions, False to enable them.
+        """
+        count = len(self._unavailable)
+        if unavailable:
+            self._unavailable.update(values)
+        else:
+            self._unavailable.difference_update(values)
+        if count != len(self._unavailable) and self._texts:
+            self.dataChanged.emit(self.index(0),
+                                  self.index(len(self._texts) - 1))
+
+    def clear_unavailable(self):
+        """
+        Re-enables all the actions.
+        """
+        self.set_unavailable(list(self._unavailable), False)
+
+    def set_tooltip(self, key, tooltip):
+        """
+        Sets the tooltip of the action ``key`` (see row), the tooltip of an
+        action is its user data by default. The tooltip is kept until the
+        action is removed, it may be set before the action is added.
+
+        :param tooltip: Tooltip, "" for no tooltip, None to restore the
+                        default tooltip.
+        """
+        if tooltip is None:
+            self._tooltips.pop(key, None)
+        else:
+            self._tooltips[key] = tooltip
+        row = self.row(key)
+        if row != -1:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def remove_data(self, values):
+        """
+        Removes the actions whose user data is in ``values``.
+
+        Each contiguous run of removed rows is notified separately.
+
+        :param values: set of action user data
+        """
+        action_data = self.action_data
+        row = len(self._data) - 1
+        while row >= 0:
+            if action_data(row) not in values:
+                row -= 1
+                continue
+            last = row
+            while row > 0 and action_data(row - 1) in values:
+                row -= 1
+            self.beginRemoveRows(QtCore.QModelIndex(), row, last)
+            self._directory_count -= self._count_directories(
+                self._directories[row:last + 1])
+            self._unindex_removed(row, last)
+            for column in self._columns():
+                del column[row:last + 1]
+            self.endRemoveRows()
+            row -= 1
+        self._unavailable.difference_update(values)
+        for value in values:
+            self._tooltips.pop(value, None)
+
+    def set_icon_provider(self, icon_provider):
+        """
+        Sets the provider used to resolve the icon keys.
+
+        :type icon_provider: qwelcomewindow.icons.IconProvider
+        """
+        if self._icon_provider is not None:
+            self._icon_provider.icons_resolved.disconnect(
+                self._on_icons_resolved)
+        self._icon_provider = icon_provider
+        if icon_provider is not None:
+            icon_provider.icons_resolved.connect(self._on_icons_resolved)
+
+    def _on_icons_resolved(self):
+        if self._texts:
+            self.dataChanged.emit(self.index(0),
+                                  self.index(len(self._texts) - 1))
+
+    def _icon_id(self, icon):
+        """
+        Returns the index of ``icon`` in the shared icon table, the icon is
+        added to the table if needed.
+
+        :param icon: QIcon or icon key
+        """
+        if not icon:
+            return -1
+        if isinstance(icon, QtGui.QIcon):
+            key = icon.cacheKey()
+        else:
+            key = icon = normalize_icon_key(icon)
+        try:
+            return self._icon_keys[key]
+        except KeyError:
+            icon_id = len(self._icons)
+            self._icons.append(icon)
+            self._icon_keys[key] = icon_id
+            return icon_id
+
+    def _directory_id(self, directory):
+        """
+        Returns the index of ``directory`` in the shared directory table, the
+        directory is added to the table if needed.
+        """
+        if directory is None:
+            return -1
+        try:
+            return self._directory_keys[directory]
+        except KeyError:
+            directory_id = len(self._directory_table)
+            self._directory_table.append(directory)
+            self._directory_keys[directory] = directory_id
+            return directory_id
+
+    def append(self, text, icon=None, data=None, directory=None,
+               timestamp=None, size=None):
+        """
+        Appends an action at the end of the model.
+
+        :param text: Action text
+        :param icon: Action icon (QIcon or icon key), optional
+        :param data: User data, optional
+        :param directory: Directory of a recent file, optional
+        :param timestamp: Last opening time of a recent file, optional
+        :param size: Size of a recent file, optional
+        """
+        self.extend([(text, icon, data, directory, timestamp, size)])
+
+    def extend(self, actions):
+        """
+        Appends several actions at once.
+
+        The rows are inserted in a single batch: the attached views are
+        notified once, whatever the number of actions.
+
+        :param actions: iterable of
+                        (text, icon, data, directory, timestamp, size)
+                        tuples, all the items but the text are optional and
+                        may be omitted from the end of the tuple.
+        """
+        columns = self._unpack(actions)
+        count = len(columns[0])
+        if not count:
+            return
+        first = len(self._texts)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + count - 1)
+        for column, values in zip(self._columns(), columns):
+            column.extend(values)
+        self._directory_count += self._count_directories(columns[3])
+        self._index_inserted(first, count)
+        self.endInsertRows()
+
+    def insert(self, row, actions):
+        """
+        Inserts several actions before ``row``, in a single batch.
+
+        :param actions: iterable of action tuples (see extend)
+        """
+        columns = self._unpack(actions)
+        count = len(columns[0])
+        if not count:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), row, row + count - 1)
+        for column, values in zip(self._columns(), columns):
+            column[row:row] = values
+        self._directory_count += self._count_directories(columns[3])
+        self._index_inserted(row, count)
+        self.endInsertRows()
+
+    def reorder(self, rows):
+        """
+        Reorders the actions in a single layout change.
+
+        :param rows: the rows, in their new order (a permutation of
+                     range(rowCount()))
+        """
+        self.layoutAboutToBeChanged.emit()
+        for column in self._columns():
+            values = [column[row] for row in rows]
+            if isinstance(column, array):
+                values = array(column.typecode, values)
+            column[:] = values
+        destinations = [0] * len(rows)
+        for destination, row in enumerate(rows):
+            destinations[row] = destination
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistent, [self.index(destinations[index.row()])
+                         for index in persistent])
+        self._invalidate_keys()
+        self.layoutChanged.emit()
+
+    def replace(self, actions):
+        """
+        Replaces all the actions by ``actions`` in a single model reset.
+
+        :param actions: iterable of action tuples (see extend)
+        """
+        tables = (self._icons, self._icon_keys, self._directory_table,
+                  self._directory_keys)
+        self._icons, self._icon_keys = [], {}
+        self._directory_table, self._directory_keys = [], {}
+        try:
+            columns = self._unpack(actions)
+        except Exception:
+            self._icons, self._icon_keys, self._directory_table, \
+                self._directory_keys = tables
+            raise
+        self.beginResetModel()
+        self._texts, self._data, self._icon_ids, self._directories, \
+            self._timestamps, self._sizes = columns
+        self._directory_count = self._count_directories(self._directories)
+        self._invalidate_keys()
+        self.endResetModel()
+
+    def _unpack(self, actions):
+        """
+        Splits an iterable of action tuples into new columns.
+        """
+        columns = self._new_columns()
+        texts, data, icon_ids, directories, timestamps, sizes = columns
+        icon_id = self._icon_id
+        directory_id = self._directory_id
+        join = os.path.join
+        for action in actions:
+            length = len(action)
+            text = action[0]
+            texts.append(text)
+            icon_ids.append(icon_id(action[1]) if length > 1 else -1)
+            value = action[2] if length > 2 else None
+            directory = action[3] if length > 3 else None
+            directories.append(directory_id(directory))
+            if directory is not None and value == join(directory, text):
+                value = _JOINED
+            data.append(value)
+            timestamps.append(action[4] or 0 if length > 4 else 0)
+            size = action[5] if length > 5 else None
+            sizes.append(-1 if size is None else size)
+        return columns
+
+    def text(self, row):
+        """
+        Returns the text of the action at ``row``.
+        """
+        return self._texts[row]
+
+    def action_data(self, row):
+        """
+        Returns the user data of the action at ``row``.
+        """
+        data = self._data[row]
+        if data is _JOINED:
+            return os.path.join(
+                self._directory_table[self._directories[row]],
+                self._texts[row])
+        return data
+
+    def directory(self, row):
+        """
+        Returns the directory of the recent file at ``row``, or None.
+        """
+        directory_id = self._directories[row]
+        if directory_id == -1:
+            return None
+        return self._directory_table[directory_id]
+
+    def set_text(self, row, text):
+        """
+        Changes the text of the action at ``row``.
+        """
+        self.update(row, text=text)
+
+    def update(self, row, text=None, icon=None, data=None, directory=None,
+               timestamp=None, size=None):
+        """
+        Changes the fields of the action at ``row``, the None fields are
+        left unchanged. Only the row is notified as changed.
+        """
+        key = self.key(row)
+        if self._data[row] is _JOINED and (text is not None or
+                                           directory is not None):
+            # the path can not be rebuilt anymore
+            self._data[row] = key
+        if data is not None and data != self.action_data(row):
+            self._data[row] = data
+        if text is not None:
+            self._texts[row] = text
+        if data is not None or text is not None:
+            self._rekey(row, key)
+        if icon is not None:
+            self._icon_ids[row] = self._icon_id(icon)
+        if directory is not None:
+            if self._directories[row] == -1:
+                self._directory_count += 1
+            self._directories[row] = self._directory_id(directory)
+        if timestamp is not None:
+            self._timestamps[row] = timestamp
+        if size is not None:
+            self._sizes[row] = size
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        if text is not None:
+            self.text_changed.emit(row)
+
+    def _rekey(self, row, key):
+        """
+        Updates the index after the key of ``row`` changed from ``key``.
+        """
+        new_key = self.key(row)
+        if self._keys is None or new_key == key:
+            return
+        if not self._unique_keys or new_key in self._keys:
+            self._invalidate_keys()
+            return
+        self._keys[new_key] = self._keys.pop(key)
+
+    def remove_row(self, row):
+        """
+        Removes the action at ``row``.
+        """
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        self._unavailable.discard(self.action_data(row))
+        self._tooltips.pop(self.key(row), None)
+        if self._directories[row] != -1:
+            self._directory_count -= 1
+        self._unindex_removed(row, row)
+        for column in self._columns():
+            del column[row]
+        self.endRemoveRows()
+
+    def move_row(self, row, destination):
+        """
+        Moves the action at ``row`` so that it ends up at ``destination``.
+        """
+        if row == destination:
+            return
+        # Qt expects the row before which the moved row is inserted, in the
+        # model before the move
+        self.beginMoveRows(QtCore.QModelIndex(), row, row,
+                           QtCore.QModelIndex(),
+                           destination + 1 if destination > row
+                           else destination)
+        for column in self._columns():
+            column.insert(destination, column.pop(row))
+        if self._keys is not None:
+            if not self._unique_keys:
+                self._invalidate_keys()
+            else:
+                self._sequences.pop(row)
+                sequence = self._new_sequences(destination, 1)
+                if sequence is None:
+                    self._invalidate_keys()
+                else:
+                    self._sequences.insert(destination, sequence[0])
+                    self._keys[self.key(destination)] = sequence[0]
+        self.endMoveRows()
+
+    def clear(self):
+        """
+        Removes all the actions.
+        """
+        self.beginResetModel()
+        self._texts, self._data, self._icon_ids, self._directories, \
+            self._timestamps, self._sizes = self._new_columns()
+        self._icons = []
+        self._icon_keys = {}
+        self._directory_table = []
+        self._directory_keys = {}
+        self._unavailable = set()
+        self._tooltips = {}
+        self._invalidate_keys()
+        self._directory_count = 0
+        self.endResetModel()
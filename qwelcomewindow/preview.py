@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Thumbnails of the recent files, shown in the welcome widget preview pane.
+
+Thumbnails are generated by a ThumbnailProvider in a pool of worker threads
+and cached on disk by ThumbnailCache, keyed by (path, mtime, size) so that a
+modified file gets a new thumbnail.
+"""
+import collections
+import hashlib
+import itertools
+import os
+import threading
+try:
+    import queue
+except ImportError:  # python 2
+    import Queue as queue
+from qwelcomewindow.qt import QtCore, QtGui
+
+
+class ThumbnailProvider(object):
+    """
+    Base class of the thumbnail providers.
+
+    thumbnail is called from the worker threads: it must be thread safe and
+    must only use QImage (QPixmap can only be used in the GUI thread).
+    """
+
+    def thumbnail(self, path, size):
+        """
+        Returns the thumbnail of a file.
+
+        :param path: File path
+        :param size: Maximum width and height of the thumbnail, in pixels
+        :return: QImage or None if the file has no thumbnail.
+        """
+        raise NotImplementedError()
+
+
+class ImageThumbnailProvider(ThumbnailProvider):
+    """
+    Thumbnails of the image files supported by Qt, decoded at the thumbnail
+    size when the image format allows it.
+    """
+
+    def thumbnail(self, path, size):
+        reader = QtGui.QImageReader(path)
+        if not reader.canRead():
+            return None
+        original = reader.size()
+        if original.isValid():
+            original.scale(size, size, QtCore.Qt.KeepAspectRatio)
+            reader.setScaledSize(original)
+        image = reader.read()
+        if image.isNull():
+            return None
+        return image
+
+
+class ThumbnailCache(object):
+    """
+    A size bounded, least recently used, disk cache of thumbnails (one PNG
+    file per thumbnail). Thread safe.
+    """
+    #: default maximum size of the cache, in bytes
+    MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, directory, max_bytes=MAX_BYTES):
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        #: file name -> file size, from the least to the most recently used
+        self._files = None
+        self._bytes = 0
+
+    @staticmethod
+    def key(path, mtime, size):
+        """
+        Returns the cache key of a file version.
+        """
+        return hashlib.sha1(("%s\0%r\0%d" % (path, mtime, size)).encode(
+            "utf-8", "replace")).hexdigest()
+
+    def _scan(self):
+        """
+        Lists the cached files, ordered by last use (file modification time).
+        """
+        files = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            names = []
+        for name in names:
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            files.append((stat.st_mtime, name, stat.st_size))
+        files.sort()
+        self._files = collections.OrderedDict(
+            (name, size) for _, name, size in files)
+        self._bytes = sum(self._files.values())
+
+    def get(self, key):
+        """
+        Returns the cached thumbnail or None.
+        """
+        name = key + ".png"
+        with self._lock:
+            if self._files is None:
+                self._scan()
+            if name not in self._files:
+                return None
+            self._files[name] = self._files.pop(name)
+        path = os.path.join(self.directory, name)
+        image = QtGui.QImage(path)
+        if image.isNull():
+            return None
+        try:
+            # records the use, for the next scan
+            os.utime(path, None)
+        except OSError:
+            pass
+        return image
+
+    def put(self, key, image):
+        """
+        Caches a thumbnail, evicting the least recently used ones if the cache
+        is full.
+        """
+        name = key + ".png"
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            if self._files is None:
+                self._scan()
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+        if not image.save(path + ".tmp", "PNG"):
+            return
+        size = os.path.getsize(path + ".tmp")
+        if os.name == "nt" and os.path.exists(path):
+            os.remove(path)
+        os.rename(path + ".tmp", path)
+        with self._lock:
+            self._bytes += size - self._files.pop(name, 0)
+            self._files[name] = size
+            while self._bytes > self.max_bytes and len(self._files) > 1:
+                evicted, evicted_size = self._files.popitem(last=False)
+                self._bytes -= evicted_size
+                try:
+                    os.remove(os.path.join(self.directory, evicted))
+                except OSError:
+                    pass
+
+
+class ThumbnailGenerator(QtCore.QObject):
+    """
+    Generates thumbnails in a pool of worker threads.
+
+    The last requested thumbnails are kept in memory, the others are cached
+    on disk (if a cache is set). Requests are served by priority, requests
+    that are not wanted anymore (see request) are dropped.
+
+    Call stop to stop the worker threads when the generator is not used
+    anymore.
+    """
+    #: Signal emitted when a thumbnail is available: (path, QImage or None)
+    thumbnail_ready = QtCore.Signal(str, object)
+    # emitted from the worker threads
+    _generated = QtCore.Signal(str, object)
+
+    #: number of thumbnails kept in memory
+    MEMORY_CACHE_SIZE = 32
+
+    def __init__(self, provider, cache=None, size=128, parent=None,
+                 max_workers=2):
+        """
+        :param provider: ThumbnailProvider
+        :param cache: ThumbnailCache, optional
+        :param size: Thumbnail size, in pixels
+        :param max_workers: Maximum number of worker threads
+        """
+        super(ThumbnailGenerator, self).__init__(parent)
+        self.provider = provider
+        self.cache = cache
+        self.size = size
+        self.max_workers = max_workers
+        self._images = collections.OrderedDict()
+        self._pending = set()
+        #: the paths whose thumbnail is still wanted by the GUI
+        self._wanted = frozenset()
+        self._queue = queue.PriorityQueue()
+        self._counter = itertools.count()
+        self._workers = []
+        self._generated.connect(self._on_generated)
+
+    def image(self, path, default=None):
+        """
+        Returns the thumbnail of ``path`` (None if the file has no thumbnail)
+        if it is in memory, else ``default``.
+        """
+        try:
+            image = self._images.pop(path)
+        except KeyError:
+            return default
+        self._images[path] = image
+        return image
+
+    def request(self, paths):
+        """
+        Requests the thumbnails of ``paths``, the first paths first. The
+        queued requests of the other paths are dropped.
+
+        thumbnail_ready is emitted for each path whose thumbnail is not in
+        memory.
+        """
+        self._wanted = frozenset(paths)
+        for priority, path in enumerate(paths):
+            if path in self._images or path in self._pending:
+                continue
+            self._pending.add(path)
+            if len(self._workers) < min(self.max_workers,
+                                        len(self._pending)):
+                worker = threading.Thread(target=self._work,
+                                          args=(self._queue, ))
+                worker.daemon = True
+                worker.start()
+                self._workers.append(worker)
+            self._queue.put((priority, next(self._counter), path))
+
+    def stop(self):
+        """
+        Stops the workers and drops the pending requests. Idle workers exit
+        immediately, the busy ones once their thumbnail is generated (it is
+        ignored).
+        """
+        for _ in self._workers:
+            # served before any request
+            self._queue.put((-1, next(self._counter), None))
+        # the stopped workers keep the old queue
+        self._queue = queue.PriorityQueue()
+        self._workers = []
+        self._pending.clear()
+        self._wanted = frozenset()
+
+    def _work(self, requests):
+        while True:
+            path = requests.get()[2]
+            if path is None:
+                return
+            if path not in self._wanted:
+                self._generated.emit(path, False)
+                continue
+            try:
+                image = self._generate(path)
+            except Exception:
+                image = None
+            self._generated.emit(path, image)
+
+    def _generate(self, path):
+        key = None
+        if self.cache is not None:
+            stat = os.stat(path)
+            key = self.cache.key(path, stat.st_mtime, stat.st_size)
+            image = self.cache.get(key)
+            if image is not None:
+                return image
+        image = self.provider.thumbnail(path, self.size)
+        if image is not None and key is not None:
+            self.cache.put(key, image)
+        return image
+
+    def _on_generated(self, path, image):
+        if path not in self._pending:
+            # stopped
+            return
+        self._pending.discard(path)
+        if image is False:
+            # dropped request
+            return
+        self._images[path] = image
+        while len(self._images) > self.MEMORY_CACHE_SIZE:
+            self._images.popitem(last=False)
+        self.thumbnail_ready.emit(path, image)
+
+
+class PreviewPane(QtGui.QLabel):
+    """
+    Shows the thumbnail of the current recent file.
+    """
+
+    def __init__(self, size=128, parent=None):
+        super(PreviewPane, self).__init__(parent)
+        self.setObjectName("lblPreview")
+        self.setAlignment(QtCore.Qt.AlignCenter)
+        self.setFixedWidth(size + 18)
+        self.setWordWrap(True)
+        self.set_image(None)
+
+    def set_image(self, image, text="No preview"):
+        """
+        Shows ``image`` (QImage), or ``text`` if image is None.
+        """
+        if image is None:
+            self.setPixmap(QtGui.QPixmap())
+            self.setText(text)
+        else:
+            self.setPixmap(QtGui.QPixmap.fromImage(image))
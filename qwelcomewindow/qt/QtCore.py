@@ -13,6 +13,9 @@
 Bindings independant QtCore module
 """
 import os
+import sys
+from qwelcomewindow.qt import promote_enums, setup_api
+setup_api()
 if os.environ['QT_API'] == 'pyqt':
     from PyQt4.QtCore import *
     from PyQt4.Qt import Qt
@@ -20,6 +23,33 @@ if os.environ['QT_API'] == 'pyqt':
     from PyQt4.QtCore import pyqtSlot as Slot
     from PyQt4.QtCore import pyqtProperty as Property
     from PyQt4.QtCore import QT_VERSION_STR as __version__
+elif os.environ['QT_API'] == 'pyqt5':
+    from PyQt5.QtCore import *
+    from PyQt5.QtCore import pyqtSignal as Signal
+    from PyQt5.QtCore import pyqtSlot as Slot
+    from PyQt5.QtCore import pyqtProperty as Property
+    from PyQt5.QtCore import QT_VERSION_STR as __version__
+elif os.environ['QT_API'] == 'pyqt6':
+    from PyQt6.QtCore import *
+    from PyQt6.QtCore import pyqtSignal as Signal
+    from PyQt6.QtCore import pyqtSlot as Slot
+    from PyQt6.QtCore import pyqtProperty as Property
+    from PyQt6.QtCore import QT_VERSION_STR as __version__
+    promote_enums(sys.modules[__name__])
+    QCoreApplication.exec_ = QCoreApplication.exec
+    QEventLoop.exec_ = QEventLoop.exec
+elif os.environ['QT_API'] == 'pyside2':
+    import PySide2.QtCore
+    __version__ = PySide2.QtCore.__version__
+    from PySide2.QtCore import *
+elif os.environ['QT_API'] == 'pyside6':
+    import PySide6.QtCore
+    __version__ = PySide6.QtCore.__version__
+    from PySide6.QtCore import *
+    promote_enums(sys.modules[__name__])
+    if not hasattr(QCoreApplication, "exec_"):
+        QCoreApplication.exec_ = QCoreApplication.exec
+        QEventLoop.exec_ = QEventLoop.exec
 else:
     import PySide.QtCore
     __version__ = PySide.QtCore.__version__
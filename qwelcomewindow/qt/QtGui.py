@@ -11,9 +11,45 @@
 #
 """
 Bindings independant QtGui module
+
+With Qt5 and Qt6, this module also exports the QtWidgets classes (the Qt4
+QtGui module was split into QtGui and QtWidgets).
 """
 import os
+import sys
+from qwelcomewindow.qt import promote_enums, setup_api
+setup_api()
 if os.environ['QT_API'] == 'pyqt':
     from PyQt4.QtGui import *
+elif os.environ['QT_API'] == 'pyqt5':
+    from PyQt5.QtGui import *
+    from PyQt5.QtWidgets import *
+elif os.environ['QT_API'] == 'pyqt6':
+    from PyQt6.QtGui import *
+    from PyQt6.QtWidgets import *
+    promote_enums(sys.modules[__name__])
+elif os.environ['QT_API'] == 'pyside2':
+    from PySide2.QtGui import *
+    from PySide2.QtWidgets import *
+elif os.environ['QT_API'] == 'pyside6':
+    from PySide6.QtGui import *
+    from PySide6.QtWidgets import *
+    promote_enums(sys.modules[__name__])
 else:
-    from PySide.QtGui import *
\ No newline at end of file
+    from PySide.QtGui import *
+
+if os.environ['QT_API'] in ('pyqt', 'pyside'):
+    # Qt5 API
+    QFontMetrics.horizontalAdvance = QFontMetrics.width
+
+    def _grab(self, rectangle=None):
+        if rectangle is None:
+            return QPixmap.grabWidget(self)
+        return QPixmap.grabWidget(self, rectangle)
+    QWidget.grab = _grab
+    del _grab
+if not hasattr(QApplication, "exec_"):
+    # Qt6 API
+    QApplication.exec_ = QApplication.exec
+    QDialog.exec_ = QDialog.exec
+    QMenu.exec_ = QMenu.exec
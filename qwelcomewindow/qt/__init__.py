@@ -10,15 +10,17 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 """
-Detects the qt bindings to use (PyQt4 or PySide)
+Detects the qt bindings to use (PyQt4, PySide, PyQt5, PySide2, PyQt6 or
+PySide6)
 
 If a specific qt bindings has already been imported or is specified in sys.argv,
 PCEF will use this bindings.
-Else PCEF will first try to import and use PyQt4, if it fails it will
-attempt to import and use PySide.
+Else PCEF will try to import the bindings in the above order and use the first
+one available.
 
-You can force to use one specific bindings by appending ["--pyside"] or
-["--pyqt"] to sys.argv::
+You can force to use one specific bindings by appending one of ["--pyqt"],
+["--pyside"], ["--pyqt5"], ["--pyside2"], ["--pyqt6"] or ["--pyside6"] to
+sys.argv::
 
     # force the use of pyside:
     import sys
@@ -26,6 +28,16 @@ You can force to use one specific bindings by appending ["--pyside"] or
     import pcef  # will use pyside
 
 
+The bindings are detected lazily, when QtCore or QtGui is first imported
+(importing the qt package itself is free). The QT_API environment variable
+is set to the bindings name: "pyqt", "pyside", "pyqt5", "pyside2", "pyqt6"
+or "pyside6".
+
+With Qt5 and Qt6, the QtWidgets classes are available from QtGui and the
+differences between the bindings (scoped enums, exec_, Signal/Slot,
+QFontMetrics.horizontalAdvance, QWidget.grab) are patched once, when the
+modules are imported: the shim adds no indirection to the calls.
+
 The qt package is automatically imported when importing pcef which other
 application to write qt bindings independant applications::
 
@@ -41,32 +53,102 @@ application to write qt bindings independant applications::
     editor.show()
     app.exec_()
 """
+import importlib
 import os
 import sys
-# check if a qt bindings has already been imported
-if "PyQt4" in sys.modules or "--pyqt" in sys.argv:
-    os.environ.setdefault("QT_API", "pyqt")
-elif "PySide" in sys.modules or "--pyside" in sys.argv:
-    os.environ.setdefault("QT_API", "pyside")
-else:
-    try:
-        import PyQt4
-    except ImportError:
-        # try pyside
-        try:
-            import PySide
-        except ImportError:
-            os.environ.setdefault("QT_API", None)
-            sys.exit(-1)
+
+#: (QT_API value, package name, command line flag), by order of preference
+BINDINGS = (
+    ("pyqt", "PyQt4", "--pyqt"),
+    ("pyside", "PySide", "--pyside"),
+    ("pyqt5", "PyQt5", "--pyqt5"),
+    ("pyside2", "PySide2", "--pyside2"),
+    ("pyqt6", "PyQt6", "--pyqt6"),
+    ("pyside6", "PySide6", "--pyside6"),
+)
+
+#: True once the bindings have been detected
+_api_set = False
+
+
+def package():
+    """
+    Returns the package name of the bindings in use (e.g. "PyQt5").
+    """
+    setup_api()
+    for api, name, flag in BINDINGS:
+        if api == os.environ["QT_API"]:
+            return name
+    raise ImportError("unknown QT_API: %r" % os.environ["QT_API"])
+
+
+def setup_api():
+    """
+    Detects the qt bindings to use and sets the QT_API environment variable
+    accordingly. The bindings are only detected once, the first time one of
+    the QtCore/QtGui modules is imported.
+
+    :raises ImportError: if no qt bindings is available.
+    """
+    global _api_set
+    if _api_set:
+        return
+    if "QT_API" not in os.environ:
+        # check if a qt bindings has already been imported or is forced
+        for api, name, flag in BINDINGS:
+            if name in sys.modules or flag in sys.argv:
+                os.environ["QT_API"] = api
+                break
         else:
-            os.environ.setdefault("QT_API", "pyside")
-    else:
-        os.environ.setdefault("QT_API", "pyqt")
-# setup pyqt api to version 2
-if os.environ["QT_API"] == "pyqt":
-    import sip
-    try:
-        sip.setapi("QString", 2)
-        sip.setapi("QVariant", 2)
-    except:
-        pass
\ No newline at end of file
+            for api, name, flag in BINDINGS:
+                try:
+                    importlib.import_module(name)
+                except ImportError:
+                    continue
+                os.environ["QT_API"] = api
+                break
+            else:
+                raise ImportError(
+                    "no qt bindings found, install one of %s" % ", ".join(
+                        name for api, name, flag in BINDINGS))
+    _api_set = True
+    # setup pyqt api to version 2
+    if os.environ["QT_API"] == "pyqt":
+        import sip
+        try:
+            sip.setapi("QString", 2)
+            sip.setapi("QVariant", 2)
+        except:
+            pass
+
+
+def promote_enums(module):
+    """
+    Makes the members of the scoped enums of the classes of ``module``
+    available from the classes themselves (Qt.AlignLeft instead of
+    Qt.AlignmentFlag.AlignLeft), as with the other bindings. Used for PyQt6
+    and PySide6.
+
+    The members are taken from __members__: iterating an enum skips the
+    aliases and, since Python 3.11, the composite flags (Qt.AlignCenter).
+    """
+    import enum
+    for cls in list(vars(module).values()):
+        if not isinstance(cls, type):
+            continue
+        for value in list(vars(cls).values()):
+            if isinstance(value, type) and issubclass(value, enum.Enum):
+                for name, member in list(value.__members__.items()):
+                    if name not in vars(cls):
+                        try:
+                            setattr(cls, name, member)
+                        except (AttributeError, TypeError):
+                            # read-only class
+                            break
+
+
+def __getattr__(name):
+    # QtCore and QtGui are imported on first access
+    if name in ("QtCore", "QtGui"):
+        return importlib.import_module("%s.%s" % (__name__, name))
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Frecency (frequency + recency) ranking of the recent actions.
+
+The frecency of an entry at time t is the sum of an exponential decay over
+its opening times t_i::
+
+    frecency(t) = sum(exp(-rate * (t - t_i)))
+                = exp(-rate * t) * sum(exp(rate * t_i))
+
+The first factor is the same for all the entries: entries are ordered by
+``log(sum(exp(rate * t_i)))`` which does not depend on t. The ranking never
+has to be recomputed as time passes, recording an opening only changes the
+value of one entry (a log-add-exp).
+"""
+import bisect
+import io
+import math
+import os
+import time
+
+
+class FrecencyRanker(object):
+    """
+    Ranks keys (e.g. recent files paths) by frecency.
+
+    Keys are kept in a sorted list (best ranked first): recording an opening
+    moves one key, found by a binary search.
+
+    The ranking state is a single float per key, it can be saved to and
+    loaded from a file (one ``<value>\\t<key>`` line per key).
+    """
+    #: default half life of an opening, in seconds (a week)
+    HALF_LIFE = 7 * 24 * 3600
+
+    def __init__(self, path=None, half_life=HALF_LIFE):
+        """
+        :param path: Path of the file the state is saved to, optional. The
+                     state is loaded from this file if it exists.
+        :param half_life: Time after which an opening weighs half as much as
+                          a new one, in seconds.
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self.rate = math.log(2) / half_life
+        #: key -> value
+        self._values = {}
+        #: sorted (-value, key) pairs
+        self._ranking = []
+        if self.path:
+            self.load()
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def keys(self):
+        """
+        Returns the keys, best ranked first.
+        """
+        return [key for _, key in self._ranking]
+
+    def value(self, key, default=float("-inf")):
+        """
+        Returns the (time independent) ranking value of ``key``: the higher,
+        the better.
+        """
+        return self._values.get(key, default)
+
+    def frecency(self, key, now=None):
+        """
+        Returns the frecency of ``key`` at ``now`` (default is now).
+        """
+        if now is None:
+            now = time.time()
+        return math.exp(self.value(key) - self.rate * now)
+
+    def rank(self, key):
+        """
+        Returns the rank of ``key`` (0 is the best), or -1 if it is unknown.
+        """
+        try:
+            item = (-self._values[key], key)
+        except KeyError:
+            return -1
+        return bisect.bisect_left(self._ranking, item)
+
+    def record(self, key, timestamp=None):
+        """
+        Records an opening of ``key`` at ``timestamp`` (default is now).
+
+        :return: the new rank of the key
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        value = self.rate * timestamp
+        previous = self._values.get(key)
+        if previous is not None:
+            self._remove(key, previous)
+            # log(exp(previous) + exp(value)), without overflow
+            high, low = max(previous, value), min(previous, value)
+            value = high + math.log1p(math.exp(low - high))
+        return self._insert(key, value)
+
+    def add(self, key, timestamp=None):
+        """
+        Adds ``key`` with a single opening at ``timestamp`` if it is unknown
+        (with no opening if timestamp is None).
+        """
+        if key not in self._values:
+            self._insert(key, float("-inf") if timestamp is None
+                         else self.rate * timestamp)
+
+    def remove(self, key):
+        """
+        Forgets ``key``.
+        """
+        value = self._values.get(key)
+        if value is not None:
+            self._remove(key, value)
+
+    def clear(self):
+        self._values = {}
+        self._ranking = []
+
+    def _insert(self, key, value):
+        self._values[key] = value
+        item = (-value, key)
+        rank = bisect.bisect_left(self._ranking, item)
+        self._ranking.insert(rank, item)
+        return rank
+
+    def _remove(self, key, value):
+        del self._values[key]
+        del self._ranking[bisect.bisect_left(self._ranking, (-value, key))]
+
+    def load(self, path=None):
+        """
+        Loads the ranking state (replaces the current state).
+        """
+        path = path or self.path
+        values = {}
+        try:
+            with io.open(path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except (IOError, OSError):
+            lines = []
+        for line in lines:
+            value, sep, key = line.partition("\t")
+            if not sep:
+                continue
+            try:
+                values[key] = float(value)
+            except ValueError:
+                continue
+        self._values = values
+        self._ranking = sorted((-value, key) for key, value in values.items())
+
+    def save(self, path=None):
+        """
+        Saves the ranking state.
+        """
+        path = path or self.path
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        tmp_path = path + ".tmp"
+        with io.open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(u"".join(u"%r\t%s\n" % (-value, key)
+                             for value, key in self._ranking))
+        if os.name == "nt" and os.path.exists(path):
+            os.remove(path)
+        os.rename(tmp_path, path)
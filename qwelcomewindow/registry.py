@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Registry of quick start actions.
+
+A quick start action is declared with an id, a label, an optional icon and
+the dotted path of its handler ("package.module:function" or
+"package.module.function"). The handler module is only imported when the
+action is triggered for the first time, the time spent importing it is
+recorded (see QuickStartRegistry.import_report).
+
+Actions can also be declared by other distributions, with an entry point of
+the "qwelcomewindow.quick_start" group that refers to a list of declarations
+(or to a callable returning such a list)::
+
+    entry_points={'qwelcomewindow.quick_start': [
+        'myplugin = myplugin.quick_start:ACTIONS']}
+
+The declaration module is imported when the registry discovers the entry
+points, it should not import the handler modules.
+"""
+import collections
+import importlib
+import sys
+import time
+
+#: entry point group of the quick start action declarations
+ENTRY_POINT_GROUP = "qwelcomewindow.quick_start"
+
+
+def _entry_points(group):
+    """
+    Returns the installed entry points of ``group``.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:
+        import pkg_resources
+        return list(pkg_resources.iter_entry_points(group))
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=group))
+    return list(entry_points.get(group, []))
+
+
+class QuickStartAction(object):
+    """
+    A quick start action declaration.
+    """
+    __slots__ = ("id", "label", "icon", "handler", "description", "function",
+                 "import_time", "modules")
+
+    def __init__(self, action_id, label, icon=None, handler=None,
+                 description=None):
+        """
+        :param action_id: Unique id of the action
+        :param label: Text displayed in the quick start list
+        :param icon: QIcon or icon key, optional
+        :param handler: Dotted path of the handler or callable, optional.
+                        The handler is called with the widget that triggered
+                        the action (None if the action was triggered with
+                        QuickStartRegistry.trigger).
+        :param description: Tooltip of the action, optional
+        """
+        self.id = action_id
+        self.label = label
+        self.icon = icon
+        self.handler = handler
+        self.description = description
+        #: the handler, once loaded
+        self.function = handler if callable(handler) else None
+        #: time spent importing the handler, in seconds (None if it is not
+        #: loaded yet)
+        self.import_time = 0.0 if self.function is not None else None
+        #: number of modules imported by the handler import
+        self.modules = 0
+
+    def load(self):
+        """
+        Imports the handler (once) and returns it.
+
+        :raises ImportError: if the handler module cannot be imported
+        :raises AttributeError: if the handler is not defined in its module
+        """
+        if self.function is None:
+            path = self.handler
+            if ":" in path:
+                module_name, _, name = path.partition(":")
+            else:
+                module_name, _, name = path.rpartition(".")
+            modules = len(sys.modules)
+            start = time.time()
+            module = importlib.import_module(module_name)
+            function = module
+            for attribute in name.split("."):
+                function = getattr(function, attribute)
+            self.import_time = time.time() - start
+            self.modules = len(sys.modules) - modules
+            self.function = function
+        return self.function
+
+
+class QuickStartRegistry(object):
+    """
+    Maps quick start action ids to their declaration and dispatches the
+    triggered actions to their handlers. The id is the user data of the
+    widget action: dispatching does not depend on the (possibly duplicated)
+    labels.
+
+    Usage::
+
+        registry = QuickStartRegistry()
+        registry.register("help", "Help", help_icon, "myapp.help:show")
+        registry.discover()
+        registry.bind(widget)
+    """
+
+    def __init__(self):
+        #: actions by id, in declaration order
+        self._actions = collections.OrderedDict()
+        #: the bound widgets
+        self._widgets = []
+
+    def __len__(self):
+        return len(self._actions)
+
+    def __contains__(self, action_id):
+        return action_id in self._actions
+
+    def actions(self):
+        """
+        Returns the declared actions, in declaration order.
+        """
+        return list(self._actions.values())
+
+    def action(self, action_id):
+        """
+        Returns the action declared with the id ``action_id``.
+
+        :raises KeyError: if there is no such action
+        """
+        return self._actions[action_id]
+
+    def register(self, action_id, label, icon=None, handler=None,
+                 description=None):
+        """
+        Declares a quick start action, the actions added after the registry
+        has been bound to a widget are added to the widget too.
+
+        :param action_id: Unique id of the action
+        :param label: Text displayed in the quick start list
+        :param icon: QIcon or icon key, optional
+        :param handler: Dotted path of the handler or callable, optional.
+        :param description: Tooltip of the action, optional
+
+        :raises ValueError: if an action with the same id is already
+                            declared
+        """
+        if action_id in self._actions:
+            raise ValueError("duplicate quick start action: %r" % action_id)
+        action = QuickStartAction(action_id, label, icon, handler,
+                                  description)
+        self._actions[action_id] = action
+        for widget in self._widgets:
+            self._add(widget, action)
+        return action
+
+    def discover(self, group=ENTRY_POINT_GROUP):
+        """
+        Registers the actions declared by the entry points of ``group``.
+
+        Each entry point refers to a list of declarations (or a callable
+        returning such a list), a declaration is a QuickStartAction, a dict
+        of QuickStartAction arguments or a tuple (id, label, icon, handler,
+        description), the last items being optional.
+
+        :return: the number of registered actions
+        """
+        count = 0
+        for entry_point in _entry_points(group):
+            declarations = entry_point.load()
+            if callable(declarations):
+                declarations = declarations()
+            for declaration in declarations:
+                if isinstance(declaration, QuickStartAction):
+                    declaration = (declaration.id, declaration.label,
+                                   declaration.icon, declaration.handler,
+                                   declaration.description)
+                if isinstance(declaration, dict):
+                    self.register(**declaration)
+                else:
+                    self.register(*declaration)
+                count += 1
+        return count
+
+    def set_label(self, action_id, label):
+        """
+        Changes the label of an action (in the bound widgets too).
+
+        :raises KeyError: if there is no such action
+        """
+        action = self.action(action_id)
+        action.label = label
+        for widget in self._widgets:
+            widget.update_action(action.id, text=label,
+                                 action_type=widget.ActionType.QuickStart)
+
+    def trigger(self, action_id, widget=None):
+        """
+        Calls the handler of an action, the handler is imported the first
+        time the action is triggered.
+
+        :param action_id: Action id
+        :param widget: Widget passed to the handler
+
+        :raises KeyError: if there is no such action
+        """
+        action = self.action(action_id)
+        if action.handler is None:
+            return None
+        return action.load()(widget)
+
+    def bind(self, widget):
+        """
+        Adds the declared actions to the quick start list of ``widget`` and
+        dispatches its quick_start_data_triggered signal by action id. The
+        quick start actions that are not declared in the registry are
+        ignored.
+
+        :type widget: qwelcomewindow.QWelcomeWidget
+        """
+        for action in self._actions.values():
+            self._add(widget, action)
+        self._widgets.append(widget)
+
+        def dispatch(label, action_id):
+            if action_id in self._actions:
+                self.trigger(action_id, widget)
+
+        widget.quick_start_data_triggered.connect(dispatch)
+
+    @staticmethod
+    def _add(widget, action):
+        # the id is the user data, i.e. the key of the widget action. It is
+        # internal: the tooltip is the description (none by default)
+        widget.add_action(widget.ActionType.QuickStart, action.label,
+                          action.icon, action.id)
+        widget.set_action_tooltip(action.id, action.description or "",
+                                  widget.ActionType.QuickStart)
+
+    def import_report(self):
+        """
+        Returns the import cost of the action handlers, most expensive
+        first: a list of dict with the keys "id", "handler", "loaded",
+        "import_time" (seconds) and "modules" (number of modules imported).
+        """
+        report = [{"id": action.id, "handler": action.handler
+                   if not callable(action.handler) else repr(action.handler),
+                   "loaded": action.function is not None,
+                   "import_time": action.import_time,
+                   "modules": action.modules}
+                  for action in self._actions.values()
+                  if action.handler is not None]
+        report.sort(key=lambda entry: -(entry["import_time"] or 0.0))
+        return report
@@ -0,0 +1,465 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Incremental search over the recent actions.
+
+The SearchIndex keeps two precomputed, lower case search corpora: the action
+texts and the action data (usually paths), one line per row, with the offset
+of each line. A query is matched by scanning the corpora at C speed (regular
+expressions); match offsets are mapped back to rows with a binary search, so
+only the matching rows are ever touched from Python and the scan stops as
+soon as enough results have been collected.
+
+The index follows the changes of the rows in place: appended rows are
+queued, inserted, removed and moved rows (and changed texts) are spliced
+into the corpora. A splice copies the corpora (string slicing) and shifts
+the offsets of the following rows, it is O(rows) but does not call back
+into the model; only a model reset or a reordering rebuilds the index.
+"""
+import bisect
+import re
+from array import array
+from qwelcomewindow.qt import QtCore
+
+
+class _Corpus(object):
+    """
+    A lower case text corpus, one line per row. Every line is preceded by a
+    new line character, so that "\\n" + term matches the lines starting with
+    term.
+    """
+
+    def __init__(self):
+        #: lines appended since the corpus was last joined
+        self.pending = []
+        #: the corpus
+        self.text = "\n"
+        #: offset of each line
+        self.offsets = array("i")
+        #: length of the corpus including the pending lines
+        self.length = 1
+
+    @staticmethod
+    def normalize(line):
+        return line.replace("\n", " ").lower() + "\n"
+
+    def add(self, line):
+        line = self.normalize(line)
+        self.offsets.append(self.length)
+        self.length += len(line)
+        self.pending.append(line)
+
+    def _shift(self, row, delta):
+        offsets = self.offsets
+        if row < len(offsets):
+            offsets[row:] = array("i", [offset + delta
+                                        for offset in offsets[row:]])
+
+    def cut(self, first, last):
+        """
+        Removes the lines of the rows ``first`` to ``last`` and returns them
+        (normalized, see paste).
+        """
+        self.join()
+        offsets = self.offsets
+        start = offsets[first]
+        end = offsets[last + 1] if last + 1 < len(offsets) else len(self.text)
+        chunk = self.text[start:end]
+        self.text = self.text[:start] + self.text[end:]
+        self.length -= len(chunk)
+        del offsets[first:last + 1]
+        self._shift(first, -len(chunk))
+        return chunk
+
+    def paste(self, row, chunk):
+        """
+        Inserts normalized lines (as returned by cut) before ``row``.
+        """
+        self.join()
+        offsets = self.offsets
+        position = offsets[row] if row < len(offsets) else len(self.text)
+        self.text = self.text[:position] + chunk + self.text[position:]
+        self.length += len(chunk)
+        self._shift(row, len(chunk))
+        inserted = array("i")
+        for line in chunk.split("\n")[:-1]:
+            inserted.append(position)
+            position += len(line) + 1
+        offsets[row:row] = inserted
+
+    def join(self):
+        if self.pending:
+            self.text += "".join(self.pending)
+            self.pending = []
+
+    def line(self, row):
+        return self.text[self.offsets[row]:self.text.index(
+            "\n", self.offsets[row])]
+
+    def find_rows(self, needle, row=0):
+        """
+        Yields the rows containing ``needle``, from ``row``, in order, once,
+        with their line. A needle starting with a new line matches the rows
+        starting with the rest of the needle.
+        """
+        offsets = self.offsets
+        if row >= len(offsets):
+            return
+        text = self.text
+        find_row = bisect.bisect_right
+        # a needle starting with a new line matches the start of the next row
+        shift = 1 if needle.startswith("\n") else 0
+        # a match extends to the end of the row, so that each row is matched
+        # once (the regular expression scan is also faster than str.find)
+        pattern = re.compile(re.escape(needle) + "[^\n]*")
+        for match in pattern.finditer(text, offsets[row] - shift):
+            row = find_row(offsets, match.start() + shift) - 1
+            yield row, text[offsets[row]:match.end()]
+
+    def rows(self, pattern):
+        """
+        Yields the rows matching a regular expression, in order, once.
+        """
+        offsets = self.offsets
+        find_row = bisect.bisect_right
+        last = -1
+        for match in pattern.finditer(self.text):
+            row = find_row(offsets, match.start()) - 1
+            if row != last:
+                last = row
+                yield row
+
+
+class SearchIndex(object):
+    """
+    A search index over a list of (text, data) entries, addressed by row.
+
+    Rows are appended with add, inserted, removed, moved or replaced with
+    insert, remove, move and replace (see the module documentation for
+    their cost). Other changes require a rebuild (see invalidate).
+
+    Results are ranked by match quality then by row, the first rows being
+    considered as the most recent ones:
+        - entries whose text starts with the query
+        - entries whose text contains the query
+        - entries whose data contains the query
+        - entries whose text contains the query letters in order (fuzzy
+          match), only when there is no better match
+
+    When the query has several terms, the rarest one (estimated on the first
+    SAMPLE characters of the texts) is used for ranking and the rows
+    containing it are checked for the other terms: a query made of frequent
+    terms that are rarely found together checks many rows.
+    """
+
+    #: default maximum number of results (a few screens of rows: the work
+    #: done per keystroke grows with the number of results)
+    LIMIT = 200
+    #: length of the texts corpus sample used to estimate the selectivity of
+    #: the query terms
+    SAMPLE = 1 << 16
+
+    def __init__(self):
+        self._texts = _Corpus()
+        self._data = _Corpus()
+        #: True if the index must be rebuilt before the next search
+        self.dirty = False
+
+    def __len__(self):
+        return len(self._texts.offsets)
+
+    def add(self, text, data=None):
+        """
+        Indexes a new entry (its row is the current length of the index).
+
+        :param text: Entry text
+        :param data: Entry data, indexed if it is a string.
+        """
+        text = text or ""
+        self._texts.add(text)
+        self._data.add(data if isinstance(data, type(text)) else "")
+
+    def insert(self, row, entries):
+        """
+        Indexes new entries inserted before ``row``.
+
+        :param entries: list of (text, data)
+        """
+        normalize = _Corpus.normalize
+        texts = []
+        data = []
+        for text, value in entries:
+            text = text or ""
+            texts.append(normalize(text))
+            data.append(normalize(value if isinstance(value, type(text))
+                                  else ""))
+        self._texts.paste(row, "".join(texts))
+        self._data.paste(row, "".join(data))
+
+    def remove(self, first, last):
+        """
+        Removes the entries ``first`` to ``last``.
+        """
+        self._texts.cut(first, last)
+        self._data.cut(first, last)
+
+    def move(self, start, end, destination):
+        """
+        Moves the entries ``start`` to ``end`` before ``destination`` (a row
+        before the move, as in QAbstractItemModel.beginMoveRows).
+        """
+        if destination > end:
+            destination -= end - start + 1
+        for corpus in (self._texts, self._data):
+            corpus.paste(destination, corpus.cut(start, end))
+
+    def replace(self, row, text, data=None):
+        """
+        Replaces the entry at ``row``.
+        """
+        self.remove(row, row)
+        self.insert(row, [(text, data)])
+
+    def clear(self):
+        """
+        Removes all the entries.
+        """
+        self.__init__()
+
+    def invalidate(self):
+        """
+        Marks the index as dirty: it must be rebuilt by the owner.
+        """
+        self.dirty = True
+
+    def search(self, query, limit=LIMIT):
+        """
+        Returns the ranked rows matching ``query``.
+
+        :param query: Search string, whitespace separated terms must all
+                      match.
+        :param limit: Maximum number of results
+        :return: list of rows, None for an empty query.
+        """
+        terms = query.lower().split()
+        if not terms:
+            return None
+        # the fuzzy match uses the letters in the query order
+        letters = "".join(terms)
+        texts = self._texts
+        data = self._data
+        texts.join()
+        data.join()
+        if len(terms) > 1:
+            # drive the search with the most selective term, estimated on
+            # the start of the texts corpus: counting the whole corpus would
+            # cost a scan per term and keystroke
+            terms.sort(key=lambda t: (texts.text.count(t, 0, self.SAMPLE),
+                                      -len(t)))
+        term = terms[0]
+        others = terms[1:]
+
+        def accepted(row, text, value=None):
+            # the other terms must be in the text or the data of the row
+            for other in others:
+                if other not in text:
+                    if value is None:
+                        value = data.line(row)
+                    if other not in value:
+                        return False
+            return True
+
+        # the texts are scanned once: the rows starting with the term rank
+        # first, then the rows containing it. Once there are enough rows,
+        # only the rows starting with the term are looked for.
+        starting = []
+        containing = []
+        resume = None
+        # the rows whose text contains the term, accepted or not
+        seen = set()
+        for row, line in texts.find_rows(term):
+            seen.add(row)
+            if not accepted(row, line):
+                continue
+            if line.startswith(term):
+                starting.append(row)
+                if len(starting) >= limit:
+                    return starting
+            else:
+                containing.append(row)
+            if len(starting) + len(containing) >= limit:
+                resume = row + 1
+                break
+        if resume is not None:
+            for row, line in texts.find_rows("\n" + term, resume):
+                if accepted(row, line):
+                    starting.append(row)
+                    if len(starting) >= limit:
+                        return starting
+        rows = (starting + containing)[:limit]
+        if len(rows) < limit:
+            # all the rows whose text contains the term have been seen
+            for row, line in data.find_rows(term):
+                if row not in seen and accepted(row, texts.line(row), line):
+                    rows.append(row)
+                    if len(rows) >= limit:
+                        return rows
+        if not rows:
+            # fuzzy match, each gap excludes the next letter so that the
+            # scan never backtracks
+            pattern = re.escape(letters[0]) + "".join(
+                "[^\n%s]*%s" % (re.escape(c), re.escape(c))
+                for c in letters[1:])
+            for row in texts.rows(re.compile(pattern)):
+                rows.append(row)
+                if len(rows) >= limit:
+                    break
+        return rows
+
+
+class RecentActionsFilterModel(QtCore.QAbstractListModel):
+    """
+    Presents a subset of the rows of a RecentActionsModel, in the order of a
+    search result.
+    """
+
+    def __init__(self, source, parent=None):
+        super(RecentActionsFilterModel, self).__init__(parent)
+        self._source = source
+        self._rows = []
+        source.dataChanged.connect(self._on_source_data_changed)
+
+    def source_model(self):
+        return self._source
+
+    def set_rows(self, rows):
+        """
+        Sets the source rows to present.
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        return self._source.data(
+            self._source.index(self._rows[index.row()]), role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return super(RecentActionsFilterModel, self).flags(index)
+        return self._source.flags(
+            self._source.index(self._rows[index.row()]))
+
+    def _on_source_data_changed(self, *args):
+        if self._rows:
+            self.dataChanged.emit(self.index(0),
+                                  self.index(len(self._rows) - 1))
+
+
+class RecentActionsSearch(QtCore.QObject):
+    """
+    Keeps a SearchIndex in sync with a RecentActionsModel and filters it.
+
+    Inserted, removed and moved rows and changed texts are applied to the
+    index in place. A reset or a reordering of the source model triggers a
+    rebuild of the index on the next search.
+    """
+    #: Signal emitted when the search results changed because the source
+    #: model changed
+    results_changed = QtCore.Signal()
+
+    def __init__(self, source, parent=None):
+        super(RecentActionsSearch, self).__init__(parent)
+        self._source = source
+        self.index = SearchIndex()
+        self.filter_model = RecentActionsFilterModel(source, self)
+        self.query = ""
+        self._rebuild()
+        source.rowsInserted.connect(self._on_rows_inserted)
+        source.rowsRemoved.connect(self._on_rows_removed)
+        source.rowsMoved.connect(self._on_rows_moved)
+        source.modelReset.connect(self._invalidate)
+        source.layoutChanged.connect(self._invalidate)
+        source.text_changed.connect(self._on_text_changed)
+
+    def search(self, query):
+        """
+        Filters the source model, the results are presented by filter_model.
+
+        :param query: Search string
+        :return: True if the query is not empty (the filter model should be
+                 displayed).
+        """
+        self.query = query
+        if self.index.dirty:
+            self._rebuild()
+        rows = self.index.search(query)
+        if rows is None:
+            self.filter_model.set_rows([])
+            return False
+        self.filter_model.set_rows(rows)
+        return True
+
+    def _rebuild(self):
+        self.index.clear()
+        self._index_rows(0, self._source.rowCount() - 1)
+
+    def _index_rows(self, first, last):
+        add = self.index.add
+        text = self._source.text
+        action_data = self._source.action_data
+        for row in range(first, last + 1):
+            add(text(row), action_data(row))
+
+    def _on_rows_inserted(self, parent, first, last):
+        if not self.index.dirty:
+            if first == len(self.index):
+                self._index_rows(first, last)
+            else:
+                text = self._source.text
+                action_data = self._source.action_data
+                self.index.insert(first, [(text(row), action_data(row))
+                                          for row in range(first, last + 1)])
+        self._refresh()
+
+    def _on_rows_removed(self, parent, first, last):
+        if not self.index.dirty:
+            self.index.remove(first, last)
+        self._refresh()
+
+    def _on_rows_moved(self, parent, start, end, destination_parent,
+                       destination):
+        if not self.index.dirty:
+            self.index.move(start, end, destination)
+        self._refresh()
+
+    def _on_text_changed(self, row):
+        if not self.index.dirty:
+            self.index.replace(row, self._source.text(row),
+                               self._source.action_data(row))
+        self._refresh()
+
+    def _invalidate(self, *args):
+        self.index.invalidate()
+        self._refresh()
+
+    def _refresh(self):
+        if self.query:
+            self.search(self.query)
+            self.results_changed.emit()
@@ -0,0 +1,437 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Sectioned presentation of the recent actions.
+
+Recent actions are grouped into collapsible sections (pinned, today, this
+week, older or by directory), each section is presented as a header row
+followed by its actions when it is expanded. A collapsed section only
+presents its header: the view never sees its actions.
+"""
+import bisect
+import os
+import time
+from qwelcomewindow.qt import QtCore
+
+
+class TimeGrouping(object):
+    """
+    Groups the recent actions by last opening time: today, this week (the
+    last 7 days) and older.
+    """
+    #: (name, title, expanded by default) of the sections, in display order
+    SECTIONS = (("today", "Today", True),
+                ("week", "This week", True),
+                ("older", "Older", False))
+
+    def __init__(self):
+        self.update()
+
+    def update(self):
+        """
+        Recomputes the time boundaries (e.g. when the day changed).
+        """
+        now = time.localtime()
+        self._today = time.mktime((now.tm_year, now.tm_mon, now.tm_mday,
+                                   0, 0, 0, 0, 0, -1))
+        self._week = self._today - 6 * 24 * 3600
+
+    def sections(self):
+        return self.SECTIONS
+
+    def section(self, model, row):
+        """
+        Returns the (name, title, expanded by default) of the section of
+        ``row`` of the source ``model``.
+        """
+        timestamp = model.data(model.index(row), model.TimestampRole) or 0
+        if timestamp >= self._today:
+            return self.SECTIONS[0]
+        if timestamp >= self._week:
+            return self.SECTIONS[1]
+        return self.SECTIONS[2]
+
+
+class DirectoryGrouping(object):
+    """
+    Groups the recent actions by directory, the sections are collapsed by
+    default.
+    """
+
+    def update(self):
+        pass
+
+    def sections(self):
+        return ()
+
+    def section(self, model, row):
+        directory = model.data(model.index(row), model.DirectoryRole)
+        if directory is None:
+            data = model.action_data(row)
+            directory = os.path.dirname(data) if data else ""
+        return (u"dir:" + directory, directory or u"Other", False)
+
+
+class _Section(object):
+    __slots__ = ("name", "title", "rows", "expanded")
+
+    def __init__(self, name, title, expanded):
+        self.name = name
+        self.title = title
+        #: source rows, sorted
+        self.rows = []
+        self.expanded = expanded
+
+
+class SectionedRecentsModel(QtCore.QAbstractListModel):
+    """
+    Presents the rows of a RecentActionsModel grouped into sections.
+
+    The pinned actions are presented in a first section. The section
+    membership (sorted lists of source rows) is maintained incrementally
+    when the source rows are inserted, removed, moved or changed one by one.
+
+    The persistent indexes (current and selected rows) are anchored to their
+    action keys when the source is about to change, and restored once it
+    changed.
+    """
+    #: item data role telling whether a row is a section header (bool)
+    HeaderRole = QtCore.Qt.UserRole + 10
+    #: item data role of the expansion state of a section header (bool)
+    ExpandedRole = QtCore.Qt.UserRole + 11
+
+    PINNED = ("pinned", "Pinned", True)
+
+    def __init__(self, source, grouping=None, pinned=None, parent=None):
+        """
+        :param source: RecentActionsModel
+        :param grouping: TimeGrouping (default) or DirectoryGrouping
+        :param pinned: set of the pinned action keys, shared with the caller
+        """
+        super(SectionedRecentsModel, self).__init__(parent)
+        self._source = source
+        self.grouping = grouping or TimeGrouping()
+        self.pinned = pinned if pinned is not None else set()
+        self._sections = {}
+        #: visible (non empty) sections in display order
+        self._visible = []
+        #: proxy row of the header of each visible section
+        self._offsets = []
+        #: persistent indexes and their anchors, while the source changes
+        self._persistent = None
+        self._anchors = None
+        self._regroup()
+        for signal in (source.modelAboutToBeReset,
+                       source.layoutAboutToBeChanged,
+                       source.rowsAboutToBeInserted,
+                       source.rowsAboutToBeRemoved,
+                       source.rowsAboutToBeMoved):
+            signal.connect(self._on_source_about_to_change)
+        source.modelReset.connect(self._on_source_reset)
+        source.layoutChanged.connect(self._on_source_reset)
+        source.rowsInserted.connect(self._on_rows_inserted)
+        source.rowsRemoved.connect(self._on_rows_removed)
+        source.rowsMoved.connect(self._on_rows_moved)
+        source.dataChanged.connect(self._on_data_changed)
+
+    def source_model(self):
+        return self._source
+
+    # -- sections
+    def _section_info(self, row):
+        if self._source.key(row) in self.pinned:
+            return self.PINNED
+        return self.grouping.section(self._source, row)
+
+    def _section(self, info):
+        name, title, expanded = info
+        try:
+            return self._sections[name]
+        except KeyError:
+            section = _Section(name, title, expanded)
+            self._sections[name] = section
+            return section
+
+    def _order(self):
+        order = [self.PINNED[0]] + [
+            name for name, title, expanded in self.grouping.sections()]
+        known = set(order)
+        # dynamic sections (directories) are sorted by name
+        return order + sorted(name for name in self._sections
+                              if name not in known)
+
+    def _update_offsets(self):
+        self._visible = [self._sections[name] for name in self._order()
+                         if name in self._sections and
+                         self._sections[name].rows]
+        self._offsets = []
+        offset = 0
+        for section in self._visible:
+            self._offsets.append(offset)
+            offset += 1 + (len(section.rows) if section.expanded else 0)
+        self._count = offset
+
+    def _locate(self, row):
+        """
+        Returns the (section, position) of a proxy row, position is -1 for
+        the section header.
+        """
+        i = bisect.bisect_right(self._offsets, row) - 1
+        return self._visible[i], row - self._offsets[i] - 1
+
+    def _proxy_row(self, section, position=-1):
+        return self._offsets[self._visible.index(section)] + 1 + position
+
+    def _regroup(self):
+        expanded = dict((name, section.expanded)
+                        for name, section in self._sections.items())
+        self._sections = {}
+        for row in range(self._source.rowCount()):
+            self._section(self._section_info(row)).rows.append(row)
+        for name, section in self._sections.items():
+            section.expanded = expanded.get(name, section.expanded)
+        self._update_offsets()
+
+    def regroup(self):
+        """
+        Recomputes the sections of all the rows (e.g. when the day changed).
+        """
+        self.grouping.update()
+        self._relayout(self._regroup)
+
+    def _relayout(self, change):
+        """
+        Applies a structural change, keeping the persistent indexes (current
+        and selected rows) on the same actions.
+        """
+        self._about_to_relayout()
+        self._apply_relayout(change)
+
+    def _about_to_relayout(self):
+        """
+        Anchors the persistent indexes to their actions, the source rows
+        must still be the ones the sections refer to.
+        """
+        self.layoutAboutToBeChanged.emit()
+        self._persistent = self.persistentIndexList()
+        self._anchors = [self._anchor(index.row())
+                         for index in self._persistent]
+
+    def _apply_relayout(self, change):
+        """
+        Applies ``change`` and restores the anchored persistent indexes.
+        """
+        if self._persistent is None:
+            # the source changed without notice: nothing is anchored
+            self.layoutAboutToBeChanged.emit()
+            self._persistent, self._anchors = [], []
+        persistent, anchors = self._persistent, self._anchors
+        self._persistent = self._anchors = None
+        change()
+        self._update_offsets()
+        self.changePersistentIndexList(
+            persistent, [self._index(anchor) for anchor in anchors])
+        self.layoutChanged.emit()
+
+    def _anchor(self, row):
+        section, position = self._locate(row)
+        if position == -1:
+            return section.name, None
+        return section.name, self._source.key(section.rows[position])
+
+    def _index(self, anchor):
+        name, key = anchor
+        section = self._sections.get(name)
+        if key is not None:
+            row = self._source.row(key)
+            if row == -1:
+                return QtCore.QModelIndex()
+            section = self._section_of(row)
+            if section is not None and section.expanded and \
+                    section in self._visible:
+                return self.index(self._proxy_row(
+                    section, bisect.bisect_left(section.rows, row)))
+        if section is not None and section in self._visible:
+            return self.index(self._proxy_row(section))
+        return QtCore.QModelIndex()
+
+    def is_header(self, index):
+        return self._locate(index.row())[1] == -1
+
+    def source_row(self, index):
+        """
+        Returns the source row of ``index``, -1 for a section header.
+        """
+        section, position = self._locate(index.row())
+        return -1 if position == -1 else section.rows[position]
+
+    def set_expanded(self, index, expanded):
+        """
+        Expands or collapses the section of the header ``index``: the
+        section actions are inserted or removed from the presented rows.
+        """
+        section, position = self._locate(index.row())
+        if section.expanded == expanded or not section.rows:
+            return
+        first = index.row() + 1
+        last = first + len(section.rows) - 1
+        if expanded:
+            self.beginInsertRows(QtCore.QModelIndex(), first, last)
+        else:
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+        section.expanded = expanded
+        self._update_offsets()
+        if expanded:
+            self.endInsertRows()
+        else:
+            self.endRemoveRows()
+        self.dataChanged.emit(index, index)
+
+    def toggle(self, index):
+        section, position = self._locate(index.row())
+        self.set_expanded(index, not section.expanded)
+
+    def set_pinned(self, key, pinned):
+        """
+        Pins (or unpins) the action ``key``: the action is moved to (or out
+        of) the pinned section.
+        """
+        if pinned:
+            self.pinned.add(key)
+        else:
+            self.pinned.discard(key)
+        row = self._source.row(key)
+        if row != -1:
+            self._reassign(row)
+
+    def _section_of(self, row):
+        """
+        Returns the section that holds the source ``row``, or None.
+        """
+        for section in self._sections.values():
+            position = bisect.bisect_left(section.rows, row)
+            if position < len(section.rows) and section.rows[position] == row:
+                return section
+        return None
+
+    def _reassign(self, row):
+        """
+        Moves a source row to its section, if it changed.
+        """
+        new = self._section(self._section_info(row))
+        old = self._section_of(row)
+        if old is new:
+            return False
+
+        def change():
+            if old is not None:
+                del old.rows[bisect.bisect_left(old.rows, row)]
+            bisect.insort(new.rows, row)
+        self._relayout(change)
+        return True
+
+    # -- source changes
+    def _on_source_about_to_change(self, *args):
+        self._about_to_relayout()
+
+    def _on_source_reset(self, *args):
+        self.grouping.update()
+        self._apply_relayout(self._regroup)
+
+    def _on_rows_inserted(self, parent, first, last):
+        count = last - first + 1
+
+        def change():
+            for section in self._sections.values():
+                section.rows = [r + count if r >= first else r
+                                for r in section.rows]
+            for row in range(first, last + 1):
+                bisect.insort(self._section(self._section_info(row)).rows,
+                              row)
+        self._apply_relayout(change)
+
+    def _on_rows_removed(self, parent, first, last):
+        count = last - first + 1
+
+        def change():
+            for section in self._sections.values():
+                section.rows = [r - count if r > last else r
+                                for r in section.rows
+                                if not first <= r <= last]
+        self._apply_relayout(change)
+
+    def _on_rows_moved(self, parent, start, end, destination_parent,
+                       destination):
+        count = end - start + 1
+
+        def moved(row):
+            # destination is the row before which the block is inserted,
+            # before the move
+            if start <= row <= end:
+                if destination > end:
+                    return row - start + destination - count
+                return row - start + destination
+            if end < row < destination:
+                return row - count
+            if destination <= row < start:
+                return row + count
+            return row
+
+        def change():
+            for section in self._sections.values():
+                section.rows = sorted(moved(r) for r in section.rows)
+        self._apply_relayout(change)
+
+    def _on_data_changed(self, top_left, bottom_right, *args):
+        top, bottom = top_left.row(), bottom_right.row()
+        if top == bottom:
+            if self._reassign(top):
+                return
+            section = self._section_of(top)
+            if section is not None and section.expanded:
+                index = self.index(self._proxy_row(
+                    section, bisect.bisect_left(section.rows, top)))
+                self.dataChanged.emit(index, index)
+            return
+        if self._count:
+            # bulk changes (icons, availability) never change the sections
+            self.dataChanged.emit(self.index(0), self.index(self._count - 1))
+
+    # -- model interface
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._count
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        section, position = self._locate(index.row())
+        if position != -1:
+            return self._source.data(
+                self._source.index(section.rows[position]), role)
+        if role == QtCore.Qt.DisplayRole:
+            return u"%s (%d)" % (section.title, len(section.rows))
+        if role == self.HeaderRole:
+            return True
+        if role == self.ExpandedRole:
+            return section.expanded
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return super(SectionedRecentsModel, self).flags(index)
+        section, position = self._locate(index.row())
+        if position == -1:
+            return QtCore.Qt.ItemIsEnabled
+        return self._source.flags(
+            self._source.index(section.rows[position]))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Recent files shared by several running instances of an application.
+"""
+import os
+from qwelcomewindow.qt import QtCore
+from qwelcomewindow.store import RecentFilesStore
+
+
+class SharedRecentFiles(QtCore.QObject):
+    """
+    Keeps the recents list of QWelcomeWidgets in sync with a
+    RecentFilesStore shared by several processes.
+
+    The store log is watched with a QFileSystemWatcher: when another process
+    writes to it, only the new records are read and only the changed entries
+    are applied to the attached widgets (rows updated, moved to the top,
+    inserted or removed), the lists are never rebuilt.
+
+    Usage::
+
+        recents = SharedRecentFiles("~/.myapp/recents")
+        recents.attach(welcome_widget)
+        ...
+        recents.add(path)  # when the application opens a file
+    """
+    #: Signal emitted when the recent files changed: (changed, removed), see
+    #: RecentFilesStore.refresh
+    recents_changed = QtCore.Signal(list, list)
+
+    #: delay used to coalesce the file system notifications, in milliseconds
+    REFRESH_DELAY = 50
+
+    def __init__(self, path, max_entries=100, parent=None):
+        """
+        :param path: Path of the shared log file
+        :param max_entries: Maximum number of recent files.
+        """
+        super(SharedRecentFiles, self).__init__(parent)
+        self.store = RecentFilesStore(path, max_entries)
+        self.store.refresh()
+        self._widgets = []
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._refresh_timer.start)
+        # the log is replaced when it is compacted (or created), watch its
+        # directory too
+        self._watcher.directoryChanged.connect(self._refresh_timer.start)
+        self._watch()
+
+    def _watch(self):
+        directory = os.path.dirname(self.store.path) or "."
+        if os.path.isdir(directory) and \
+                directory not in self._watcher.directories():
+            self._watcher.addPath(directory)
+        if os.path.exists(self.store.path) and \
+                self.store.path not in self._watcher.files():
+            self._watcher.addPath(self.store.path)
+
+    def attach(self, widget, icon=None):
+        """
+        Fills the recents list of ``widget`` and keeps it in sync. Every
+        triggered recent action is recorded as a new opening.
+
+        :param widget: QWelcomeWidget instance
+        :param icon: Icon of the recent actions (QIcon or icon key),
+                     defaults to the icon of each file extension.
+        """
+        widget.replace_recent_actions(self.store.actions(icon))
+        widget.recent_action_triggered.connect(
+            lambda text, data: self.add(data or text))
+        self._widgets.append((widget, icon))
+        widget.destroyed.connect(lambda: self.detach(widget))
+
+    def detach(self, widget):
+        """
+        Stops syncing the recents list of ``widget``.
+        """
+        self._widgets = [(w, icon) for w, icon in self._widgets
+                         if w is not widget]
+
+    def add(self, path, timestamp=None):
+        """
+        Records the opening of a file, in all the running instances.
+        """
+        self.store.add(path, timestamp)
+        self.refresh()
+
+    def remove(self, path):
+        """
+        Removes a file from the recent files, in all the running instances.
+        """
+        self.store.remove(path)
+        self.refresh()
+
+    def refresh(self):
+        """
+        Reads the changes of the shared log and applies them to the attached
+        widgets.
+        """
+        self._watch()
+        changed, removed = self.store.refresh()
+        if not changed and not removed:
+            return
+        for widget, icon in self._widgets:
+            self._apply(widget, icon, changed, removed)
+        self.recents_changed.emit(changed, removed)
+
+    @staticmethod
+    def _apply(widget, icon, changed, removed):
+        with widget.batch_updates():
+            for path in removed:
+                if widget.has_action(path):
+                    widget.remove_action(path)
+            # from the oldest to the latest: the latest ends up on top
+            for path, timestamp in changed:
+                if widget.has_action(path):
+                    widget.update_action(path, timestamp=timestamp)
+                    widget.move_to_front(path)
+                else:
+                    widget.add_recent_file(path, icon, timestamp, index=0)
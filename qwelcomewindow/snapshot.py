@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Pre-rendered snapshots of the welcome widget, for an instant first paint.
+
+The widget is rendered to a pixmap when the application exits, the pixmap is
+displayed as a placeholder on the next launch while the live widget is being
+constructed::
+
+    snapshots = SnapshotCache()
+    placeholder = SnapshotPlaceholder(snapshots.load(
+        color_scheme=scheme, size=size))
+    window.setCentralWidget(placeholder)
+    window.show()
+    app.processEvents()
+    widget = QWelcomeWidget(...)
+    ...
+    placeholder.set_widget(widget, snapshots)
+
+Snapshots are keyed by color scheme, size and content hash (see
+QWelcomeWidget.content_hash), the most recent ones are kept.
+"""
+import hashlib
+import json
+import os
+import time
+from qwelcomewindow.qt import QtCore, QtGui
+
+
+class SnapshotCache(object):
+    """
+    Stores the snapshots of the welcome widget in a directory: one PNG file
+    per snapshot and an index (snapshots.json) with their metadata, most
+    recent first.
+    """
+    #: number of snapshots kept
+    MAX_SNAPSHOTS = 4
+    #: name of the index file
+    INDEX = "snapshots.json"
+
+    def __init__(self, directory="~/.cache/qwelcomewindow/snapshots"):
+        self.directory = os.path.expanduser(directory)
+
+    @staticmethod
+    def key(color_scheme, size, content):
+        """
+        Returns the key of a snapshot.
+
+        :param color_scheme: ColorScheme
+        :param size: (width, height)
+        :param content: Content hash (see QWelcomeWidget.content_hash)
+        """
+        return hashlib.sha1(json.dumps(
+            [list(color_scheme.key()), list(size), content]).encode(
+            "utf-8")).hexdigest()
+
+    def entries(self):
+        """
+        Returns the metadata of the snapshots, most recent first.
+        """
+        try:
+            with open(os.path.join(self.directory, self.INDEX)) as f:
+                entries = json.load(f)
+        except (IOError, OSError, ValueError):
+            return []
+        return entries if isinstance(entries, list) else []
+
+    def _write_entries(self, entries):
+        path = os.path.join(self.directory, self.INDEX)
+        with open(path + ".tmp", "w") as f:
+            json.dump(entries, f)
+        if os.name == "nt" and os.path.exists(path):
+            os.remove(path)
+        os.rename(path + ".tmp", path)
+
+    def find(self, color_scheme=None, size=None, content=None):
+        """
+        Returns the metadata of the most recent snapshot matching the given
+        fields (None matches anything), or None.
+
+        :param color_scheme: ColorScheme
+        :param size: (width, height)
+        :param content: Content hash
+        """
+        for entry in self.entries():
+            if color_scheme is not None and \
+                    entry.get("color_scheme") != list(color_scheme.key()):
+                continue
+            if size is not None and entry.get("size") != list(size):
+                continue
+            if content is not None and entry.get("content") != content:
+                continue
+            return entry
+        return None
+
+    def load(self, color_scheme=None, size=None, content=None):
+        """
+        Loads the most recent snapshot matching the given fields (see find).
+
+        :return: (QPixmap, metadata), or None if there is no such snapshot.
+        """
+        entry = self.find(color_scheme, size, content)
+        if entry is None:
+            return None
+        pixmap = QtGui.QPixmap(os.path.join(self.directory,
+                                            entry["key"] + ".png"))
+        if pixmap.isNull():
+            return None
+        ratio = entry.get("device_pixel_ratio", 1.0)
+        if ratio != 1.0 and hasattr(pixmap, "setDevicePixelRatio"):
+            pixmap.setDevicePixelRatio(ratio)
+        return pixmap, entry
+
+    def save(self, widget):
+        """
+        Renders ``widget`` and stores its snapshot, replacing the snapshot
+        with the same key. The oldest snapshots are removed.
+
+        :type widget: qwelcomewindow.QWelcomeWidget
+        :return: the snapshot metadata, None if the widget could not be
+                 rendered or saved.
+        """
+        color_scheme = widget.color_scheme()
+        size = (widget.width(), widget.height())
+        content = widget.content_hash()
+        key = self.key(color_scheme, size, content)
+        pixmap = widget.grab()
+        if pixmap.isNull():
+            return None
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        path = os.path.join(self.directory, key + ".png")
+        if not pixmap.save(path + ".tmp", "PNG"):
+            return None
+        if os.name == "nt" and os.path.exists(path):
+            os.remove(path)
+        os.rename(path + ".tmp", path)
+        entry = {
+            "key": key,
+            "color_scheme": list(color_scheme.key()),
+            "size": list(size),
+            "content": content,
+            "device_pixel_ratio": pixmap.devicePixelRatio()
+            if hasattr(pixmap, "devicePixelRatio") else 1.0,
+            # geometry of the named children, to lay out a placeholder
+            "geometry": dict(
+                (child.objectName(), [child.x(), child.y(), child.width(),
+                                      child.height()])
+                for child in widget.findChildren(QtGui.QWidget)
+                if child.objectName() and child.parent() is widget),
+            "time": time.time()}
+        entries = [entry] + [e for e in self.entries() if e["key"] != key]
+        for evicted in entries[self.MAX_SNAPSHOTS:]:
+            try:
+                os.remove(os.path.join(self.directory,
+                                       evicted["key"] + ".png"))
+            except OSError:
+                pass
+        self._write_entries(entries[:self.MAX_SNAPSHOTS])
+        return entry
+
+
+class SnapshotPlaceholder(QtGui.QStackedWidget):
+    """
+    Displays a welcome widget snapshot until the live widget is set.
+    """
+    #: Signal emitted when the live widget replaced the snapshot
+    swapped = QtCore.Signal()
+
+    def __init__(self, snapshot=None, parent=None):
+        """
+        :param snapshot: (QPixmap, metadata) as returned by
+                         SnapshotCache.load, or None (the placeholder is
+                         empty).
+        """
+        super(SnapshotPlaceholder, self).__init__(parent)
+        self.widget = None
+        self._size_hint = None
+        self._label = QtGui.QLabel(self)
+        self._label.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+        if snapshot is not None:
+            pixmap, entry = snapshot
+            self._label.setPixmap(pixmap)
+            self._size_hint = QtCore.QSize(*entry["size"])
+        self.addWidget(self._label)
+
+    def sizeHint(self):
+        if self.widget is None and self._size_hint is not None:
+            return self._size_hint
+        return super(SnapshotPlaceholder, self).sizeHint()
+
+    def set_widget(self, widget, snapshots=None):
+        """
+        Replaces the snapshot with the live widget.
+
+        :param widget: The live widget
+        :param snapshots: SnapshotCache used to save a new snapshot of the
+                          widget when the application is about to quit,
+                          optional.
+        """
+        self.widget = widget
+        self.addWidget(widget)
+        self.setCurrentWidget(widget)
+        self.removeWidget(self._label)
+        self._label.deleteLater()
+        self._label = None
+        if snapshots is not None:
+            QtGui.QApplication.instance().aboutToQuit.connect(
+                lambda: snapshots.save(widget))
+        self.swapped.emit()
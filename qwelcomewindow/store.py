@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Persistent storage of the recent files list.
+
+The recent files are stored in an append-only log, one record per line:
+
+    - ``+<timestamp>\\t<path>``: the file has been opened at <timestamp>
+    - ``-\\t<path>``: the file has been removed from the recent files
+
+Opening a file only appends a line to the log. The log is compacted (rewritten
+with one record per recent file) when it grows too much.
+
+Several processes may share the same log: writes are serialized with an
+advisory lock on a ``<log>.lock`` file and each process tails the log from
+the last offset it has read (see RecentFilesStore.refresh).
+"""
+import collections
+import contextlib
+import io
+import os
+import time
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+@contextlib.contextmanager
+def _locked(path):
+    """
+    Holds an exclusive advisory lock on ``path`` (created if needed).
+
+    The lock is a no-op on platforms that support neither fcntl nor msvcrt.
+    """
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class RecentFilesStore(object):
+    """
+    Stores a list of recent files on disk.
+
+    Entries are deduplicated by path and capped to ``max_entries``, the least
+    recently opened files being evicted first. The file is only read when the
+    entries are first needed.
+
+    The log may be shared by several processes, call refresh to read the
+    records written by the other processes (see
+    qwelcomewindow.SharedRecentFiles to be notified automatically).
+
+    Usage::
+
+        store = RecentFilesStore("~/.myapp/recents", max_entries=100)
+        store.bind(welcome_widget, file_icon)
+        ...
+        store.add(path)  # when the application opens a file
+    """
+
+    #: the log is compacted when it holds more than ``max_entries`` times
+    #: this factor records
+    COMPACTION_FACTOR = 2
+
+    def __init__(self, path, max_entries=100):
+        """
+        :param path: Path of the log file, created on the first write.
+        :param max_entries: Maximum number of recent files.
+        """
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        #: path -> timestamp, ordered from the oldest to the latest opened
+        self._entries = None
+        #: number of records in the log file
+        self._records = 0
+        #: number of bytes of the log file read so far
+        self._offset = 0
+        #: (device, inode) of the log file read so far
+        self._identity = None
+        #: the entries as of the last refresh
+        self._synced = {}
+
+    def _load(self):
+        """
+        Reads the log file (in a single read) and replays it.
+        """
+        self._entries = collections.OrderedDict()
+        self._records = 0
+        self._offset = 0
+        self._identity = None
+        self._tail()
+
+    def _tail(self):
+        """
+        Reads and replays the records appended to the log since the last
+        read. A complete reload is done if the log has been replaced
+        (compacted by another process) or truncated.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                identity = (stat.st_dev, stat.st_ino)
+                if (self._identity is not None and
+                        (identity != self._identity or
+                         stat.st_size < self._offset)):
+                    self._entries = collections.OrderedDict()
+                    self._records = 0
+                    self._offset = 0
+                self._identity = identity
+                f.seek(self._offset)
+                data = f.read()
+        except (IOError, OSError):
+            return
+        # a record being written by another process is read next time
+        end = data.rfind(b"\n") + 1
+        self._offset += end
+        entries = self._entries
+        # split on "\n" only: splitlines would also split the paths on the
+        # other line boundaries (\x0b, \x0c, \x1c-\x1e, \x85, \u2028,...)
+        for line in data[:end].decode("utf-8", "replace").split(u"\n"):
+            op, sep, path = line.partition("\t")
+            if not sep or not op:
+                # truncated or corrupted record
+                continue
+            self._records += 1
+            entries.pop(path, None)
+            if op[0] == "+":
+                try:
+                    entries[path] = float(op[1:])
+                except ValueError:
+                    continue
+                # capped after each record, as when the record was written
+                if len(entries) > self.max_entries:
+                    entries.popitem(last=False)
+
+    def refresh(self):
+        """
+        Reads the records written by the other processes since the last read
+        and returns the changes of the entries since the last refresh
+        (including the changes made by this process).
+
+        :return: (changed, removed): the list of (path, timestamp) of the new
+                 or reopened files, from the oldest to the latest opened, and
+                 the list of the removed paths.
+        """
+        if self._entries is None:
+            self._load()
+        else:
+            self._tail()
+        entries = self._entries
+        previous = self._synced
+        changed = [(path, timestamp) for path, timestamp in entries.items()
+                   if previous.get(path) != timestamp]
+        removed = [path for path in previous if path not in entries]
+        self._synced = dict(entries)
+        return changed, removed
+
+    @property
+    def entries(self):
+        """
+        The recent files entries, as an ordered dict that maps a path to the
+        timestamp of its last opening (from the oldest to the latest).
+        """
+        if self._entries is None:
+            self._load()
+        return self._entries
+
+    def paths(self):
+        """
+        Returns the list of recent files paths, the latest opened first.
+        """
+        return list(reversed(self.entries))
+
+    def add(self, path, timestamp=None):
+        """
+        Records the opening of a file: the file becomes the latest entry.
+
+        :param path: File path
+        :param timestamp: Opening time (seconds since epoch), default is now.
+        """
+        if "\n" in path or "\r" in path:
+            raise ValueError("invalid path: %r" % path)
+        if timestamp is None:
+            timestamp = time.time()
+        self._append(u"+%r\t%s\n" % (timestamp, path))
+
+    def remove(self, path):
+        """
+        Removes a file from the recent files.
+        """
+        if path in self.entries:
+            self._append(u"-\t%s\n" % path)
+
+    def clear(self):
+        """
+        Removes all the entries.
+        """
+        with self._lock():
+            self._entries = collections.OrderedDict()
+            self._compact()
+
+    def _lock(self):
+        self._ensure_directory()
+        return _locked(self.path + ".lock")
+
+    def _append(self, record):
+        """
+        Appends a record to the log (compacting it if needed) and applies it
+        to the entries.
+
+        The records written by the other processes are read first, so that
+        the record is applied in the same order as in the log.
+        """
+        if self._entries is None:
+            self._load()
+        with self._lock():
+            self._tail()
+            with open(self.path, "ab") as f:
+                f.write(record.encode("utf-8"))
+            self._tail()
+            if self._records > (self.COMPACTION_FACTOR *
+                                max(self.max_entries, 1)):
+                self._compact()
+
+    def compact(self):
+        """
+        Rewrites the log with one record per entry.
+        """
+        with self._lock():
+            self._tail()
+            self._compact()
+
+    def _compact(self):
+        tmp_path = self.path + ".tmp"
+        with io.open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(u"".join(u"+%r\t%s\n" % (timestamp, path)
+                             for path, timestamp in self.entries.items()))
+        if os.name == "nt" and os.path.exists(self.path):
+            os.remove(self.path)
+        os.rename(tmp_path, self.path)
+        stat = os.stat(self.path)
+        self._identity = (stat.st_dev, stat.st_ino)
+        self._offset = stat.st_size
+        self._records = len(self.entries)
+
+    def _ensure_directory(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def actions(self, icon=None):
+        """
+        Returns the recent actions of the entries (see
+        QWelcomeWidget.replace_recent_actions), the latest opened first.
+
+        :param icon: Icon of the recent actions (QIcon or icon key),
+                     defaults to the icon of each file extension.
+        """
+        entries = self.entries
+        return [(os.path.basename(path) or path, icon or path, path,
+                 os.path.dirname(path), entries[path])
+                for path in reversed(entries)]
+
+    def bind(self, widget, icon=None):
+        """
+        Binds the store to a QWelcomeWidget: the widget recents list is
+        filled with the stored entries and every triggered recent action is
+        recorded as a new opening.
+
+        The recent actions are displayed on two lines (file name and last
+        opening time, then the directory), their data is the file path.
+
+        :param widget: QWelcomeWidget instance
+        :param icon: Icon of the recent actions (QIcon or icon key),
+                     defaults to the icon of each file extension.
+        """
+        widget.replace_recent_actions(self.actions(icon))
+        widget.recent_action_triggered.connect(
+            lambda text, data: self.add(data or text))
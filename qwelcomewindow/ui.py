@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Builds the welcome widget tree.
+
+This module replaces the code generated from widget.ui by pyuic4 and
+pyside-uic: it is written against the qwelcomewindow.qt shim and works with
+any bindings. widget.ui is kept as the reference layout (for Qt Designer),
+changes must be applied to both files.
+"""
+from qwelcomewindow.qt import QtCore, QtGui
+
+
+def _layout(layout, name, margin=None, spacing=0):
+    layout.setObjectName(name)
+    layout.setSpacing(spacing)
+    if margin is not None:
+        layout.setContentsMargins(margin, margin, margin, margin)
+    return layout
+
+
+def _frame(parent, name):
+    frame = QtGui.QFrame(parent)
+    frame.setFrameShape(QtGui.QFrame.StyledPanel)
+    frame.setFrameShadow(QtGui.QFrame.Raised)
+    frame.setObjectName(name)
+    return frame
+
+
+def _header_label(parent, name):
+    label = QtGui.QLabel(parent)
+    label.setFrameShadow(QtGui.QFrame.Sunken)
+    label.setAlignment(QtCore.Qt.AlignCenter)
+    label.setObjectName(name)
+    return label
+
+
+def _list_view(parent, name):
+    view = QtGui.QListView(parent)
+    view.viewport().setCursor(QtCore.Qt.OpenHandCursor)
+    view.setUniformItemSizes(True)
+    view.setObjectName(name)
+    return view
+
+
+class Ui_Form(object):
+    """
+    Creates the welcome widget children, with the same names as in
+    widget.ui.
+    """
+
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(842, 513)
+        self.gridLayout = _layout(QtGui.QGridLayout(Form), "gridLayout", 0)
+
+        # header: application icon and title
+        self.horizontalLayoutHeader = _layout(QtGui.QHBoxLayout(),
+                                              "horizontalLayoutHeader")
+        self.horizontalLayoutHeader.setContentsMargins(-1, 0, -1, -1)
+        self.lblIcon = QtGui.QLabel(Form)
+        self.lblIcon.setObjectName("lblIcon")
+        self.horizontalLayoutHeader.addWidget(self.lblIcon)
+        self.lblTitle = QtGui.QLabel(Form)
+        self.lblTitle.setSizePolicy(QtGui.QSizePolicy.Expanding,
+                                    QtGui.QSizePolicy.Preferred)
+        self.lblTitle.setStyleSheet("font: 20pt \"Verdana\";")
+        self.lblTitle.setObjectName("lblTitle")
+        self.horizontalLayoutHeader.addWidget(self.lblTitle)
+        self.gridLayout.addLayout(self.horizontalLayoutHeader, 0, 0, 1, 1)
+
+        self.horizontalLayoutMain = _layout(QtGui.QHBoxLayout(),
+                                            "horizontalLayoutMain", 9)
+
+        # recents
+        self.frameRecents = _frame(Form, "frameRecents")
+        self.verticalLayout_4 = _layout(QtGui.QVBoxLayout(self.frameRecents),
+                                        "verticalLayout_4", 0)
+        self.verticalLayout_2 = _layout(QtGui.QVBoxLayout(),
+                                        "verticalLayout_2")
+        self.lblRecents = _header_label(self.frameRecents, "lblRecents")
+        self.verticalLayout_2.addWidget(self.lblRecents)
+        self.lwRecents = _list_view(self.frameRecents, "lwRecents")
+        self.lwRecents.setSizePolicy(QtGui.QSizePolicy.Fixed,
+                                     QtGui.QSizePolicy.Expanding)
+        self.verticalLayout_2.addWidget(self.lwRecents)
+        self.verticalLayout_4.addLayout(self.verticalLayout_2)
+        self.horizontalLayoutMain.addWidget(self.frameRecents)
+
+        self.horizontalLayoutMain.addItem(QtGui.QSpacerItem(
+            20, 20, QtGui.QSizePolicy.Fixed, QtGui.QSizePolicy.Minimum))
+
+        # quick start actions
+        self.framequickStart = _frame(Form, "framequickStart")
+        self.verticalLayout_5 = _layout(
+            QtGui.QVBoxLayout(self.framequickStart), "verticalLayout_5", 0)
+        self.verticalLayoutQuickStart = _layout(QtGui.QVBoxLayout(),
+                                                "verticalLayoutQuickStart")
+        self.lblQuickStart = _header_label(self.framequickStart,
+                                           "lblQuickStart")
+        self.verticalLayoutQuickStart.addWidget(self.lblQuickStart)
+        self.lwQuickStart = _list_view(self.framequickStart, "lwQuickStart")
+        self.verticalLayoutQuickStart.addWidget(self.lwQuickStart)
+        self.verticalLayout_5.addLayout(self.verticalLayoutQuickStart)
+        self.horizontalLayoutMain.addWidget(self.framequickStart)
+
+        self.gridLayout.addLayout(self.horizontalLayoutMain, 1, 0, 1, 1)
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        translate = QtGui.QApplication.translate
+        Form.setWindowTitle(translate("Form", "Form"))
+        self.lblTitle.setText(translate(
+            "Form", "<html><head/><body><p><span style=\" font-size:20pt;\">"
+            "Welcome to %s</span></p></body></html>"))
+        self.lblRecents.setText(translate("Form", "Recents"))
+        self.lblQuickStart.setText(translate("Form", "Quick start Actions"))
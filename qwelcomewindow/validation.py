@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Asynchronous validation of the recent files paths.
+"""
+import os
+import threading
+import time
+try:
+    import queue
+except ImportError:  # python 2
+    import Queue as queue
+from qwelcomewindow.qt import QtCore
+
+
+class PathValidator(QtCore.QObject):
+    """
+    Checks the existence of file paths in a pool of worker threads.
+
+    The workers are daemon threads: a path that hangs on a slow network share
+    never blocks the GUI thread nor the application exit. A path that is not
+    checked within ``timeout`` seconds is reported by path_timed_out; its
+    result is still reported by path_validated if it arrives later. The
+    worker stuck on a timed out path is replaced (up to ``max_workers``
+    replacements) until it returns.
+
+    Results are cached by (path, mtime), where mtime is the modification time
+    that the caller last recorded for the path (or None), for ``ttl``
+    seconds.
+
+    Call stop to stop the workers, the validator can be used again
+    afterwards.
+    """
+    #: Signal emitted when a path has been checked: (path, exists)
+    path_validated = QtCore.Signal(str, bool)
+    #: Signal emitted when a path could not be checked in time
+    path_timed_out = QtCore.Signal(str)
+    # emitted from the worker threads: (path, exists)
+    _checked = QtCore.Signal(str, bool)
+
+    def __init__(self, parent=None, max_workers=4, timeout=2.0, ttl=30.0):
+        """
+        :param max_workers: Maximum number of worker threads
+        :param timeout: Per path timeout, in seconds
+        :param ttl: Time a result stays cached, in seconds
+        """
+        super(PathValidator, self).__init__(parent)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.ttl = ttl
+        #: (path, mtime) -> (exists, expiration time)
+        self._cache = {}
+        #: path -> (mtime, deadline) of the paths being checked
+        self._pending = {}
+        #: timed out paths still being checked (by a stalled worker)
+        self._stalled = set()
+        self._queue = queue.Queue()
+        self._workers = []
+        self._checked.connect(self._on_checked)
+        self._timeout_timer = QtCore.QTimer(self)
+        self._timeout_timer.setInterval(100)
+        self._timeout_timer.timeout.connect(self._check_timeouts)
+
+    def validate(self, path, mtime=None):
+        """
+        Schedules the validation of ``path``.
+
+        Cached results are reported immediately.
+        """
+        now = time.time()
+        try:
+            exists, expiration = self._cache[(path, mtime)]
+        except KeyError:
+            pass
+        else:
+            if expiration > now:
+                self.path_validated.emit(path, exists)
+                return
+            del self._cache[(path, mtime)]
+        if path in self._pending or path in self._stalled:
+            return
+        self._pending[path] = (mtime, now + self.timeout)
+        # the stalled workers do not count (up to max_workers of them)
+        available = len(self._workers) - min(len(self._stalled),
+                                             self.max_workers)
+        if available < min(self.max_workers, len(self._pending)):
+            worker = threading.Thread(target=self._work, args=(self._queue, ))
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+        self._queue.put(path)
+        self._timeout_timer.start()
+
+    def stop(self):
+        """
+        Stops the workers and drops the pending validations. Idle workers
+        exit immediately, the busy ones when their check returns (their
+        results are ignored).
+        """
+        self._timeout_timer.stop()
+        for _ in self._workers:
+            self._queue.put(None)
+        # the stopped workers keep the old queue
+        self._queue = queue.Queue()
+        self._workers = []
+        self._pending.clear()
+        self._stalled.clear()
+
+    def clear_cache(self):
+        """
+        Forgets the cached results.
+        """
+        self._cache.clear()
+
+    def _work(self, requests):
+        while True:
+            path = requests.get()
+            if path is None:
+                return
+            try:
+                exists = os.path.exists(path)
+            except Exception:
+                exists = False
+            self._checked.emit(path, exists)
+
+    def _on_checked(self, path, exists):
+        if path in self._stalled:
+            # late result of a timed out path, still valid
+            self._stalled.discard(path)
+            mtime = None
+        elif path in self._pending:
+            mtime = self._pending.pop(path)[0]
+        else:
+            # validation stopped
+            return
+        self._cache[(path, mtime)] = (exists, time.time() + self.ttl)
+        self.path_validated.emit(path, exists)
+        if not self._pending:
+            self._timeout_timer.stop()
+
+    def _check_timeouts(self):
+        now = time.time()
+        timed_out = [path for path, (mtime, deadline) in self._pending.items()
+                     if deadline < now]
+        for path in timed_out:
+            del self._pending[path]
+            self._stalled.add(path)
+            self.path_timed_out.emit(path)
+        if not self._pending:
+            self._timeout_timer.stop()
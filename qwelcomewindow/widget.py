@@ -12,9 +12,27 @@
 """
 Main module: define the welcome window widget.
 """
+import collections
+import contextlib
+import hashlib
+import itertools
 import os
 import sys
+import time
 from qwelcomewindow.qt import QtGui, QtCore
+from qwelcomewindow.delegate import ActionDelegate
+from qwelcomewindow.icons import IconProvider
+from qwelcomewindow.instrumentation import Instrumentation, NULL_CONTEXT
+from qwelcomewindow.model import RecentActionsModel, recent_file_action
+from qwelcomewindow.preview import ImageThumbnailProvider, PreviewPane, \
+    ThumbnailCache, ThumbnailGenerator
+from qwelcomewindow.registry import QuickStartRegistry
+from qwelcomewindow.search import RecentActionsSearch
+from qwelcomewindow.sections import DirectoryGrouping, \
+    SectionedRecentsModel, TimeGrouping
+from qwelcomewindow.snapshot import SnapshotCache, SnapshotPlaceholder
+from qwelcomewindow.ui import Ui_Form
+from qwelcomewindow.validation import PathValidator
 
 
 class ColorScheme(object):
@@ -34,7 +52,13 @@ class ColorScheme(object):
     Color are defined as string with web/hex format: "#rrggbbb"
 
     The default colors define a white/light gray color scheme.
+
+    Color schemes are compared (and hashed) by colors.
     """
+    #: names of the color attributes
+    COLORS = ("background_color", "title_background_color", "text_color",
+              "border_color", "selection_bck_color", "selection_color",
+              "hover_color")
 
     def __init__(self):
         #: widgets background
@@ -52,6 +76,21 @@ class ColorScheme(object):
         #: selected item hover background color
         self.hover_color = "#bbbbbb"
 
+    def key(self):
+        """
+        Returns the tuple of the scheme colors, in the order of COLORS.
+        """
+        return tuple(getattr(self, name) for name in self.COLORS)
+
+    def __eq__(self, other):
+        return isinstance(other, ColorScheme) and self.key() == other.key()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.key())
+
 
 class DarkColorScheme(ColorScheme):
     """
@@ -81,38 +120,11 @@ QFrame
     border: 1px solid %(border_color)s;
 }
 
-QListWidget
+QListView
 {
     border: none;
 }
 
-QListView::item
-{
-    padding: 5px;
-}
-
-QListView::item:selected
-{
-    border: 1px solid %(border_color)s;
-}
-
-QListView::item:selected:!active
-{
-    background: %(selection_bck_color)s;
-    color: %(selection_color)s;
-}
-
-QListView::item:selected:active
-{
-    background: %(selection_bck_color)s;
-    color: %(selection_color)s;
-}
-
-QListView::item:hover
-{
-    background: %(hover_color)s;
-}
-
 QLabel
 {
     padding-top: 8px;
@@ -124,6 +136,25 @@ QLabel
 };
 """
 
+#: compiled stylesheets, by color scheme key
+_stylesheets = {}
+
+
+def compile_stylesheet(color_scheme):
+    """
+    Returns the stylesheet of a color scheme. Stylesheets are compiled once
+    per color scheme.
+
+    :type color_scheme: ColorScheme
+    """
+    key = color_scheme.key()
+    try:
+        return _stylesheets[key]
+    except KeyError:
+        stylesheet = STYLESHEET % dict(zip(ColorScheme.COLORS, key))
+        _stylesheets[key] = stylesheet
+        return stylesheet
+
 
 class QWelcomeWidget(QtGui.QWidget):
     """
@@ -149,20 +180,68 @@ class QWelcomeWidget(QtGui.QWidget):
         # Defines the quick start action type
         QuickStart = 1
 
+    class ThemingMode:
+        """
+        Enumerates the possible ways to apply a color scheme.
+        """
+        #: Colors are applied with a stylesheet (default). Changing the color
+        #: scheme re-polishes every child widget.
+        StyleSheet = 0
+        #: Colors are applied with a QPalette, changing the color scheme is
+        #: cheap.
+        Palette = 1
+
+    class Grouping:
+        """
+        Enumerates the possible groupings of the recent actions.
+        """
+        #: A flat list (default)
+        Flat = 0
+        #: Sections by last opening time: today, this week, older
+        Time = 1
+        #: A section per directory
+        Directory = 2
+
     # signal emitted when a quick start action is triggered
     quick_start_action_triggered = QtCore.Signal(str)
+    # signal emitted when a quick start action is triggered, with its text
+    # and user data (see qwelcomewindow.QuickStartRegistry)
+    quick_start_data_triggered = QtCore.Signal(str, object)
     # signal emitted when a recent action is triggered
     recent_action_triggered = QtCore.Signal(str, str)
+    # signal emitted when a recent action is likely to be triggered soon (it
+    # became the current one, it is hovered or it is the top action when the
+    # widget is shown): the application may start loading it in the
+    # background. Same parameters as recent_action_triggered.
+    recent_action_likely = QtCore.Signal(str, str)
+    # signal emitted when an incremental population (see add_actions) is
+    # finished, the parameter is the populated action type
+    population_finished = QtCore.Signal(int)
+    # signal emitted when instrumentation is enabled and a timing has been
+    # recorded: (event name, duration in seconds)
+    timing_recorded = QtCore.Signal(str, float)
+
+    #: time the mouse must rest on a recent action before
+    #: recent_action_likely is emitted, in milliseconds
+    HOVER_DWELL = 300
+
+    #: number of actions pulled from an incremental population iterable
+    #: between two checks of the time budget
+    POPULATION_GRANULARITY = 64
 
     def set_app_icon(self, app_icon):
-        if app_icon:
+        self._app_icon = app_icon
+        if app_icon and self.ui is not None:
             self.ui.lblIcon.setPixmap(app_icon.pixmap(32, 32))
 
     def set_app_name(self, app_name):
-        self.ui.lblTitle.setText("Welcome to %s" % app_name)
+        self._app_name = app_name
+        if self.ui is not None:
+            self.ui.lblTitle.setText("Welcome to %s" % app_name)
 
     def __init__(self, parent=None,
-                 app_name="", app_icon=None, color_scheme=None):
+                 app_name="", app_icon=None, color_scheme=None, lazy=False,
+                 instrumented=False):
         """
         Create the welcome window.
 
@@ -176,19 +255,147 @@ class QWelcomeWidget(QtGui.QWidget):
 
         :param color_scheme: A color scheme to easily customize the widget's
                              stylesheet
+
+        :param lazy: True to defer the construction of the child widgets
+                     (frames, labels and lists) to the first show event.
+                     The actions can be added before, but ``self.ui`` is None
+                     until the widget is shown.
+
+        :param instrumented: True to enable instrumentation from the start
+                             (see set_instrumentation_enabled).
         """
+        start = time.time()
         QtGui.QWidget.__init__(self)
-        if os.environ["QT_API"] == "pyside":
-            from qwelcomewindow import pyside_widget_ui
-            self.ui = pyside_widget_ui.Ui_Form()
-            self.ui.setupUi(self)
-        else:
-            from qwelcomewindow import pyqt_widget_ui
-            self.ui = pyqt_widget_ui.Ui_Form()
-            self.ui.setupUi(self)
+        #: the child widgets, None until constructed
+        self.ui = None
+        self._instrumentation = None
+        if instrumented:
+            self.set_instrumentation_enabled(True)
+        self._app_icon = None
+        self._app_name = ""
+        self._icon_provider = IconProvider(self)
+        self._recent_actions = RecentActionsModel(self, self._icon_provider)
+        self._quick_start_actions = RecentActionsModel(self,
+                                                       self._icon_provider)
+        # the list rows are painted by the delegates, with the color scheme
+        # colors (the paths of the recents are elided in the middle)
+        self._recents_delegate = ActionDelegate(self, QtCore.Qt.ElideMiddle)
+        self._quick_start_delegate = ActionDelegate(self)
+        # pending incremental populations: deque of [action_type, iterator]
+        self._populations = collections.deque()
+        self._population_budget = 0.01
+        self._population_timer = QtCore.QTimer(self)
+        self._population_timer.setInterval(0)
+        self._population_timer.timeout.connect(self._populate_chunk)
+        # recent paths validation
+        self._validator = None
+        self._validating = False
+        self._prune_missing = False
+        self._validation_results = {}
+        self._validation_timer = QtCore.QTimer(self)
+        self._validation_timer.setSingleShot(True)
+        self._validation_timer.setInterval(0)
+        self._validation_timer.timeout.connect(self._apply_validation_results)
+        # recent actions search
+        self._search = None
+        self._search_edit = None
+        self._ranker = None
+        #: keys of the inserted recent actions, placed at their rank from
+        #: the event loop (the model must not change in its own signals)
+        self._unranked = []
+        self._ranking_timer = QtCore.QTimer(self)
+        self._ranking_timer.setSingleShot(True)
+        self._ranking_timer.setInterval(0)
+        self._ranking_timer.timeout.connect(self._rank_inserted_actions)
+        # deferred changes (see batch_updates and set_update_coalescing)
+        self._batch_depth = 0
+        self._coalescing = None
+        self._flushing = False
+        self._deferred_ops = []
+        #: (kind, action_type, key) -> pending op, used to merge the changes
+        self._deferred = {}
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_updates)
+        self._sections = None
+        #: keys of the pinned recent actions
+        self._pinned = set()
+        self._thumbnails = None
+        self._preview = None
+        self._preview_path = None
+        #: key of the last action reported by recent_action_likely
+        self._likely_key = None
+        self._hovered = None
+        self._dwell_timer = QtCore.QTimer(self)
+        self._dwell_timer.setSingleShot(True)
+        self._dwell_timer.setInterval(self.HOVER_DWELL)
+        self._dwell_timer.timeout.connect(self._on_hover_dwell)
+        self._theming_mode = self.ThemingMode.StyleSheet
+        self._color_scheme = None
         self.set_color_scheme(color_scheme)
         self.set_app_icon(app_icon)
         self.set_app_name(app_name)
+        if not lazy:
+            self._setup_ui()
+        if self._instrumentation is not None:
+            self._instrumentation.record("construction", start,
+                                         time.time() - start)
+
+    def _setup_ui(self):
+        """
+        Constructs the child widgets.
+        """
+        with self._measure("setup_ui"):
+            self._build_ui()
+        if self._instrumentation is not None:
+            self._install_paint_filters()
+
+    def _build_ui(self):
+        self.ui = Ui_Form()
+        self.ui.setupUi(self)
+        self.ui.lwRecents.setModel(self._recent_actions)
+        self.ui.lwQuickStart.setModel(self._quick_start_actions)
+        for view, delegate in (
+                (self.ui.lwRecents, self._recents_delegate),
+                (self.ui.lwQuickStart, self._quick_start_delegate)):
+            view.setItemDelegate(delegate)
+            # hover states
+            view.setMouseTracking(True)
+            view.viewport().setAttribute(QtCore.Qt.WA_Hover)
+            # Enter/Return activates the current action
+            view.installEventFilter(self)
+        self.ui.lwRecents.entered.connect(self._on_recent_entered)
+        self.ui.lwRecents.viewportEntered.connect(self._dwell_timer.stop)
+        self._connect_recents_view()
+        self.set_app_icon(self._app_icon)
+        self.set_app_name(self._app_name)
+        if self._search is not None:
+            self._create_search_edit()
+        if self._thumbnails is not None:
+            self._create_preview_pane()
+        if self._theming_mode == self.ThemingMode.Palette:
+            self._apply_palette(self._color_scheme)
+
+    def showEvent(self, event):
+        if self.ui is None:
+            self._setup_ui()
+            # children created while the widget is being shown must be shown
+            # explicitly
+            for child in self.children():
+                if isinstance(child, QtGui.QWidget):
+                    child.show()
+        super(QWelcomeWidget, self).showEvent(event)
+        # the top recent action is the most likely to be opened: make it
+        # current so that Enter opens it
+        view = self.ui.lwRecents
+        if not view.currentIndex().isValid():
+            model = view.model()
+            for row in range(model.rowCount()):
+                index = model.index(row, 0)
+                if not index.data(SectionedRecentsModel.HeaderRole):
+                    view.setCurrentIndex(index)
+                    view.setFocus()
+                    break
 
     def set_color_scheme(self, color_scheme):
         """
@@ -199,15 +406,99 @@ class QWelcomeWidget(QtGui.QWidget):
         """
         if color_scheme is None:
             color_scheme = ColorScheme()
-        stylesheet = STYLESHEET % {
-            "background_color": color_scheme.background_color,
-            "title_background_color": color_scheme.title_background_color,
-            "text_color": color_scheme.text_color,
-            "border_color": color_scheme.border_color,
-            "selection_bck_color": color_scheme.selection_bck_color,
-            "selection_color": color_scheme.selection_color,
-            "hover_color": color_scheme.hover_color}
-        self.setStyleSheet(stylesheet)
+        if color_scheme == self._color_scheme:
+            return
+        # keep a copy, the caller may modify its instance afterwards
+        self._color_scheme = ColorScheme()
+        for name, color in zip(ColorScheme.COLORS, color_scheme.key()):
+            setattr(self._color_scheme, name, color)
+        self._recents_delegate.set_color_scheme(color_scheme)
+        self._quick_start_delegate.set_color_scheme(color_scheme)
+        with self._measure("color_scheme"):
+            if self._theming_mode == self.ThemingMode.Palette:
+                self._apply_palette(color_scheme)
+            else:
+                self.setStyleSheet(compile_stylesheet(color_scheme))
+
+    def color_scheme(self):
+        """
+        Returns a copy of the widget color scheme.
+        """
+        color_scheme = ColorScheme()
+        for name, color in zip(ColorScheme.COLORS, self._color_scheme.key()):
+            setattr(color_scheme, name, color)
+        return color_scheme
+
+    def content_hash(self):
+        """
+        Returns a hash of the displayed content: the application name and the
+        text and user data of the actions (see qwelcomewindow.snapshot).
+        """
+        digest = hashlib.sha1(self._app_name.encode("utf-8"))
+        for model in (self._recent_actions, self._quick_start_actions):
+            digest.update(b"\1")
+            for row in range(model.rowCount()):
+                digest.update(("%s\0%s\0" % (
+                    model.text(row), model.action_data(row))).encode("utf-8"))
+        return digest.hexdigest()
+
+    def set_theming_mode(self, theming_mode):
+        """
+        Sets the way color schemes are applied.
+
+        :param theming_mode:
+            qwelcomewindow.QWelcomeWidget.ThemingMode.StyleSheet or
+            qwelcomewindow.QWelcomeWidget.ThemingMode.Palette
+        """
+        if theming_mode == self._theming_mode:
+            return
+        self._theming_mode = theming_mode
+        color_scheme = self._color_scheme
+        self._color_scheme = None
+        if theming_mode == self.ThemingMode.Palette:
+            self.setStyleSheet("")
+        else:
+            for label in self._title_labels():
+                label.setAutoFillBackground(False)
+        self.set_color_scheme(color_scheme)
+
+    def _title_labels(self):
+        if self.ui is None:
+            return ()
+        return self.ui.lblTitle, self.ui.lblRecents, self.ui.lblQuickStart
+
+    def _apply_palette(self, color_scheme):
+        """
+        Applies a color scheme using palettes only (no stylesheet).
+        """
+        color = QtGui.QColor
+        palette = QtGui.QPalette()
+        for roles, value in (
+                ((QtGui.QPalette.Window, QtGui.QPalette.Base,
+                  QtGui.QPalette.AlternateBase, QtGui.QPalette.Button),
+                 color_scheme.background_color),
+                ((QtGui.QPalette.WindowText, QtGui.QPalette.Text,
+                  QtGui.QPalette.ButtonText),
+                 color_scheme.text_color),
+                ((QtGui.QPalette.Light, QtGui.QPalette.Midlight,
+                  QtGui.QPalette.Mid, QtGui.QPalette.Dark,
+                  QtGui.QPalette.Shadow),
+                 color_scheme.border_color),
+                ((QtGui.QPalette.Highlight, ),
+                 color_scheme.selection_bck_color),
+                ((QtGui.QPalette.HighlightedText, ),
+                 color_scheme.selection_color)):
+            for role in roles:
+                palette.setColor(role, color(value))
+        palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Text,
+                         color(color_scheme.border_color))
+        self.setPalette(palette)
+        title_palette = QtGui.QPalette(palette)
+        title_palette.setColor(QtGui.QPalette.Window,
+                               color(color_scheme.title_background_color))
+        for label in self._title_labels():
+            label.setAutoFillBackground(True)
+            label.setPalette(title_palette)
 
     def add_action(self, action_type, action_txt, action_icon=None, data=None):
         """
@@ -224,50 +515,1013 @@ class QWelcomeWidget(QtGui.QWidget):
         :type action_txt: str or unicode
 
         :param action_icon: Icon displayed before the action_txt, optional.
-        :type action_icon: QIcon
-        """
-        item = QtGui.QListWidgetItem(action_txt)
-        if action_icon:
-            item.setIcon(action_icon)
-        if data:
-            item.setData(32, data)
-            item.setData(3, data)
-        item.setData(0, action_txt)
-        if action_type == self.ActionType.QuickStart:
-            self.ui.lwQuickStart.addItem(item)
+                            Either a QIcon or an icon key: a file
+                            extension (".py"), a MIME type ("text/x-python")
+                            or a file path. Icon keys are resolved lazily
+                            and shared by all the actions of the same type.
+        :type action_icon: QIcon or str
+
+        :param data: User data, passed to recent_action_triggered and shown
+                     as the item tooltip, optional.
+        """
+        if self._deferring():
+            self._defer_append(action_type, (action_txt, action_icon, data))
+            return
+        self._model(action_type).append(action_txt, action_icon, data)
+
+    def add_recent_file(self, path, icon=None, timestamp=None, size=None,
+                        index=None):
+        """
+        Adds a recent file action, displayed on two lines: the file name
+        (with the last opening time and size of the file, if known) and its
+        directory. The path is the action data.
+
+        :param path: File path
+        :param icon: QIcon or icon key, optional. Defaults to the icon
+                     associated with the file extension.
+        :param timestamp: Last opening time, in seconds since epoch, optional
+        :param size: File size, in bytes, optional
+        :param index: Position of the action in the list, default is at the
+                      end of the list.
+        """
+        action = recent_file_action(path, icon, timestamp, size)
+        if self._deferring():
+            if index is None:
+                self._defer_append(self.ActionType.Recent, action)
+            else:
+                self._forget_deferred(self.ActionType.Recent, action)
+                self._defer(["insert", self.ActionType.Recent, index, action])
+            return
+        if index is None:
+            self._recent_actions.extend([action])
         else:
-            self.ui.lwRecents.addItem(item)
+            self._recent_actions.insert(index, [action])
+
+    def set_icon_provider(self, icon_provider):
+        """
+        Sets the provider used to resolve the action icon keys.
+
+        :type icon_provider: qwelcomewindow.icons.IconProvider
+        """
+        self._icon_provider = icon_provider
+        self._recent_actions.set_icon_provider(icon_provider)
+        self._quick_start_actions.set_icon_provider(icon_provider)
+
+    def set_population_budget(self, budget):
+        """
+        Sets the time spent populating the lists at each event loop iteration
+        when actions are added incrementally (see add_actions).
+
+        :param budget: Time budget in milliseconds (default is 10ms)
+
+        :raises ValueError: if the budget is not positive
+        """
+        if budget <= 0:
+            raise ValueError("the population budget must be positive: %r" %
+                             budget)
+        self._population_budget = budget / 1000.0
+
+    def add_actions(self, action_type, actions, incremental=False):
+        """
+        Adds several actions at once to one of the two list widgets.
+
+        This is much faster than calling add_action in a loop: the rows are
+        inserted in one batch and the list is repainted only once.
+
+        In incremental mode, the iterable is consumed in time-sliced chunks
+        from the Qt event loop so that the widget can be painted before the
+        whole list is built. population_finished is emitted when the
+        iterable is exhausted. Incremental populations of the same list are
+        processed in order.
+
+        :param action_type: qwelcomewindow.QWelcomeWidget.ActionType.Recent or
+                            qwelcomewindow.QWelcomeWidget.ActionType.QuickStart
+
+        :param actions: iterable (list, generator,...) of
+                        (action_txt, action_icon, data) tuples. action_icon
+                        and data are optional. Recent files may also be
+                        described by (name, icon, path, directory,
+                        timestamp, size) tuples, see recent_file_action.
+
+        :param incremental: True to populate the list from the event loop.
+        """
+        if incremental:
+            # the last item is the size of the next chunk
+            self._populations.append([action_type, iter(actions),
+                                      self.POPULATION_GRANULARITY])
+            self._population_timer.start()
+            return
+        if self._deferring():
+            for action in actions:
+                self._defer_append(action_type, action)
+            return
+        with self._measure("population"):
+            with self._updates_disabled(action_type):
+                self._model(action_type).extend(actions)
+
+    def replace_recent_actions(self, actions):
+        """
+        Replaces the whole recent actions list in one go.
+
+        :param actions: iterable (list, generator,...) of
+                        (action_txt, action_icon, data) tuples. action_icon
+                        and data are optional. Recent files may also be
+                        described by (name, icon, path, directory,
+                        timestamp, size) tuples, see recent_file_action.
+        """
+        self._cancel_populations(self.ActionType.Recent)
+        self._flush_updates()
+        with self._measure("population"):
+            with self._updates_disabled(self.ActionType.Recent):
+                self._recent_actions.replace(actions)
 
     def set_action_text(self, action_type, index, text):
-        if action_type == self.ActionType.QuickStart:
-            item = self.ui.lwQuickStart.item(index)
+        if self._deferring():
+            op = self._deferred.get(("text", action_type, index))
+            if op is not None:
+                op[3] = text
+            else:
+                self._defer(["text", action_type, index, text])
+            return
+        self._model(action_type).set_text(index, text)
+
+    def _row(self, action_type, key):
+        """
+        Returns the row of the action ``key``, raises KeyError if there is
+        no such action.
+        """
+        row = self._model(action_type).row(key)
+        if row == -1:
+            raise KeyError(key)
+        return row
+
+    def has_action(self, key, action_type=None):
+        """
+        Returns True if there is an action with the key ``key`` (see
+        update_action). Deferred changes (see batch_updates) are not taken
+        into account.
+        """
+        if action_type is None:
+            action_type = self.ActionType.Recent
+        return self._model(action_type).row(key) != -1
+
+    def update_action(self, key, text=None, icon=None, timestamp=None,
+                      size=None, action_type=None):
+        """
+        Updates an action in place, only the action row is repainted.
+
+        Actions are identified by their key: their user data, or their text
+        when they have no user data (e.g. the path of a recent file).
+
+        :param key: Action key
+        :param text: New action text, optional
+        :param icon: New action icon (QIcon or icon key), optional
+        :param timestamp: New last opening time of a recent file, optional
+        :param size: New size of a recent file, optional
+        :param action_type: Action type, default is ActionType.Recent
+
+        :raises KeyError: if there is no such action
+        """
+        if action_type is None:
+            action_type = self.ActionType.Recent
+        if self._deferring():
+            fields = dict(text=text, icon=icon, timestamp=timestamp,
+                          size=size)
+            op = self._deferred.get(("update", action_type, key))
+            if op is not None:
+                # merge with the pending update of the action
+                op[3].update((name, value) for name, value in fields.items()
+                             if value is not None)
+            else:
+                self._defer(["update", action_type, key, fields])
+            return
+        self._model(action_type).update(
+            self._row(action_type, key), text=text, icon=icon,
+            timestamp=timestamp, size=size)
+
+    def set_action_tooltip(self, key, tooltip, action_type=None):
+        """
+        Sets the tooltip of an action, the tooltip of an action is its user
+        data by default. The tooltip may be set before the action is added
+        (e.g. while the updates are batched, see batch_updates), it is
+        forgotten when the action is removed.
+
+        :param key: Action key (see update_action)
+        :param tooltip: Tooltip, "" for no tooltip, None to restore the
+                        default tooltip.
+        :param action_type: Action type, default is ActionType.Recent
+        """
+        if action_type is None:
+            action_type = self.ActionType.Recent
+        self._model(action_type).set_tooltip(key, tooltip)
+
+    def remove_action(self, key, action_type=None):
+        """
+        Removes an action.
+
+        :param key: Action key (see update_action)
+        :param action_type: Action type, default is ActionType.Recent
+
+        :raises KeyError: if there is no such action
+        """
+        if action_type is None:
+            action_type = self.ActionType.Recent
+        if self._deferring():
+            # the pending changes of the action are pointless
+            for kind in ("update", "move", "remove"):
+                op = self._deferred.pop((kind, action_type, key), None)
+                if op is not None:
+                    op[0] = None
+            self._defer(["remove", action_type, key])
+            return
+        self._model(action_type).remove_row(self._row(action_type, key))
+
+    def move_to_front(self, key, action_type=None):
+        """
+        Moves an action to the top of its list (e.g. a recent file that has
+        just been reopened). The view is notified of a single row move.
+
+        :param key: Action key (see update_action)
+        :param action_type: Action type, default is ActionType.Recent
+
+        :raises KeyError: if there is no such action
+        """
+        if action_type is None:
+            action_type = self.ActionType.Recent
+        if self._deferring():
+            # only the last move matters
+            op = self._deferred.pop(("move", action_type, key), None)
+            if op is not None:
+                op[0] = None
+            self._defer(["move", action_type, key])
+            return
+        row = self._row(action_type, key)
+        if self._ranker is not None and action_type == self.ActionType.Recent:
+            # the ranking decides of the position
+            self._place_recent_action(key)
         else:
-            item = self.ui.lwRecents.item(index)
-        item.setText(text)
+            self._model(action_type).move_row(row, 0)
+
+    def set_grouping(self, grouping):
+        """
+        Groups the recent actions into collapsible sections. The pinned
+        actions (see pin_action) are presented in a first section.
+
+        Collapsed sections only present a header with their number of
+        actions, click (or press Enter on) a header to expand or collapse its
+        section.
+
+        :param grouping: QWelcomeWidget.Grouping.Flat, Time or Directory, or
+                         a custom grouping object (see
+                         qwelcomewindow.sections.TimeGrouping).
+        """
+        if self._sections is not None:
+            self._sections.deleteLater()
+            self._sections = None
+        if grouping == self.Grouping.Time:
+            grouping = TimeGrouping()
+        elif grouping == self.Grouping.Directory:
+            grouping = DirectoryGrouping()
+        if grouping != self.Grouping.Flat:
+            self._sections = SectionedRecentsModel(
+                self._recent_actions, grouping, self._pinned, self)
+        self._update_recents_model()
+
+    def pin_action(self, key):
+        """
+        Pins a recent action: it is presented in the pinned section when the
+        recent actions are grouped (see set_grouping).
+
+        :param key: Action key (see update_action)
+
+        :raises KeyError: if there is no such action
+        """
+        self._row(self.ActionType.Recent, key)
+        self._pinned.add(key)
+        if self._sections is not None:
+            self._sections.set_pinned(key, True)
+
+    def unpin_action(self, key):
+        """
+        Unpins a recent action.
+
+        :param key: Action key (see update_action)
+        """
+        self._pinned.discard(key)
+        if self._sections is not None:
+            self._sections.set_pinned(key, False)
+
+    def set_ranking(self, ranker):
+        """
+        Orders the recent actions by frecency (see
+        qwelcomewindow.ranking.FrecencyRanker) instead of insertion order.
+
+        Every triggered recent action is recorded by the ranker and its row
+        is moved to its new rank (found by a binary search), the rest of the
+        list is left untouched. Added actions are moved to their rank on the
+        next event loop iteration. The ranker state is not saved
+        automatically, call ranker.save() when the application exits.
+
+        :param ranker: The ranker, None to stop ranking (the current order
+                       is kept).
+        :type ranker: qwelcomewindow.ranking.FrecencyRanker
+        """
+        model = self._recent_actions
+        if self._ranker is not None:
+            self.recent_action_triggered.disconnect(self._on_recent_ranked)
+            model.rowsInserted.disconnect(self._on_recent_rows_inserted)
+            self._ranking_timer.stop()
+            self._unranked = []
+        self._ranker = ranker
+        if ranker is None:
+            return
+        self.recent_action_triggered.connect(self._on_recent_ranked)
+        model.rowsInserted.connect(self._on_recent_rows_inserted)
+        self._sort_recent_actions()
+
+    def _seed_ranker(self, first, last):
+        """
+        Adds the unknown keys of the recent rows to the ranker, with their
+        last opening time as their only opening.
+        """
+        model = self._recent_actions
+        for row in range(first, last + 1):
+            self._ranker.add(model.key(row), model.data(
+                model.index(row), model.TimestampRole))
+
+    def _sort_recent_actions(self):
+        model = self._recent_actions
+        count = model.rowCount()
+        self._seed_ranker(0, count - 1)
+        value = self._ranker.value
+        key = model.key
+        rows = sorted(range(count), key=lambda row: -value(key(row)))
+        if rows != list(range(count)):
+            with self._updates_disabled(self.ActionType.Recent):
+                model.reorder(rows)
+
+    def _place_recent_action(self, key, ranked=None):
+        """
+        Moves a recent action to its rank: the other rows are sorted, its
+        destination is found by a binary search.
+
+        :param ranked: Number of sorted rows at the top of the list, the
+                       action being below them (all the other rows by
+                       default).
+        """
+        model = self._recent_actions
+        row = model.row(key)
+        if row == -1:
+            return
+        value = self._ranker.value
+        model_key = model.key
+        target = value(key)
+        low, high = 0, model.rowCount() - 1 if ranked is None else ranked
+        while low < high:
+            middle = (low + high) // 2
+            # skip the moved row
+            other = middle if middle < row else middle + 1
+            if value(model_key(other)) >= target:
+                low = middle + 1
+            else:
+                high = middle
+        model.move_row(row, low)
+
+    def _on_recent_ranked(self, text, data):
+        key = data or text
+        if self._recent_actions.row(key) != -1:
+            self._ranker.record(key)
+            self._place_recent_action(key)
+
+    def _on_recent_rows_inserted(self, parent, first, last):
+        self._seed_ranker(first, last)
+        model = self._recent_actions
+        self._unranked.extend(model.key(row) for row in range(first, last + 1))
+        self._ranking_timer.start()
+
+    def _rank_inserted_actions(self):
+        """
+        Moves the inserted recent actions to their rank. The inserted rows
+        are all moved below the (sorted) other rows first, then inserted
+        into them by a binary search, best ranked first. Large insertions
+        sort the whole list instead.
+        """
+        keys, self._unranked = self._unranked, []
+        if self._ranker is None:
+            return
+        model = self._recent_actions
+        keys = sorted(set(key for key in keys if model.row(key) != -1),
+                      key=model.row)
+        if len(keys) >= 16:
+            self._sort_recent_actions()
+            return
+        value = self._ranker.value
+        keys.sort(key=lambda key: -value(key))
+        with self._updates_disabled(self.ActionType.Recent):
+            for key in keys:
+                model.move_row(model.row(key), model.rowCount() - 1)
+            ranked = model.rowCount() - len(keys)
+            for key in keys:
+                self._place_recent_action(key, ranked)
+                ranked += 1
 
     def clear_recent_actions(self):
         """
         Clears the recent actions list
         """
-        self.ui.lwRecents.clear()
+        self._cancel_populations(self.ActionType.Recent)
+        self._flush_updates()
+        self._recent_actions.clear()
+
+    @contextlib.contextmanager
+    def batch_updates(self):
+        """
+        Collects the changes of the actions made in a with block and applies
+        them at once when the block exits: the lists are repainted once.
+        Blocks can be nested, the changes are applied when the outermost
+        block exits.
+
+        Redundant changes are merged: successive updates of the same action
+        are applied as a single update, only the last move of an action is
+        applied and the pending changes of a removed action are dropped.
+        Changes are never merged across the addition of an action with the
+        same key: they are applied in sequence order. Appended actions are
+        inserted in a single batch.
+
+        Changes of missing actions are ignored when they are applied (no
+        KeyError is raised)::
+
+            with widget.batch_updates():
+                for path, size in changes:
+                    widget.update_action(path, size=size)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush_updates()
+
+    def set_update_coalescing(self, interval):
+        """
+        Enables the automatic coalescing of the changes of the actions: the
+        changes are collected (as in a batch_updates block) and applied at
+        most once every ``interval`` milliseconds.
+
+        :param interval: Coalescing interval in milliseconds, 0 to apply the
+                         changes at the next event loop iteration, None to
+                         disable coalescing (default).
+        """
+        self._flush_updates()
+        self._coalescing = interval
+        if interval is not None:
+            self._flush_timer.setInterval(interval)
+
+    def _deferring(self):
+        """
+        Returns True if the changes of the actions must be deferred.
+        """
+        return ((self._batch_depth or self._coalescing is not None) and
+                not self._flushing)
+
+    def _defer(self, op):
+        """
+        Queues a change: [kind, action_type, key or index, arguments...]
+        """
+        self._deferred_ops.append(op)
+        if op[0] != "append":
+            self._deferred[tuple(op[:3])] = op
+        if (self._coalescing is not None and not self._batch_depth and
+                not self._flush_timer.isActive()):
+            self._flush_timer.start()
+
+    def _forget_deferred(self, action_type, action):
+        """
+        Stops merging the changes of the key of an added action: the changes
+        made after the action is added apply to it, they must not be merged
+        with (or cancel) the changes made before.
+        """
+        key = action[0]
+        if len(action) > 2 and action[2] is not None:
+            key = action[2]
+        for kind in ("update", "move", "remove"):
+            self._deferred.pop((kind, action_type, key), None)
+
+    def _defer_append(self, action_type, action):
+        self._forget_deferred(action_type, action)
+        # successive appends are inserted in a single batch
+        ops = self._deferred_ops
+        if ops and ops[-1][0] == "append" and ops[-1][1] == action_type:
+            ops[-1][2].append(action)
+        else:
+            self._defer(["append", action_type, [action]])
+
+    def _flush_updates(self):
+        """
+        Applies the deferred changes, the lists are repainted once.
+        """
+        self._flush_timer.stop()
+        ops = self._deferred_ops
+        if not ops:
+            return
+        self._deferred_ops = []
+        self._deferred = {}
+        self._flushing = True
+        try:
+            with self._measure("batch"):
+                with self._updates_disabled(self.ActionType.Recent):
+                    with self._updates_disabled(self.ActionType.QuickStart):
+                        for op in ops:
+                            try:
+                                self._apply_op(op)
+                            except (KeyError, IndexError):
+                                # the action has been removed
+                                pass
+        finally:
+            self._flushing = False
+
+    def _apply_op(self, op):
+        kind, action_type = op[:2]
+        if kind == "append":
+            self._model(action_type).extend(op[2])
+        elif kind == "insert":
+            self._model(action_type).insert(op[2], [op[3]])
+        elif kind == "text":
+            self.set_action_text(action_type, op[2], op[3])
+        elif kind == "update":
+            self.update_action(op[2], action_type=action_type, **op[3])
+        elif kind == "remove":
+            self.remove_action(op[2], action_type)
+        elif kind == "move":
+            self.move_to_front(op[2], action_type)
+
+    def _cancel_populations(self, action_type):
+        """
+        Cancels the pending incremental populations of a list.
+        """
+        for population in list(self._populations):
+            if population[0] == action_type:
+                self._populations.remove(population)
+        if not self._populations:
+            self._population_timer.stop()
+
+    def _populate_chunk(self):
+        """
+        Adds the next chunk of the current incremental population. The size
+        of the chunks is adjusted from the time the previous chunk took to
+        be read and inserted, so that a chunk fits in the population time
+        budget (a chunk has at least POPULATION_GRANULARITY actions and is
+        at most twice as large as the previous one).
+        """
+        population = self._populations[0]
+        action_type, actions, count = population
+        start = time.time()
+        try:
+            chunk = list(itertools.islice(actions, count))
+        except Exception:
+            # a failing iterable must not be polled forever
+            self._cancel_populations(action_type)
+            raise
+        exhausted = len(chunk) < count
+        self.add_actions(action_type, chunk)
+        elapsed = time.time() - start
+        if elapsed > 0:
+            count = int(count * self._population_budget / elapsed)
+        else:
+            count *= 2
+        population[2] = max(self.POPULATION_GRANULARITY,
+                            min(count, 2 * population[2]))
+        if exhausted:
+            self._populations.popleft()
+            if not self._populations:
+                self._population_timer.stop()
+            if not any(p[0] == action_type for p in self._populations):
+                self.population_finished.emit(action_type)
+
+    def set_path_validation(self, enabled, prune=False, timeout=2.0):
+        """
+        Enables or disables the validation of the recent actions paths.
+
+        When enabled, the data of each recent action is considered as a file
+        path whose existence is checked in background threads. Recent actions
+        are shown immediately and the missing ones are greyed out (or removed
+        if ``prune`` is True) as the results arrive. Paths that cannot be
+        checked in ``timeout`` seconds are greyed out until their result
+        arrives. Results are cached for a short time (see
+        qwelcomewindow.validation.PathValidator), the paths of the reopened
+        files are checked again. Disabling the validation stops the worker
+        threads.
+
+        :param enabled: True to enable the validation
+        :param prune: True to remove the missing paths instead of greying
+                      them out.
+        :param timeout: Per path timeout, in seconds.
+        """
+        self._prune_missing = prune
+        if not enabled:
+            if self._validating:
+                self._validating = False
+                self._recent_actions.rowsInserted.disconnect(
+                    self._validate_recent_rows)
+                self._recent_actions.modelReset.disconnect(
+                    self._validate_recent_actions)
+                self._validator.path_validated.disconnect(
+                    self._on_path_validated)
+                self._validator.path_timed_out.disconnect(
+                    self._on_path_timed_out)
+                self._validator.stop()
+            self._validation_results.clear()
+            self._recent_actions.clear_unavailable()
+            return
+        if self._validator is None:
+            # a single validator (and results cache) for the widget lifetime
+            self._validator = PathValidator(self, timeout=timeout)
+        if not self._validating:
+            self._validating = True
+            self._validator.path_validated.connect(self._on_path_validated)
+            self._validator.path_timed_out.connect(self._on_path_timed_out)
+            self._recent_actions.rowsInserted.connect(
+                self._validate_recent_rows)
+            self._recent_actions.modelReset.connect(
+                self._validate_recent_actions)
+        self._validator.timeout = timeout
+        self._validate_recent_actions()
+
+    def _validate_recent_actions(self):
+        self._validate_recent_rows(QtCore.QModelIndex(), 0,
+                                   self._recent_actions.rowCount() - 1)
+
+    def _validate_recent_rows(self, parent, first, last):
+        model = self._recent_actions
+        action_data = model.action_data
+        validate = self._validator.validate
+        for row in range(first, last + 1):
+            path = action_data(row)
+            if path:
+                # a reopened file is checked again
+                validate(path, model.data(model.index(row),
+                                          model.TimestampRole))
+
+    def _on_path_validated(self, path, exists):
+        self._validation_results[path] = exists
+        self._validation_timer.start()
+
+    def _on_path_timed_out(self, path):
+        # unknown state: grey out but never prune
+        self._validation_results[path] = None
+        self._validation_timer.start()
+
+    def _apply_validation_results(self):
+        """
+        Applies the validation results received since the last call, in one
+        batch.
+        """
+        results = self._validation_results
+        self._validation_results = {}
+        available = [path for path, exists in results.items() if exists]
+        missing = set(path for path, exists in results.items()
+                      if exists is False)
+        timed_out = [path for path, exists in results.items()
+                     if exists is None]
+        model = self._recent_actions
+        model.set_unavailable(available, False)
+        model.set_unavailable(timed_out, True)
+        if self._prune_missing:
+            model.remove_data(missing)
+        else:
+            model.set_unavailable(missing, True)
+
+    def set_search_enabled(self, enabled):
+        """
+        Shows or hides a search field above the recent actions list. The
+        recent actions are filtered as you type, the best matches first.
+
+        :param enabled: True to show the search field.
+        """
+        if enabled == (self._search is not None):
+            return
+        if enabled:
+            self._search = RecentActionsSearch(self._recent_actions, self)
+            self._search.results_changed.connect(self._update_recents_model)
+            if self.ui is not None:
+                self._create_search_edit()
+        else:
+            self._search.deleteLater()
+            self._search = None
+            if self._search_edit is not None:
+                self._search_edit.deleteLater()
+                self._search_edit = None
+            self._update_recents_model()
+
+    def _create_search_edit(self):
+        edit = QtGui.QLineEdit(self.ui.frameRecents)
+        edit.setObjectName("leSearch")
+        edit.setPlaceholderText("Search")
+        edit.textChanged.connect(self._on_search_text_changed)
+        # Enter and Down arrow
+        edit.installEventFilter(self)
+        self.ui.verticalLayout_2.insertWidget(1, edit)
+        self._search_edit = edit
+
+    #: number of rows before and after the current one whose thumbnails are
+    #: prefetched
+    PREVIEW_PREFETCH = 2
 
-    @QtCore.Slot(QtGui.QListWidgetItem)
-    def on_lwRecents_itemClicked(self, item):
+    def set_preview_enabled(self, enabled, provider=None,
+                            cache_directory="~/.cache/qwelcomewindow",
+                            size=128):
+        """
+        Shows (or hides) a preview pane next to the recents list, with the
+        thumbnail of the current recent file.
+
+        Thumbnails are generated in worker threads, cached on disk and
+        prefetched for the rows around the current one.
+
+        :param enabled: True to show the preview pane
+        :param provider: Thumbnail provider (see
+                         qwelcomewindow.preview.ThumbnailProvider), default
+                         is ImageThumbnailProvider.
+        :param cache_directory: Directory of the thumbnails disk cache, None
+                                to disable the disk cache.
+        :param size: Thumbnail size, in pixels
+        """
+        if self._thumbnails is not None:
+            self._thumbnails.thumbnail_ready.disconnect(
+                self._on_thumbnail_ready)
+            self._thumbnails.stop()
+            self._thumbnails.deleteLater()
+            self._thumbnails = None
+            if self._preview is not None:
+                self._preview.setParent(None)
+                self._preview.deleteLater()
+                self._preview = None
+        if not enabled:
+            return
+        cache = (ThumbnailCache(os.path.join(cache_directory, "thumbnails"))
+                 if cache_directory else None)
+        self._thumbnails = ThumbnailGenerator(
+            provider or ImageThumbnailProvider(), cache, size, self)
+        self._thumbnails.thumbnail_ready.connect(self._on_thumbnail_ready)
+        if self.ui is not None:
+            self._create_preview_pane()
+
+    def _create_preview_pane(self):
+        self._preview = PreviewPane(self._thumbnails.size, self)
+        layout = self.ui.horizontalLayoutMain
+        layout.insertWidget(layout.indexOf(self.ui.frameRecents) + 1,
+                            self._preview)
+        self._on_recent_current_changed(self.ui.lwRecents.currentIndex(),
+                                        None)
+
+    def _connect_recents_view(self):
+        """
+        Connects to the selection model of the recents list, which changes
+        with its model.
+        """
+        self.ui.lwRecents.selectionModel().currentChanged.connect(
+            self._on_recent_current_changed)
+
+    def _on_recent_current_changed(self, current, previous):
+        if current.isValid():
+            self._emit_likely(current)
+        if self._thumbnails is None:
+            return
+        if not current.isValid():
+            self._preview_path = None
+            self._preview.set_image(None)
+            return
+        model = current.model()
+        row = current.row()
+        paths = []
+        # the current row first, then the nearest rows
+        for offset in range(self.PREVIEW_PREFETCH + 1):
+            for other in ((row + offset, row - offset) if offset
+                          else (row,)):
+                if 0 <= other < model.rowCount():
+                    path = model.index(other, 0).data(QtCore.Qt.UserRole)
+                    if path:
+                        paths.append(path)
+        self._preview_path = current.data(QtCore.Qt.UserRole)
+        image = self._thumbnails.image(self._preview_path, False)
+        if not self._preview_path:
+            self._preview.set_image(None)
+        elif image is False:
+            self._preview.set_image(None, "Loading...")
+        else:
+            self._preview.set_image(image)
+        self._thumbnails.request(paths)
+
+    def _on_thumbnail_ready(self, path, image):
+        if path == self._preview_path and self._preview is not None:
+            self._preview.set_image(image)
+
+    def _on_search_text_changed(self, text):
+        self._search.search(text)
+        self._update_recents_model()
+        # the best match is the most likely to be opened
+        view = self.ui.lwRecents
+        if view.model().rowCount():
+            view.setCurrentIndex(view.model().index(0, 0))
+
+    def _update_recents_model(self):
+        """
+        Shows the search results in the recents list if there is an active
+        query, else the whole recents list.
+        """
+        if self.ui is None:
+            return
+        if self._search is not None and self._search.query.split():
+            model = self._search.filter_model
+        elif self._sections is not None:
+            model = self._sections
+        else:
+            model = self._recent_actions
+        if self.ui.lwRecents.model() is not model:
+            self.ui.lwRecents.setModel(model)
+            self._connect_recents_view()
+
+    def set_instrumentation_enabled(self, enabled, capacity=1024):
+        """
+        Enables or disables the recording of the widget timings:
+            - construction: QWelcomeWidget constructor
+            - setup_ui: construction of the child widgets
+            - color_scheme: application of a color scheme
+            - population: insertion of a batch of actions
+            - paint: painting of the lists
+
+        The last ``capacity`` timings are kept in a ring buffer (see
+        dump_trace), statistics are available with stats() and each timing
+        is emitted with timing_recorded.
+
+        :param enabled: True to enable instrumentation
+        :param capacity: Size of the ring buffer
+        """
+        if not enabled:
+            self._instrumentation = None
+            return
+        if self._instrumentation is None:
+            self._instrumentation = Instrumentation(
+                capacity, self.timing_recorded.emit)
+            if self.ui is not None:
+                self._install_paint_filters()
+
+    def stats(self):
+        """
+        Returns the timing statistics, by event name (see
+        qwelcomewindow.instrumentation.Instrumentation.stats). The dict is
+        empty if instrumentation is disabled.
+        """
+        if self._instrumentation is None:
+            return {}
+        return self._instrumentation.stats()
+
+    def dump_trace(self, path):
+        """
+        Writes the recorded timings in the Chrome trace event format.
+
+        :param path: Path of the JSON file to write
+        """
+        if self._instrumentation is not None:
+            self._instrumentation.dump_chrome_trace(path)
+
+    def _measure(self, name):
+        """
+        Returns a context manager measuring its block if instrumentation is
+        enabled.
+        """
+        if self._instrumentation is None:
+            return NULL_CONTEXT
+        return self._instrumentation.measure(name)
+
+    def _emit_likely(self, index):
+        """
+        Emits recent_action_likely for the action at ``index``, unless it was
+        the last reported action.
+        """
+        if index.data(SectionedRecentsModel.HeaderRole):
+            return
+        text = index.data(QtCore.Qt.DisplayRole)
+        data = index.data(QtCore.Qt.UserRole)
+        key = text if data is None else data
+        if key == self._likely_key:
+            return
+        self._likely_key = key
+        self.recent_action_likely.emit(text, data)
+
+    def _on_recent_entered(self, index):
+        self._hovered = QtCore.QPersistentModelIndex(index)
+        self._dwell_timer.start()
+
+    def _on_hover_dwell(self):
+        if (self._hovered is not None and self._hovered.isValid() and
+                self.ui.lwRecents.underMouse()):
+            self._emit_likely(self.ui.lwRecents.model().index(
+                self._hovered.row(), 0))
+
+    def _activate(self, view, index):
+        """
+        Triggers the action at ``index`` of ``view``, as a click would.
+        """
+        if not index.isValid() or not index.flags() & QtCore.Qt.ItemIsEnabled:
+            return
+        if view is self.ui.lwRecents:
+            self.on_lwRecents_clicked(index)
+        else:
+            self.on_lwQuickStart_clicked(index)
+
+    def _install_paint_filters(self):
+        for view in (self.ui.lwRecents, self.ui.lwQuickStart):
+            # installing twice has no effect
+            view.viewport().installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if (event.type() == QtCore.QEvent.KeyPress and
+                event.key() in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter)):
+            if self.ui is not None and watched in (self.ui.lwRecents,
+                                                   self.ui.lwQuickStart):
+                self._activate(watched, watched.currentIndex())
+                return True
+            if watched is self._search_edit:
+                # opens the best match
+                view = self.ui.lwRecents
+                self._activate(view, view.currentIndex()
+                               if view.currentIndex().isValid()
+                               else view.model().index(0, 0))
+                return True
+        if (event.type() == QtCore.QEvent.KeyPress and
+                watched is self._search_edit and
+                event.key() == QtCore.Qt.Key_Down):
+            self.ui.lwRecents.setFocus()
+            return True
+        if (self._instrumentation is not None and
+                event.type() == QtCore.QEvent.Paint):
+            for view in (self.ui.lwRecents, self.ui.lwQuickStart):
+                if watched == view.viewport():
+                    # dispatch the event ourselves (like the scroll area
+                    # does) to measure the whole paint
+                    with self._instrumentation.measure("paint"):
+                        view.viewportEvent(event)
+                    return True
+        return super(QWelcomeWidget, self).eventFilter(watched, event)
+
+    def _model(self, action_type):
+        """
+        Returns the model that holds the actions of type ``action_type``.
+        """
+        if action_type == self.ActionType.QuickStart:
+            return self._quick_start_actions
+        return self._recent_actions
+
+    def _view(self, action_type):
+        """
+        Returns the list view that displays the actions of type
+        ``action_type``, None if the child widgets are not constructed yet.
+        """
+        if self.ui is None:
+            return None
+        if action_type == self.ActionType.QuickStart:
+            return self.ui.lwQuickStart
+        return self.ui.lwRecents
+
+    @contextlib.contextmanager
+    def _updates_disabled(self, action_type):
+        """
+        Disables the updates of the list view of ``action_type`` in a with
+        block.
+        """
+        view = self._view(action_type)
+        if view is None or not view.updatesEnabled():
+            # nested
+            yield
+            return
+        view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            view.setUpdatesEnabled(True)
+
+    @QtCore.Slot(QtCore.QModelIndex)
+    def on_lwRecents_clicked(self, index):
+        if index.data(SectionedRecentsModel.HeaderRole):
+            index.model().toggle(index)
+            return
         self.ui.lwQuickStart.clearSelection()
-        self.recent_action_triggered.emit(item.text(), item.data(32))
+        self.recent_action_triggered.emit(
+            index.data(QtCore.Qt.DisplayRole), index.data(QtCore.Qt.UserRole))
 
-    @QtCore.Slot(QtGui.QListWidgetItem)
-    def on_lwQuickStart_itemClicked(self, item):
+    @QtCore.Slot(QtCore.QModelIndex)
+    def on_lwQuickStart_clicked(self, index):
         self.ui.lwRecents.clearSelection()
-        self.quick_start_action_triggered.emit(item.text())
+        self.quick_start_action_triggered.emit(
+            index.data(QtCore.Qt.DisplayRole))
+        self.quick_start_data_triggered.emit(
+            index.data(QtCore.Qt.DisplayRole), index.data(QtCore.Qt.UserRole))
 
 
 #///////////////////////////////////////////////////////////////////////////////
 # Example
 #///////////////////////////////////////////////////////////////////////////////
-widget = None
-theme = None
-
 def on_recent_acton_clicked(text, data):
     """
     Shows a message box with the name of the triggered recent action.
@@ -276,31 +1530,35 @@ def on_recent_acton_clicked(text, data):
                                   "You clicked on the recent item: %s" % text)
 
 
-def on_quick_start_action_clicked(text):
+def show_help(widget):
+    """
+    Shows a message box describing QWelcomeWindow.
+    """
+    QtGui.QMessageBox.information(
+        None, "QWelcomeWindow",
+        "QWelcomeWindow is a small python package that you can use to "
+        "quickly create a home window for your PySide application.")
+
+
+def open_something(widget):
     """
     Shows a message box with the name of the triggered quick start action.
     """
-    if text == "Help":
-        QtGui.QMessageBox.information(
-            None, "QWelcomeWindow",
-            "QWelcomeWindow is a small python package that you can use to "
-            "quickly create a home window for your PySide application.")
-    elif text == "Try dark theme" or text == "Try white theme":
-        global widget, theme
-        if theme is None:
-            theme = DarkColorScheme()
-            widget.set_color_scheme(theme)
-            widget.set_action_text(QWelcomeWidget.ActionType.QuickStart,
-                                   2, "Try white theme")
-        else:
-            widget.set_color_scheme(ColorScheme())
-            theme = None
-            widget.set_action_text(QWelcomeWidget.ActionType.QuickStart,
-                                   2, "Try dark theme")
+    QtGui.QMessageBox.information(
+        None, "Quick start action triggered",
+        "You clicked on the quick start action: Open something")
+
+
+def toggle_theme(widget, registry):
+    """
+    Switches between the dark and the white color schemes.
+    """
+    if widget.color_scheme() != DarkColorScheme():
+        widget.set_color_scheme(DarkColorScheme())
+        registry.set_label("theme", "Try white theme")
     else:
-        QtGui.QMessageBox.information(
-            None, "Quick start action triggered",
-            "You clicked on the quick start action: %s" % text)
+        widget.set_color_scheme(ColorScheme())
+        registry.set_label("theme", "Try dark theme")
 
 
 def main():
@@ -309,25 +1567,37 @@ def main():
     """
     app = QtGui.QApplication(sys.argv)
 
+    # show the snapshot saved on the last exit while the widget is created
+    snapshots = SnapshotCache()
+    placeholder = SnapshotPlaceholder(snapshots.load())
+    placeholder.setWindowTitle("QWelcomeWindow")
+    placeholder.show()
+    app.processEvents()
+
     # create some standard icons
     style = app.style()
-    file_icon = style.standardIcon(style.SP_FileIcon)
-    open_icon = style.standardIcon(style.SP_DialogOpenButton)
-    help_icon = style.standardIcon(style.SP_DialogHelpButton)
-    reload_icon = style.standardIcon(style.SP_BrowserReload)
+    file_icon = style.standardIcon(QtGui.QStyle.SP_FileIcon)
+    open_icon = style.standardIcon(QtGui.QStyle.SP_DialogOpenButton)
+    help_icon = style.standardIcon(QtGui.QStyle.SP_DialogHelpButton)
+    reload_icon = style.standardIcon(QtGui.QStyle.SP_BrowserReload)
 
     # create the widget
-    global widget
-    widget = QWelcomeWidget(app_name="QWelcomeWindow",
-                            app_icon=style.standardIcon(style.SP_ComputerIcon))
-
-    # add quick start actions
-    widget.add_action(QWelcomeWidget.ActionType.QuickStart, "Open something",
-                      open_icon)
-    widget.add_action(QWelcomeWidget.ActionType.QuickStart, "Help",
-                      help_icon)
-    widget.add_action(QWelcomeWidget.ActionType.QuickStart, "Try dark theme",
-                      reload_icon)
+    widget = QWelcomeWidget(
+        app_name="QWelcomeWindow",
+        app_icon=style.standardIcon(QtGui.QStyle.SP_ComputerIcon))
+
+    # declare the quick start actions. The handlers of an application are
+    # usually given as dotted paths ("yourapp.actions:open"), imported when
+    # they are triggered for the first time; the example handlers are
+    # already imported (and this module may run as a script)
+    registry = QuickStartRegistry()
+    registry.register("open", "Open something", open_icon, open_something)
+    registry.register("help", "Help", help_icon, show_help,
+                      "About QWelcomeWindow")
+    registry.register("theme", "Try dark theme", reload_icon,
+                      lambda widget: toggle_theme(widget, registry))
+    registry.discover()
+    registry.bind(widget)
 
     # add recent file actions
     widget.add_action(QWelcomeWidget.ActionType.Recent, "File00.xyz",
@@ -339,10 +1609,9 @@ def main():
 
     # connect to the widget's signals
     widget.recent_action_triggered.connect(on_recent_acton_clicked)
-    widget.quick_start_action_triggered.connect(on_quick_start_action_clicked)
 
-    # run the gui app
-    widget.show()
+    # replace the snapshot and run the gui app
+    placeholder.set_widget(widget, snapshots)
     app.exec_()
 
 
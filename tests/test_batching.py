@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Tests the coalescing of the deferred changes (QWelcomeWidget.batch_updates).
+"""
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from qwelcomewindow import qt
+try:
+    qt.setup_api()
+except ImportError as e:
+    raise unittest.SkipTest(str(e))
+from qwelcomewindow.qt import QtGui
+from qwelcomewindow.widget import QWelcomeWidget
+
+
+class BatchUpdatesTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtGui.QApplication.instance() or QtGui.QApplication(
+            sys.argv)
+
+    def setUp(self):
+        self.widget = QWelcomeWidget(lazy=True)
+        for path in ("/a/f0", "/a/f1", "/a/f2"):
+            self.widget.add_recent_file(path)
+
+    def tearDown(self):
+        self.widget.deleteLater()
+
+    def keys(self):
+        model = self.widget._recent_actions
+        return [model.key(row) for row in range(model.rowCount())]
+
+    def test_remove_add_remove(self):
+        with self.widget.batch_updates():
+            self.widget.remove_action("/a/f1")
+            self.widget.add_recent_file("/a/f1")
+            self.widget.remove_action("/a/f1")
+        self.assertEqual(self.keys(), ["/a/f0", "/a/f2"])
+
+    def test_remove_add(self):
+        with self.widget.batch_updates():
+            self.widget.remove_action("/a/f1")
+            self.widget.add_recent_file("/a/f1")
+        self.assertEqual(self.keys(), ["/a/f0", "/a/f2", "/a/f1"])
+
+    def test_merged_updates(self):
+        with self.widget.batch_updates():
+            self.widget.update_action("/a/f1", size=1)
+            self.widget.update_action("/a/f1", timestamp=2.0)
+            self.widget.remove_action("/a/f0")
+        model = self.widget._recent_actions
+        index = model.index(model.row("/a/f1"))
+        self.assertEqual(index.data(model.SizeRole), 1)
+        self.assertEqual(index.data(model.TimestampRole), 2.0)
+        self.assertEqual(self.keys(), ["/a/f1", "/a/f2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
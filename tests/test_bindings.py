@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Constructs the widget under each installed qt bindings.
+
+The bindings are selected once per process, each one is tested in a
+subprocess.
+"""
+import importlib
+import importlib.util
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from qwelcomewindow.qt import BINDINGS
+
+SMOKE_TEST = """
+import sys
+from qwelcomewindow.qt import QtCore, QtGui
+from qwelcomewindow import QWelcomeWidget
+app = QtGui.QApplication(sys.argv)
+style = app.style()
+icon = style.standardIcon(QtGui.QStyle.SP_FileIcon)
+widget = QWelcomeWidget(
+    app_name="Smoke test",
+    app_icon=style.standardIcon(QtGui.QStyle.SP_ComputerIcon))
+widget.add_action(QWelcomeWidget.ActionType.Recent, "File00.xyz", icon)
+widget.add_recent_file("/path/to/File01.abc")
+widget.add_action(QWelcomeWidget.ActionType.QuickStart, "Help", icon)
+widget.show()
+app.processEvents()
+assert QtCore.Qt.AlignCenter == (QtCore.Qt.AlignHCenter |
+                                 QtCore.Qt.AlignVCenter)
+print(widget._recent_actions.rowCount())
+"""
+
+
+def installed_bindings():
+    """
+    Returns the (QT_API value, package name) of the installed bindings.
+    """
+    bindings = []
+    for api, name, flag in BINDINGS:
+        try:
+            found = importlib.util.find_spec(name) is not None
+        except (AttributeError, ImportError, ValueError):
+            found = False
+        if found:
+            bindings.append((api, name))
+    return bindings
+
+
+class BindingsTestCase(unittest.TestCase):
+
+    def test_construct_widget(self):
+        bindings = installed_bindings()
+        if not bindings:
+            self.skipTest("no qt bindings installed")
+        for api, name in bindings:
+            with self.subTest(bindings=name):
+                env = dict(os.environ, QT_API=api)
+                env.setdefault("QT_QPA_PLATFORM", "offscreen")
+                env["PYTHONPATH"] = os.pathsep.join(
+                    [ROOT] + [p for p in [env.get("PYTHONPATH")] if p])
+                process = subprocess.Popen(
+                    [sys.executable, "-c", SMOKE_TEST], env=env, cwd=ROOT,
+                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                    universal_newlines=True)
+                output = process.communicate()[0]
+                self.assertEqual(process.returncode, 0, output)
+                self.assertEqual(output.strip().splitlines()[-1], "2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Tests the frecency ranking of the recent actions.
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from qwelcomewindow import qt
+from qwelcomewindow.ranking import FrecencyRanker
+try:
+    qt.setup_api()
+except ImportError as e:
+    QT_MISSING = str(e)
+else:
+    QT_MISSING = None
+
+#: an arbitrary origin of the opening times
+EPOCH = 1.5e9
+DAY = 24 * 3600
+
+
+class FrecencyRankerTestCase(unittest.TestCase):
+
+    def test_frequency_beats_age(self):
+        ranker = FrecencyRanker()
+        for i in range(5):
+            ranker.record("often", EPOCH + i)
+        ranker.record("once", EPOCH + DAY)
+        self.assertEqual(ranker.keys(), ["often", "once"])
+        self.assertEqual(ranker.rank("often"), 0)
+
+    def test_recency_beats_frequency(self):
+        ranker = FrecencyRanker()
+        for i in range(3):
+            ranker.record("old", EPOCH + i)
+        ranker.record("new", EPOCH + 10 * FrecencyRanker.HALF_LIFE)
+        self.assertEqual(ranker.keys(), ["new", "old"])
+
+    def test_add_does_not_record(self):
+        ranker = FrecencyRanker()
+        ranker.record("a", EPOCH)
+        ranker.add("a", EPOCH + DAY)
+        ranker.add("b")
+        self.assertEqual(ranker.value("a"), ranker.rate * EPOCH)
+        self.assertEqual(ranker.keys(), ["a", "b"])
+        self.assertEqual(ranker.rank("unknown"), -1)
+
+    def test_remove(self):
+        ranker = FrecencyRanker()
+        ranker.record("a", EPOCH)
+        ranker.record("b", EPOCH + 1)
+        ranker.remove("b")
+        ranker.remove("unknown")
+        self.assertEqual(ranker.keys(), ["a"])
+        self.assertNotIn("b", ranker)
+
+    def test_save_load(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "ranking", "state")
+        ranker = FrecencyRanker(path)
+        for i, key in enumerate(["/a/b c", u"/caf\xe9", "/x"]):
+            ranker.record(key, EPOCH + i * DAY)
+        ranker.save()
+        loaded = FrecencyRanker(path)
+        self.assertEqual(loaded.keys(), ranker.keys())
+        for key in ranker.keys():
+            self.assertEqual(loaded.value(key), ranker.value(key))
+
+
+@unittest.skipIf(QT_MISSING, QT_MISSING)
+class RankedRecentsTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from qwelcomewindow.qt import QtGui
+        cls.app = QtGui.QApplication.instance() or QtGui.QApplication(
+            sys.argv)
+
+    def setUp(self):
+        from qwelcomewindow.widget import QWelcomeWidget
+        self.widget = QWelcomeWidget(lazy=True)
+        self.ranker = FrecencyRanker()
+        self.widget.set_ranking(self.ranker)
+
+    def tearDown(self):
+        self.widget.set_ranking(None)
+        self.widget.deleteLater()
+
+    def keys(self):
+        model = self.widget._recent_actions
+        return [model.key(row) for row in range(model.rowCount())]
+
+    def test_multi_row_insert(self):
+        rng = random.Random(0)
+        for attempt in range(20):
+            self.widget.clear_recent_actions()
+            self.ranker.clear()
+            for i in range(rng.randint(0, 10)):
+                self.widget.add_recent_file(
+                    "/ranked/%d/%d" % (attempt, i),
+                    timestamp=EPOCH + rng.randint(0, 100) * DAY)
+            self.app.processEvents()
+            # fewer rows than the sort threshold, at random positions
+            for i in range(rng.randint(2, 15)):
+                model = self.widget._recent_actions
+                self.widget.add_recent_file(
+                    "/inserted/%d/%d" % (attempt, i),
+                    timestamp=EPOCH + rng.randint(0, 100) * DAY,
+                    index=rng.randint(0, model.rowCount()))
+            self.app.processEvents()
+            keys = self.keys()
+            values = [self.ranker.value(key) for key in keys]
+            self.assertEqual(values, sorted(values, reverse=True))
+
+    def test_triggered_action_moves_up(self):
+        for i in range(5):
+            self.widget.add_recent_file("/f%d" % i,
+                                        timestamp=EPOCH + (5 - i) * DAY)
+        self.app.processEvents()
+        self.assertEqual(self.keys(), ["/f0", "/f1", "/f2", "/f3", "/f4"])
+        for i in range(3):
+            self.ranker.record("/f3", EPOCH + 6 * DAY + i)
+        self.widget._place_recent_action("/f3")
+        self.assertEqual(self.keys()[0], "/f3")
+
+
+if __name__ == "__main__":
+    unittest.main()
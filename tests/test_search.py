@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Tests the search index of the recent actions (SearchIndex).
+"""
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from qwelcomewindow import qt
+try:
+    qt.setup_api()
+except ImportError as e:
+    raise unittest.SkipTest(str(e))
+from qwelcomewindow.search import SearchIndex
+
+
+def build(entries):
+    index = SearchIndex()
+    for text, data in entries:
+        index.add(text, data)
+    return index
+
+
+class SearchIndexTestCase(unittest.TestCase):
+
+    def test_empty_query(self):
+        index = build([("a", None)])
+        self.assertIsNone(index.search(""))
+        self.assertIsNone(index.search("  "))
+
+    def test_ranking(self):
+        index = build([
+            ("my_main.py", "/src/my_main.py"),
+            ("main.py", "/src/main.py"),
+            ("setup.py", "/main/setup.py"),
+            ("Main.c", "/c/Main.c"),
+            ("other.txt", None)])
+        # text prefix, text, data, each by row
+        self.assertEqual(index.search("main"), [1, 3, 0, 2])
+        self.assertEqual(index.search("MAIN", limit=2), [1, 3])
+
+    def test_several_terms(self):
+        index = build([
+            ("main.py", "/project/a/main.py"),
+            ("main.py", "/other/b/main.py"),
+            ("project.txt", "/x/main"),
+            ("readme", "/project/main")])
+        # ranked by the rarest term: "project"
+        self.assertEqual(index.search("main project"), [2, 0, 3])
+        self.assertEqual(index.search("project main"), [2, 0, 3])
+        self.assertEqual(index.search("main b"), [1])
+        self.assertEqual(index.search("main zzz"), [])
+
+    def test_fuzzy(self):
+        index = build([("foo_bar.py", None), ("bar_foo.py", None),
+                       ("fxoxbxaxr", None)])
+        self.assertEqual(index.search("fbr"), [0, 2])
+        # the letters are used in the query order
+        self.assertEqual(index.search("bf"), [1])
+        self.assertEqual(index.search("fo xa"), [2])
+        self.assertEqual(index.search("zz"), [])
+
+    def test_new_lines(self):
+        index = build([("a\nb", "c\nd"), ("b", None)])
+        self.assertEqual(index.search("b"), [1, 0])
+        self.assertEqual(index.search("c d"), [0])
+
+    def test_limit_many_matches(self):
+        entries = [("%s_%d" % ("ab"[i % 2], i), "/d/%d" % i)
+                   for i in range(2000)]
+        index = build(entries)
+        rows = index.search("b")
+        self.assertEqual(len(rows), SearchIndex.LIMIT)
+        self.assertEqual(rows, list(range(1, 2 * SearchIndex.LIMIT, 2)))
+        self.assertEqual(index.search("1 /d/1", limit=3), [1, 10, 11])
+
+    def test_incremental_changes(self):
+        rng = random.Random(0)
+        words = ["alpha", "beta", "gamma", "main", "util", "a/b", ""]
+
+        def entry():
+            return (rng.choice(words) + rng.choice(words),
+                    rng.choice(words + [None]))
+
+        entries = [entry() for i in range(50)]
+        index = build(entries)
+        for i in range(300):
+            operation = rng.randrange(4)
+            if operation == 0:
+                row = rng.randint(0, len(entries))
+                new = [entry() for j in range(rng.randint(1, 3))]
+                entries[row:row] = new
+                index.insert(row, new)
+            elif operation == 1 and entries:
+                first = rng.randrange(len(entries))
+                last = rng.randint(first, min(first + 2, len(entries) - 1))
+                del entries[first:last + 1]
+                index.remove(first, last)
+            elif operation == 2 and entries:
+                start = rng.randrange(len(entries))
+                end = rng.randint(start, min(start + 2, len(entries) - 1))
+                destination = rng.choice(
+                    [row for row in range(len(entries) + 1)
+                     if not start <= row <= end + 1] or [start])
+                moved = entries[start:end + 1]
+                before = destination - (
+                    end - start + 1 if destination > end else 0)
+                del entries[start:end + 1]
+                entries[before:before] = moved
+                index.move(start, end, destination)
+            elif entries:
+                row = rng.randrange(len(entries))
+                entries[row] = entry()
+                index.replace(row, *entries[row])
+            reference = build(entries)
+            self.assertEqual(len(index), len(entries))
+            for query in ("a", "ma", "b", "util a", "/", "gm"):
+                self.assertEqual(index.search(query),
+                                 reference.search(query))
+
+
+if __name__ == "__main__":
+    unittest.main()
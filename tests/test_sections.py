@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Tests the sectioned presentation of the recent actions
+(SectionedRecentsModel).
+"""
+import os
+import random
+import sys
+import time
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from qwelcomewindow import qt
+try:
+    qt.setup_api()
+except ImportError as e:
+    raise unittest.SkipTest(str(e))
+from qwelcomewindow.qt import QtCore, QtGui
+from qwelcomewindow.model import RecentActionsModel
+from qwelcomewindow.sections import DirectoryGrouping, \
+    SectionedRecentsModel, TimeGrouping
+
+DAY = 24 * 3600
+
+
+def action(path, timestamp=0):
+    directory, name = os.path.split(path)
+    return (name, None, path, directory, timestamp)
+
+
+class SectionedRecentsTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtGui.QApplication.instance() or QtGui.QApplication(
+            sys.argv)
+
+    def setUp(self):
+        self.now = time.time()
+        self.source = RecentActionsModel()
+
+    def rows(self, model):
+        """
+        Returns the presented rows: the header titles and the action keys.
+        """
+        rows = []
+        for row in range(model.rowCount()):
+            index = model.index(row)
+            if model.is_header(index):
+                rows.append(index.data())
+            else:
+                rows.append(self.source.key(model.source_row(index)))
+        return rows
+
+    def header(self, model, title):
+        for row in range(model.rowCount()):
+            index = model.index(row)
+            if model.is_header(index) and index.data().startswith(title):
+                return index
+        raise KeyError(title)
+
+    def expand_all(self, model):
+        row = 0
+        while row < model.rowCount():
+            index = model.index(row)
+            if model.is_header(index):
+                model.set_expanded(index, True)
+            row += 1
+
+    def test_time_grouping(self):
+        self.source.extend([action("/a/today", self.now),
+                            action("/a/week", self.now - 2 * DAY),
+                            action("/a/old", self.now - 30 * DAY),
+                            action("/b/today", self.now)])
+        model = SectionedRecentsModel(self.source, TimeGrouping())
+        # the older actions are collapsed by default
+        self.assertEqual(self.rows(model), [
+            "Today (2)", "/a/today", "/b/today", "This week (1)", "/a/week",
+            "Older (1)"])
+        header = self.header(model, "Older")
+        self.assertTrue(header.data(model.HeaderRole))
+        self.assertFalse(header.data(model.ExpandedRole))
+        self.assertEqual(model.source_row(header), -1)
+        self.assertEqual(model.flags(header), QtCore.Qt.ItemIsEnabled)
+
+    def test_directory_grouping(self):
+        self.source.extend([action("/b/f0"), action("/a/f1"),
+                            ("no directory", None, None), action("/b/f2")])
+        model = SectionedRecentsModel(self.source, DirectoryGrouping())
+        self.assertEqual(self.rows(model), ["Other (1)", "/a (1)", "/b (2)"])
+        self.expand_all(model)
+        self.assertEqual(self.rows(model), [
+            "Other (1)", "no directory", "/a (1)", "/a/f1", "/b (2)",
+            "/b/f0", "/b/f2"])
+
+    def test_expand_collapse(self):
+        self.source.extend([action("/a/new", self.now),
+                            action("/a/old0", self.now - 30 * DAY),
+                            action("/a/old1", self.now - 40 * DAY)])
+        model = SectionedRecentsModel(self.source)
+        model.toggle(self.header(model, "Older"))
+        self.assertEqual(self.rows(model), [
+            "Today (1)", "/a/new", "Older (2)", "/a/old0", "/a/old1"])
+        model.toggle(self.header(model, "Today"))
+        self.assertEqual(self.rows(model), [
+            "Today (1)", "Older (2)", "/a/old0", "/a/old1"])
+        # the expansion states are kept when the rows are regrouped
+        model.regroup()
+        self.assertEqual(self.rows(model), [
+            "Today (1)", "Older (2)", "/a/old0", "/a/old1"])
+
+    def test_pinned(self):
+        self.source.extend([action("/a/f0", self.now),
+                            action("/a/f1", self.now - 30 * DAY)])
+        model = SectionedRecentsModel(self.source, pinned={"/a/f1"})
+        self.assertEqual(self.rows(model), [
+            "Pinned (1)", "/a/f1", "Today (1)", "/a/f0"])
+        model.set_pinned("/a/f0", True)
+        self.assertEqual(self.rows(model), [
+            "Pinned (2)", "/a/f0", "/a/f1"])
+        model.set_pinned("/a/f1", False)
+        self.assertEqual(self.rows(model), [
+            "Pinned (1)", "/a/f0", "Older (1)"])
+        self.assertEqual(model.pinned, {"/a/f0"})
+
+    def test_data_changed_moves_to_section(self):
+        self.source.extend([action("/a/f0", self.now),
+                            action("/a/f1", self.now - 30 * DAY)])
+        model = SectionedRecentsModel(self.source)
+        self.source.update(1, timestamp=self.now)
+        self.assertEqual(self.rows(model), [
+            "Today (2)", "/a/f0", "/a/f1"])
+
+    def test_persistent_indexes(self):
+        self.source.extend([action("/a/f%d" % i, self.now - i * DAY)
+                            for i in range(4)])
+        model = SectionedRecentsModel(self.source)
+        current = QtCore.QPersistentModelIndex(model.index(3))
+        header = QtCore.QPersistentModelIndex(
+            self.header(model, "This week"))
+        self.assertEqual(self.source.key(model.source_row(model.index(3))),
+                         "/a/f1")
+        self.source.insert(0, [action("/a/new", self.now)])
+        self.source.move_row(3, 0)
+        self.source.remove_row(self.source.row("/a/f2"))
+        self.assertEqual(
+            self.source.key(model.source_row(model.index(current.row()))),
+            "/a/f1")
+        self.assertEqual(model.index(header.row()).data(), "This week (2)")
+        # the action of a collapsed section falls back to its header
+        self.source.update(self.source.row("/a/f1"),
+                           timestamp=self.now - 30 * DAY)
+        self.assertEqual(model.index(current.row()).data(), "Older (1)")
+        # the removed actions are not presented anymore
+        self.source.remove_row(self.source.row("/a/f1"))
+        self.assertFalse(current.isValid())
+
+    def test_source_changes(self):
+        rng = random.Random(0)
+        ages = [0, 2 * DAY, 30 * DAY]
+        model = SectionedRecentsModel(self.source)
+        pinned = model.pinned
+        count = 0
+        for i in range(300):
+            operation = rng.randrange(5)
+            rows = self.source.rowCount()
+            if operation == 0 or not rows:
+                actions = []
+                for j in range(rng.randint(1, 3)):
+                    actions.append(action("/%s/f%d" % (rng.choice("ab"),
+                                                      count),
+                                          self.now - rng.choice(ages)))
+                    count += 1
+                self.source.insert(rng.randint(0, rows), actions)
+            elif operation == 1:
+                self.source.remove_row(rng.randrange(rows))
+            elif operation == 2:
+                self.source.move_row(rng.randrange(rows), rng.randrange(rows))
+            elif operation == 3:
+                self.source.update(rng.randrange(rows),
+                                   timestamp=self.now - rng.choice(ages))
+            else:
+                key = self.source.key(rng.randrange(rows))
+                model.set_pinned(key, key not in pinned)
+            self.expand_all(model)
+            reference = SectionedRecentsModel(self.source, pinned=pinned)
+            self.expand_all(reference)
+            self.assertEqual(self.rows(model), self.rows(reference))
+            reference.deleteLater()
+
+
+if __name__ == "__main__":
+    unittest.main()
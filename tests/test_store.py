@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# QWelcomeWindow - An easy to customize welcome window
+
+# Copyright 2013, Colin Duquesnoy <colin.duquesnoy@gmail.com>
+#
+# This software is released under the LGPLv3 license.
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Tests the recent files log (RecentFilesStore).
+"""
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from qwelcomewindow.store import RecentFilesStore
+
+
+class RecentFilesStoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "sub", "recents")
+
+    def store(self, max_entries=100):
+        return RecentFilesStore(self.path, max_entries)
+
+    def test_round_trip(self):
+        paths = [u"/a/plain.txt", u"/a/with space", u"/a/tab\there",
+                 u"/a/caf\xe9", u"/a/form\x0cfeed", u"/a/vertical\x0btab",
+                 u"/a/sep\x1c\x1d\x1e", u"/a/next\x85line",
+                 u"/a/line\u2028para\u2029graph"]
+        store = self.store()
+        for i, path in enumerate(paths):
+            store.add(path, 1000.0 + i)
+        self.assertEqual(self.store().paths(), list(reversed(paths)))
+        self.assertEqual(list(self.store().entries.items()),
+                         [(path, 1000.0 + i) for i, path in enumerate(paths)])
+
+    def test_invalid_path(self):
+        store = self.store()
+        for path in (u"/a\nb", u"/a\rb"):
+            self.assertRaises(ValueError, store.add, path)
+        self.assertEqual(store.paths(), [])
+
+    def test_reopen_moves_to_front(self):
+        store = self.store()
+        store.add("/a", 1.0)
+        store.add("/b", 2.0)
+        store.add("/a", 3.0)
+        self.assertEqual(self.store().paths(), ["/a", "/b"])
+        self.assertEqual(self.store().entries["/a"], 3.0)
+
+    def test_remove(self):
+        store = self.store()
+        store.add("/a", 1.0)
+        store.add("/b", 2.0)
+        store.remove("/a")
+        store.remove("/unknown")
+        self.assertEqual(store.paths(), ["/b"])
+        self.assertEqual(self.store().paths(), ["/b"])
+
+    def test_cap_per_record(self):
+        store = self.store(max_entries=2)
+        for i, path in enumerate("abcd"):
+            store.add(path, float(i))
+        store.remove("d")
+        self.assertEqual(store.paths(), ["c"])
+        # the cap is applied after each replayed record, as when the records
+        # were written: "b" was evicted by "d" and is not restored
+        self.assertEqual(self.store(max_entries=2).paths(), ["c"])
+
+    def test_compaction(self):
+        store = self.store(max_entries=3)
+        for i in range(20):
+            store.add("/f%d" % (i % 5), float(i))
+        with io.open(self.path, encoding="utf-8") as f:
+            records = f.read().split(u"\n")[:-1]
+        self.assertLessEqual(len(records),
+                             3 * RecentFilesStore.COMPACTION_FACTOR)
+        self.assertEqual(self.store(max_entries=3).paths(),
+                         ["/f4", "/f3", "/f2"])
+        store.clear()
+        self.assertEqual(self.store().paths(), [])
+
+    def test_corrupted_records(self):
+        os.makedirs(os.path.dirname(self.path))
+        with io.open(self.path, "w", encoding="utf-8") as f:
+            f.write(u"+1.0\t/a\ngarbage\n+x\t/b\n-\t/missing\n+2.0\t/c\n"
+                    u"+3.0\t/partial")
+        store = self.store()
+        self.assertEqual(store.refresh()[0], [("/a", 1.0), ("/c", 2.0)])
+        self.assertEqual(store.paths(), ["/c", "/a"])
+        # the partial record is read once it is complete
+        with io.open(self.path, "a", encoding="utf-8") as f:
+            f.write(u"\n")
+        self.assertEqual(store.refresh()[0], [("/partial", 3.0)])
+
+    def test_refresh(self):
+        first = self.store()
+        second = self.store()
+        self.assertEqual(second.refresh(), ([], []))
+        first.add("/a", 1.0)
+        first.add("/b", 2.0)
+        self.assertEqual(second.refresh(), ([("/a", 1.0), ("/b", 2.0)], []))
+        first.remove("/a")
+        first.add("/b", 3.0)
+        self.assertEqual(second.refresh(), ([("/b", 3.0)], ["/a"]))
+        self.assertEqual(second.refresh(), ([], []))
+
+    def test_refresh_after_compaction(self):
+        first = self.store()
+        second = self.store()
+        first.add("/a", 1.0)
+        second.refresh()
+        first.add("/b", 2.0)
+        first.compact()
+        self.assertEqual(second.refresh(), ([("/b", 2.0)], []))
+        self.assertEqual(second.paths(), ["/b", "/a"])
+
+
+if __name__ == "__main__":
+    unittest.main()